@@ -1,3 +1,5 @@
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from rest_framework.decorators import action
@@ -62,6 +64,24 @@ class JobViewSet(ReadOnlyModelViewSet):
     serializer_class = serializers.JobSerializer
     filterset_class = filtersets.JobFilterSet
 
+    @action(detail=True)
+    def download(self, request, pk):
+        """
+        Download the file produced by a job (e.g. a background export or config rendering). The file may be downloaded
+        only by the user who enqueued the job, or by a superuser.
+        """
+        job = get_object_or_404(Job, pk=pk)
+        if job.user != request.user and not request.user.is_superuser:
+            raise Http404
+        if not job.export_file:
+            raise Http404(_("This job has not produced a file."))
+
+        return FileResponse(
+            default_storage.open(job.export_file),
+            as_attachment=True,
+            filename=job.data.get('filename')
+        )
+
 
 class ObjectChangeViewSet(ReadOnlyModelViewSet):
     """
@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+
+from netbox.context import changelog_queue
+
+__all__ = (
+    'ChangelogQueue',
+    'batch_changelog',
+    'flush_changelog',
+    'queue_objectchange',
+)
+
+# Number of ObjectChange records to insert per query
+BATCH_SIZE = 500
+
+# Number of queued ObjectChange records at which the queue is flushed automatically
+MAX_QUEUE_SIZE = 2000
+
+
+class ChangelogGroup:
+    """
+    A group of queued ObjectChange records which share the fate of the same database transaction (or savepoint).
+    Records are written only if their transaction has been committed or is still in progress.
+    """
+    def __init__(self, savepoint_ids, committed=False):
+        self.savepoint_ids = savepoint_ids
+        self.committed = committed
+        self.changes = []
+
+    def on_commit(self):
+        self.committed = True
+
+    def is_valid(self, connection):
+        """
+        Return True if the group's transaction has been committed, or has not (yet) been rolled back.
+        """
+        return self.committed or any(func == self.on_commit for _, func, _ in reversed(connection.run_on_commit))
+
+
+class ChangelogQueue:
+    """
+    Hold ObjectChange records in memory to be written in bulk. Changes to the many-to-many relationships of an object
+    are merged into its most recent queued record.
+    """
+    def __init__(self):
+        self.groups = []
+        self.latest = {}
+        self.count = 0
+
+    def _get_group(self):
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            savepoint_ids = None
+        else:
+            savepoint_ids = tuple(connection.savepoint_ids)
+
+        # Start a new group if the transaction state has changed since the previous record was queued
+        group = self.groups[-1] if self.groups else None
+        if group is None or group.savepoint_ids != savepoint_ids or (
+            savepoint_ids is not None and (group.committed or not group.is_valid(connection))
+        ):
+            group = ChangelogGroup(savepoint_ids, committed=savepoint_ids is None)
+            if savepoint_ids is not None:
+                transaction.on_commit(group.on_commit)
+            self.groups.append(group)
+
+        return group
+
+    def add(self, objectchange):
+        objectchange.record_static_values()
+        self._get_group().changes.append(objectchange)
+        self.latest[(objectchange.changed_object_type_id, objectchange.changed_object_id)] = objectchange
+        self.count += 1
+        if self.count >= MAX_QUEUE_SIZE:
+            self.flush()
+
+    def get_latest(self, object_type, object_id):
+        """
+        Return the most recent queued ObjectChange for the specified object, if any.
+        """
+        return self.latest.get((object_type.pk, object_id))
+
+    def flush(self):
+        """
+        Write all queued ObjectChange records belonging to transactions which have not been rolled back.
+        """
+        from core.models import ObjectChange
+
+        connection = transaction.get_connection()
+        changes = [
+            objectchange for group in self.groups if group.is_valid(connection) for objectchange in group.changes
+        ]
+        self.groups = []
+        self.latest = {}
+        self.count = 0
+        ObjectChange.objects.bulk_create(changes, batch_size=BATCH_SIZE)
+
+
+def queue_objectchange(objectchange):
+    """
+    Queue an ObjectChange record to be written in bulk. Returns False if no changelog batching context is active, in
+    which case the record should be saved immediately.
+    """
+    queue = changelog_queue.get()
+    if queue is None:
+        return False
+    queue.add(objectchange)
+    return True
+
+
+def flush_changelog():
+    """
+    Write any queued ObjectChange records immediately, rather than waiting for the batch_changelog() context to exit.
+    """
+    if queue := changelog_queue.get():
+        queue.flush()
+
+
+@contextmanager
+def batch_changelog():
+    """
+    Queue ObjectChange records in memory until the context is exited, and then write them in bulk. Records created
+    within a savepoint which is subsequently rolled back are discarded. Nested contexts are merged into the outermost
+    one.
+
+    The context must be entered within an atomic block, so that the queued records are written before the transaction
+    is committed together with the changes they describe; if no atomic block is active, records are saved immediately.
+    Queued records are discarded if the context is exited by an exception, which will roll back the transaction.
+    """
+    if changelog_queue.get() is not None or not transaction.get_connection().in_atomic_block:
+        yield
+        return
+
+    token = changelog_queue.set(ChangelogQueue())
+    try:
+        yield
+    except BaseException:
+        changelog_queue.reset(token)
+        raise
+    queue = changelog_queue.get()
+    changelog_queue.reset(token)
+    queue.flush()
@@ -1,7 +1,12 @@
+import fcntl
+import hashlib
 import logging
 import os
 import re
+import shutil
+import stat
 import tempfile
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
@@ -22,6 +27,9 @@ __all__ = (
 
 logger = logging.getLogger('netbox.data_backends')
 
+# Local clones of git repositories which have not been used for this many days are removed
+GIT_CLONE_MAX_AGE = 30
+
 
 @register_data_backend()
 class LocalBackend(DataBackend):
@@ -75,12 +83,66 @@ class GitBackend(DataBackend):
 
         return config
 
-    @contextmanager
-    def fetch(self):
+    @property
+    def _local_path(self):
+        """
+        The path at which the repository is replicated locally. A separate clone is maintained for each combination of
+        URL and branch.
+        """
+        key = hashlib.sha256(f"{self.url}#{self.params.get('branch') or ''}".encode()).hexdigest()
+        return os.path.join(settings.GIT_CLONE_ROOT, key)
+
+    @staticmethod
+    def _init_clone_root():
+        """
+        Create the directory in which local clones are retained (if necessary), and ensure that it is accessible only
+        by the current user. Local clones may contain data from private repositories.
+        """
+        root = settings.GIT_CLONE_ROOT
+        Path(root).mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(root)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+            raise SyncError(
+                _("The git clone directory ({path}) is not a directory owned by the current user.").format(path=root)
+            )
+        if stat.S_IMODE(st.st_mode) != 0o700:
+            os.chmod(root, 0o700)
+
+    @staticmethod
+    def _prune_clones():
+        """
+        Remove any local clones which have not been used within GIT_CLONE_MAX_AGE days. (The modification time of a
+        clone's lock file is updated each time the clone is used.) Clones which are currently in use are skipped.
+        """
+        cutoff = time.time() - GIT_CLONE_MAX_AGE * 86400
+        for lock_path in Path(settings.GIT_CLONE_ROOT).glob('*.lock'):
+            local_path = lock_path.with_suffix('')
+            try:
+                if lock_path.stat().st_mtime >= cutoff or not local_path.is_dir():
+                    continue
+                with open(lock_path, 'a') as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    logger.debug(f"Removing unused local clone {local_path}")
+                    shutil.rmtree(local_path)
+            except OSError:
+                continue
+
+    def _get_client(self):
+        from dulwich.client import get_transport_and_path
+
+        client_args = {}
+        if self.url_scheme in ('http', 'https') and self.params.get('username'):
+            client_args.update(
+                {
+                    "username": self.params.get('username'),
+                    "password": self.params.get('password'),
+                }
+            )
+        return get_transport_and_path(self.url, config=self.config, **client_args)
+
+    def _clone(self, local_path):
         from dulwich import porcelain
 
-        local_path = tempfile.TemporaryDirectory()
-
         clone_args = {
             "branch": self.params.get('branch'),
             "config": self.config,
@@ -100,14 +162,103 @@ class GitBackend(DataBackend):
             clone_args["depth"] = 1
 
         logger.debug(f"Cloning git repo: {self.url}")
-        try:
-            porcelain.clone(self.url, local_path.name, **clone_args)
-        except BaseException as e:
-            raise SyncError(_("Fetching remote data failed ({name}): {error}").format(name=type(e).__name__, error=e))
+        porcelain.clone(self.url, local_path, **clone_args)
+
+    def _update(self, local_path):
+        """
+        Fetch the latest commit into an existing clone, and update only those files in the working tree which differ
+        between the previous and latest commits. (Unchanged files retain their modification times, allowing them to be
+        skipped when syncing.)
+        """
+        from dulwich.diff_tree import tree_changes
+        from dulwich.objects import S_ISGITLINK
+        from dulwich.repo import Repo
+
+        repo = Repo(local_path)
+        if branch := self.params.get('branch'):
+            ref = f'refs/heads/{branch}'.encode()
+        else:
+            ref = b'HEAD'
+
+        def determine_wants(refs, depth=None):
+            if refs[ref] in repo.object_store:
+                return []
+            return [refs[ref]]
+
+        logger.debug(f"Fetching git repo: {self.url}")
+        client, path = self._get_client()
+        result = client.fetch(path, repo, determine_wants=determine_wants, depth=1 if self.url_scheme else None)
+        old_commit, new_commit = repo.head(), result.refs[ref]
+        if old_commit == new_commit:
+            return
+
+        changes = list(tree_changes(repo.object_store, repo[old_commit].tree, repo[new_commit].tree))
+        logger.debug(f"Updating {len(changes)} changed files to commit {new_commit.decode()}")
+
+        # Depending on the version of dulwich, the missing side of an addition or deletion is either None or an empty
+        # TreeEntry. Normalize both to None.
+        changes = [
+            tuple(entry if entry and entry.path else None for entry in (change.old, change.new))
+            for change in changes
+        ]
+
+        # Remove deleted files before writing new ones, in case a file has been replaced by a directory
+        for old, new in changes:
+            if old and (not new or old.path != new.path):
+                file_path = os.path.join(local_path, os.fsdecode(old.path))
+                if os.path.lexists(file_path) and not os.path.isdir(file_path):
+                    os.remove(file_path)
+                    # Remove any directories left empty
+                    try:
+                        os.removedirs(os.path.dirname(file_path))
+                    except OSError:
+                        pass
+        for old, new in changes:
+            if not new or S_ISGITLINK(new.mode):
+                continue
+            file_path = os.path.join(local_path, os.fsdecode(new.path))
+            Path(os.path.dirname(file_path)).mkdir(parents=True, exist_ok=True)
+            if os.path.lexists(file_path):
+                os.remove(file_path)
+            content = repo[new.sha].as_raw_string()
+            if stat.S_ISLNK(new.mode):
+                os.symlink(os.fsdecode(content), file_path)
+            else:
+                with open(file_path, 'wb') as f:
+                    f.write(content)
+                os.chmod(file_path, 0o755 if new.mode & stat.S_IXUSR else 0o644)
+
+        repo.refs[b'HEAD'] = new_commit
 
-        yield local_path.name
+    @contextmanager
+    def fetch(self):
+        local_path = self._local_path
+        self._init_clone_root()
+        self._prune_clones()
+
+        # Hold an exclusive lock on the local clone for as long as it is in use. (Opening the lock file for writing
+        # updates its modification time, which records when the clone was last used.)
+        with open(f'{local_path}.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+                if os.path.isdir(local_path):
+                    try:
+                        self._update(local_path)
+                    except Exception as e:
+                        # Discard the existing clone and start over
+                        logger.warning(f"Updating local clone of {self.url} failed ({e}); re-cloning")
+                        shutil.rmtree(local_path)
+                        self._clone(local_path)
+                else:
+                    self._clone(local_path)
+            except BaseException as e:
+                shutil.rmtree(local_path, ignore_errors=True)
+                raise SyncError(
+                    _("Fetching remote data failed ({name}): {error}").format(name=type(e).__name__, error=e)
+                )
 
-        local_path.cleanup()
+            yield local_path
 
 
 @register_data_backend()
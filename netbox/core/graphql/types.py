@@ -16,7 +16,7 @@ __all__ = (
 
 @strawberry_django.type(
     models.DataFile,
-    exclude=['data',],
+    exclude=['data', 'mtime'],
     filters=DataFileFilter
 )
 class DataFileType(BaseObjectType):
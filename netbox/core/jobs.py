@@ -1,7 +1,15 @@
 import logging
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils.module_loading import import_string
 
 from netbox.jobs import JobRunner
 from netbox.search.backends import search_backend
+from utilities.export import (
+    CHUNK_SIZE, get_excluded_columns, iter_buffered, iter_csv, iter_table_rows, iter_yaml,
+)
 from .choices import DataSourceStatusChoices
 from .exceptions import SyncError
 from .models import DataSource
@@ -31,3 +39,63 @@ class SyncDataSourceJob(JobRunner):
             if type(e) is SyncError:
                 logging.error(e)
             raise e
+
+
+class ExportObjectsJob(JobRunner):
+    """
+    Export a large number of objects as CSV (from a table) or as YAML, and save the output to file storage so that it
+    can be downloaded once the job has completed.
+    """
+
+    class Meta:
+        name = 'Export'
+
+    @staticmethod
+    def iter_objects(queryset, pks):
+        """
+        Yield the objects with the given primary keys in order, retrieving them in chunks.
+        """
+        for i in range(0, len(pks), CHUNK_SIZE):
+            chunk = pks[i:i + CHUNK_SIZE]
+            objects = queryset.in_bulk(chunk)
+            for pk in chunk:
+                # Skip any objects which have been deleted since the job was enqueued
+                if pk in objects:
+                    yield objects[pk]
+
+    def run(self, view, pks, export_format, filename, table=None, columns=None, **kwargs):
+        """
+        Export objects.
+
+        Args:
+            view: The dotted path to the ObjectListView from which the export was requested. Its queryset (including
+                any annotations and prefetches) is used to retrieve the objects, restricted to those which the job's
+                user is permitted to view.
+            pks: An ordered list of primary keys identifying the objects to export
+            export_format: The export format ("csv" or "yaml")
+            filename: The name of the file to be saved
+            table: The dotted path to the Table class used for CSV export
+            columns: A list of specific table columns to include in a CSV export
+        """
+        queryset = import_string(view).queryset.restrict(self.job.user, 'view')
+        if export_format == 'yaml':
+            output = iter_yaml(self.iter_objects(queryset, pks))
+        else:
+            table = import_string(table)(queryset, user=self.job.user)
+            output = iter_csv(iter_table_rows(
+                table,
+                exclude_columns=get_excluded_columns(table, columns),
+                objects=self.iter_objects(table.data.data, pks)
+            ))
+
+        with tempfile.TemporaryFile() as fileobj:
+            for data in iter_buffered(output):
+                fileobj.write(data.encode())
+            fileobj.seek(0)
+            path = default_storage.save(f'exports/{self.job.job_id}/{filename}', File(fileobj))
+
+        self.job.data = {
+            'export_file': path,
+            'filename': filename,
+            'count': len(pks),
+        }
@@ -0,0 +1,87 @@
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from unittest.mock import patch
+
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core.models import ObjectChange
+from dcim.views import SiteBulkImportView
+from netbox.context_managers import event_tracking
+from users.models import User
+
+
+@contextmanager
+def unbuffered_changelog():
+    """
+    Disable the batching of change records by the bulk import view, saving each ObjectChange record individually as it
+    is created.
+    """
+    with patch('netbox.views.generic.bulk_views.batch_changelog', nullcontext):
+        yield
+
+
+class Command(BaseCommand):
+    help = "Measure the throughput of the bulk import view, with and without the buffering of change records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, dest='count', default=1000,
+            help="Number of (synthetic) sites to import (default: 1000)"
+        )
+
+    @staticmethod
+    def get_request(user, data):
+        request = RequestFactory().post(reverse('dcim:site_bulk_import'), {
+            'data': data,
+            'format': 'csv',
+            'csv_delimiter': ',',
+        })
+        request.id = uuid.uuid4()
+        request.user = user
+        request._messages = CookieStorage(request)
+        return request
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("The number of sites must be a positive integer.")
+        if (user := User.objects.filter(is_superuser=True).first()) is None:
+            raise CommandError("A superuser account is required to perform the import.")
+
+        prefix = uuid.uuid4().hex[:8]
+        data = '\n'.join([
+            'name,slug,status',
+            *[f'Site {prefix}-{i},site-{prefix}-{i},active' for i in range(1, options['count'] + 1)],
+        ])
+        self.stdout.write(f"Importing {options['count']} sites...")
+
+        results = {}
+        for label, buffering in (('unbuffered', unbuffered_changelog), ('buffered', nullcontext)):
+            request = self.get_request(user, data)
+
+            # Roll back all imported objects and change records once the import has completed
+            with transaction.atomic():
+                start_time = time.perf_counter()
+                with buffering(), event_tracking(request):
+                    response = SiteBulkImportView.as_view()(request)
+                elapsed = time.perf_counter() - start_time
+                changes = ObjectChange.objects.filter(request_id=request.id).count()
+                transaction.set_rollback(True)
+
+            if response.status_code != 302:
+                raise CommandError("Bulk import failed")
+            if changes != options['count']:
+                raise CommandError(f"Expected {options['count']} change records; found {changes}")
+
+            results[label] = elapsed
+            self.stdout.write(
+                f'  {label}: {elapsed:.2f}s ({options["count"] / (elapsed or 1):.0f} objects/sec)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['unbuffered'] / (results['buffered'] or 1):.1f}x"
+        ))
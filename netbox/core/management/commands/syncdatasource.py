@@ -13,6 +13,10 @@ class Command(BaseCommand):
             "--all", action='store_true', dest='sync_all',
             help="Synchronize all data sources"
         )
+        parser.add_argument(
+            "--full", action='store_true', dest='full',
+            help="Verify the contents of all files, including those which appear to be unmodified"
+        )
 
     def handle(self, *args, **options):
 
@@ -35,7 +39,7 @@ class Command(BaseCommand):
             self.stdout.write(f"[{i}] Syncing {datasource}... ", ending='')
             self.stdout.flush()
             try:
-                datasource.sync()
+                datasource.sync(incremental=not options['full'])
                 self.stdout.write(datasource.get_status_display())
                 self.stdout.flush()
             except Exception as e:
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_job_object_type_optional'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datafile',
+            name='mtime',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
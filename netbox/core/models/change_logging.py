@@ -5,6 +5,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from mptt.models import MPTTModel
 
@@ -27,7 +28,7 @@ class ObjectChange(models.Model):
     """
     time = models.DateTimeField(
         verbose_name=_('time'),
-        auto_now_add=True,
+        default=timezone.now,
         editable=False,
         db_index=True
     )
@@ -126,15 +127,19 @@ class ObjectChange(models.Model):
             )
 
     def save(self, *args, **kwargs):
+        self.record_static_values()
 
-        # Record the user's name and the object's representation as static strings
+        return super().save(*args, **kwargs)
+
+    def record_static_values(self):
+        """
+        Record the user's name and the object's representation as static strings.
+        """
         if not self.user_name:
             self.user_name = self.user.username
         if not self.object_repr:
             self.object_repr = str(self.changed_object)
 
-        return super().save(*args, **kwargs)
-
     def get_absolute_url(self):
         return reverse('core:objectchange', args=[self.pk])
 
@@ -30,6 +30,9 @@ __all__ = (
 
 logger = logging.getLogger('netbox.core.data')
 
+# Size of the chunks in which files are read when synchronizing DataFiles
+FILE_CHUNK_SIZE = 1024 * 1024
+
 
 class DataSource(JobsMixin, PrimaryModel):
     """
@@ -154,9 +157,13 @@ class DataSource(JobsMixin, PrimaryModel):
         backend_params = self.parameters or {}
         return self.backend_class(self.source_url, **backend_params)
 
-    def sync(self):
+    def sync(self, incremental=True):
         """
         Create/update/delete child DataFiles as necessary to synchronize with the remote source.
+
+        Args:
+            incremental: If True, skip reading any file whose size and modification time are unchanged since the
+                previous sync. Set to False to verify the contents of every file.
         """
         from core.signals import post_sync, pre_sync
 
@@ -179,25 +186,35 @@ class DataSource(JobsMixin, PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
+            # File data is retrieved only for files which have been modified
+            data_files = self.datafiles.defer('data')
             known_paths = {df.path for df in data_files}
             logger.debug(f'Starting with {len(known_paths)} known files')
 
             # Check for any updated/deleted files
             updated_files = []
+            touched_files = []
             deleted_file_ids = []
             for datafile in data_files:
+                file_hash = datafile.hash
 
                 try:
-                    if datafile.refresh_from_disk(source_root=local_path):
-                        updated_files.append(datafile)
+                    if datafile.refresh_from_disk(source_root=local_path, incremental=incremental):
+                        if datafile.hash != file_hash:
+                            updated_files.append(datafile)
+                        else:
+                            # Only the file's modification time has changed
+                            touched_files.append(datafile)
                 except FileNotFoundError:
                     # File no longer exists
                     deleted_file_ids.append(datafile.pk)
                     continue
 
             # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
+            updated_count = DataFile.objects.bulk_update(
+                updated_files, ('last_updated', 'size', 'hash', 'mtime', 'data'), batch_size=100
+            )
+            DataFile.objects.bulk_update(touched_files, ('mtime',), batch_size=1000)
             logger.debug(f"Updated {updated_count} files")
 
             # Bulk delete deleted files
@@ -295,6 +312,13 @@ class DataFile(models.Model):
         ],
         help_text=_('SHA256 hash of the file data')
     )
+    mtime = models.PositiveBigIntegerField(
+        verbose_name=_('modification time'),
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_('Modification time of the file (in nanoseconds) when last synchronized')
+    )
     data = models.BinaryField()
 
     objects = RestrictedQuerySet.as_manager()
@@ -335,22 +359,38 @@ class DataFile(models.Model):
         # TODO: Something more robust
         return yaml.safe_load(self.data_as_string)
 
-    def refresh_from_disk(self, source_root):
+    def refresh_from_disk(self, source_root, incremental=False):
         """
         Update instance attributes from the file on disk. Returns True if any attribute
         has changed.
+
+        Args:
+            source_root: The local path to which the DataSource has been replicated
+            incremental: If True, assume the file is unmodified if its size and modification time match those recorded
         """
         file_path = os.path.join(source_root, self.path)
+        file_stat = os.stat(file_path)
+        if incremental and self.mtime == file_stat.st_mtime_ns and self.size == file_stat.st_size:
+            return False
+
+        # Read the file only once, hashing its content in chunks
+        file_hash = hashlib.sha256()
+        chunks = []
         with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+            while chunk := f.read(FILE_CHUNK_SIZE):
+                file_hash.update(chunk)
+                chunks.append(chunk)
+        file_hash = file_hash.hexdigest()
 
         # Update instance file attributes & data
-        if is_modified := file_hash != self.hash:
+        is_modified = self.mtime != file_stat.st_mtime_ns
+        self.mtime = file_stat.st_mtime_ns
+        if file_hash != self.hash:
+            is_modified = True
             self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
+            self.size = sum(len(chunk) for chunk in chunks)
             self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.data = b''.join(chunks)
 
         return is_modified
 
@@ -4,6 +4,7 @@ import django_rq
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
@@ -118,9 +119,10 @@ class Job(models.Model):
 
     def get_absolute_url(self):
         # TODO: Employ dynamic registration
-        if self.object_type.model == 'reportmodule':
+        model_name = self.object_type.model if self.object_type else None
+        if model_name == 'reportmodule':
             return reverse(f'extras:report_result', kwargs={'job_pk': self.pk})
-        if self.object_type.model == 'scriptmodule':
+        if model_name == 'scriptmodule':
             return reverse(f'extras:script_result', kwargs={'job_pk': self.pk})
         return reverse('core:job', args=[self.pk])
 
@@ -151,16 +153,29 @@ class Job(models.Model):
 
         return f"{int(minutes)} minutes, {seconds:.2f} seconds"
 
+    @property
+    def export_file(self):
+        """
+        Return the path of the file saved to storage by an export job, if any.
+        """
+        if isinstance(self.data, dict):
+            return self.data.get('export_file')
+
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
 
-        rq_queue_name = get_config().QUEUE_MAPPINGS.get(self.object_type.model, RQ_QUEUE_DEFAULT)
+        model_name = self.object_type.model if self.object_type else None
+        rq_queue_name = get_config().QUEUE_MAPPINGS.get(model_name, RQ_QUEUE_DEFAULT)
         queue = django_rq.get_queue(rq_queue_name)
         job = queue.fetch_job(str(self.job_id))
 
         if job:
             job.cancel()
 
+        # Delete any exported file
+        if self.export_file:
+            default_storage.delete(self.export_file)
+
     def start(self):
         """
         Record the job's start time and update its status to "running."
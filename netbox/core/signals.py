@@ -8,13 +8,14 @@ from django.dispatch import receiver, Signal
 from django.utils.translation import gettext_lazy as _
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 
+from core.changelog import queue_objectchange
 from core.choices import ObjectChangeActionChoices
 from core.events import *
 from core.models import ObjectChange
 from extras.events import enqueue_event
 from extras.utils import run_validators
 from netbox.config import get_config
-from netbox.context import current_request, events_queue
+from netbox.context import changelog_queue, current_request, events_queue
 from netbox.models.features import ChangeLoggingMixin
 from utilities.exceptions import AbortRequest
 from .models import ConfigRevision
@@ -43,6 +44,22 @@ clear_events = Signal()
 # Change logging & event handling
 #
 
+def get_previous_change(instance, request):
+    """
+    Return the most recent ObjectChange recorded for the given object by the current request, if any. Queued records
+    are checked before those which have already been written.
+    """
+    object_type = ContentType.objects.get_for_model(instance)
+    if queue := changelog_queue.get():
+        if objectchange := queue.get_latest(object_type, instance.pk):
+            return objectchange
+    return ObjectChange.objects.filter(
+        changed_object_type=object_type,
+        changed_object_id=instance.pk,
+        request_id=request.id
+    ).first()
+
+
 @receiver((post_save, m2m_changed))
 def handle_changed_object(sender, instance, **kwargs):
     """
@@ -79,19 +96,15 @@ def handle_changed_object(sender, instance, **kwargs):
     objectchange = instance.to_objectchange(action)
     # If this is a many-to-many field change, check for a previous ObjectChange instance recorded
     # for this object by this request and update it
-    if m2m_changed and (
-        prev_change := ObjectChange.objects.filter(
-            changed_object_type=ContentType.objects.get_for_model(instance),
-            changed_object_id=instance.pk,
-            request_id=request.id
-        ).first()
-    ):
+    if m2m_changed and (prev_change := get_previous_change(instance, request)):
         prev_change.postchange_data = objectchange.postchange_data
-        prev_change.save()
+        if prev_change.pk:
+            prev_change.save()
     elif objectchange and objectchange.has_changes:
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if not queue_objectchange(objectchange):
+            objectchange.save()
 
     # Ensure that we're working with fresh M2M assignments
     if m2m_changed:
@@ -138,7 +151,8 @@ def handle_deleted_object(sender, instance, **kwargs):
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if not queue_objectchange(objectchange):
+            objectchange.save()
 
     # Django does not automatically send an m2m_changed signal for the reverse direction of a
     # many-to-many relationship (see https://code.djangoproject.com/ticket/17688), so we need to
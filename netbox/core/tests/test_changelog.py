@@ -1,14 +1,21 @@
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
-from django.test import override_settings
+from django.db import transaction
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 
+from core.changelog import batch_changelog, flush_changelog
 from core.choices import ObjectChangeActionChoices
 from core.models import ObjectChange, ObjectType
 from dcim.choices import SiteStatusChoices
 from dcim.models import Site
 from extras.choices import *
 from extras.models import CustomField, CustomFieldChoiceSet, Tag
+from netbox.context_managers import event_tracking
+from users.models import User
+from utilities.exceptions import AbortTransaction
 from utilities.testing import APITestCase
 from utilities.testing.utils import create_tags, post_data
 from utilities.testing.views import ModelViewTestCase
@@ -542,3 +549,76 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(objectchange.prechange_data['name'], 'Site 1')
         self.assertEqual(objectchange.prechange_data['slug'], 'site-1')
         self.assertEqual(objectchange.postchange_data, None)
+
+
+class ChangeLogQueueTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser')
+        create_tags('Alpha', 'Bravo')
+
+    def get_request(self):
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        return request
+
+    def test_changes_written_in_bulk(self):
+        with event_tracking(self.get_request()):
+            with transaction.atomic(), batch_changelog():
+                site = Site.objects.create(name='Site 1', slug='site-1')
+                site.tags.set(Tag.objects.all())
+
+                # Changes are queued until the context is exited
+                self.assertEqual(ObjectChange.objects.count(), 0)
+
+            # Changes are written before the transaction is committed
+            self.assertEqual(ObjectChange.objects.count(), 1)
+
+        # The M2M change has been merged into the original record
+        objectchange = ObjectChange.objects.get()
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(objectchange.object_repr, 'Site 1')
+        self.assertEqual(objectchange.user_name, 'testuser')
+        self.assertEqual(objectchange.postchange_data['tags'], ['Alpha', 'Bravo'])
+
+    def test_rolled_back_changes_discarded(self):
+        with event_tracking(self.get_request()):
+            with transaction.atomic(), batch_changelog():
+                try:
+                    with transaction.atomic():
+                        Site.objects.create(name='Site 1', slug='site-1')
+                        raise AbortTransaction()
+                except AbortTransaction:
+                    pass
+                Site.objects.create(name='Site 2', slug='site-2')
+
+            # Changes queued within a transaction which is rolled back are discarded
+            try:
+                with transaction.atomic(), batch_changelog():
+                    Site.objects.create(name='Site 3', slug='site-3')
+                    raise AbortTransaction()
+            except AbortTransaction:
+                pass
+
+        self.assertEqual(list(ObjectChange.objects.values_list('object_repr', flat=True)), ['Site 2'])
+
+    def test_changes_written_immediately(self):
+        with event_tracking(self.get_request()):
+            # Changes are not queued outside an atomic block
+            with batch_changelog():
+                Site.objects.create(name='Site 1', slug='site-1')
+                self.assertEqual(ObjectChange.objects.count(), 1)
+
+            # Changes are not queued outside batch_changelog()
+            with transaction.atomic():
+                Site.objects.create(name='Site 2', slug='site-2')
+                self.assertEqual(ObjectChange.objects.count(), 2)
+
+    def test_flush_changelog(self):
+        with event_tracking(self.get_request()):
+            with transaction.atomic(), batch_changelog():
+                Site.objects.create(name='Site 1', slug='site-1')
+                flush_changelog()
+                self.assertEqual(ObjectChange.objects.count(), 1)
@@ -0,0 +1,131 @@
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+
+from core.data_backends import GIT_CLONE_MAX_AGE, GitBackend
+from core.exceptions import SyncError
+
+
+class GitBackendTestCase(SimpleTestCase):
+
+    def setUp(self):
+        from dulwich import porcelain
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.clone_root = os.path.join(self.tempdir.name, 'clones')
+        override = override_settings(GIT_CLONE_ROOT=self.clone_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        # Create a local repository to serve as the remote
+        self.repo_path = os.path.join(self.tempdir.name, 'repo')
+        self.repo = porcelain.init(self.repo_path)
+        self.addCleanup(self.repo.close)
+        self.write_file('unchanged.txt', 'unchanged')
+        self.write_file('modified.txt', 'original')
+        self.write_file('deleted.txt', 'deleted')
+        self.write_file('dir/renamed.txt', 'renamed')
+        os.symlink('modified.txt', os.path.join(self.repo_path, 'link'))
+        self.commit('Initial commit')
+
+        self.backend = GitBackend(self.repo_path)
+
+    def write_file(self, path, content):
+        file_path = Path(self.repo_path, path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+
+    def commit(self, message):
+        from dulwich import porcelain
+
+        porcelain.add(self.repo, paths=[
+            os.path.join(self.repo_path, path) for path in os.listdir(self.repo_path) if path != '.git'
+        ])
+        porcelain.commit(self.repo, message=message.encode(), author=b'Test <test@example.com>',
+                         committer=b'Test <test@example.com>')
+
+    def get_files(self, path):
+        """
+        Return a dictionary mapping the relative path of each file within a working tree to its content (or to the
+        target of a symlink).
+        """
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(path):
+            if '.git' in dirnames:
+                dirnames.remove('.git')
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                if os.path.islink(file_path):
+                    files[os.path.relpath(file_path, path)] = ('link', os.readlink(file_path))
+                else:
+                    files[os.path.relpath(file_path, path)] = Path(file_path).read_text()
+        return files
+
+    def test_update(self):
+        from dulwich import porcelain
+
+        local_path = self.backend._local_path
+        self.backend._init_clone_root()
+        self.backend._clone(local_path)
+        self.assertEqual(self.get_files(local_path), self.get_files(self.repo_path))
+        unchanged_path = os.path.join(local_path, 'unchanged.txt')
+        os.utime(unchanged_path, (0, 0))
+
+        # Add, modify, delete, and rename files, and retarget a symlink
+        self.write_file('added.txt', 'added')
+        self.write_file('modified.txt', 'modified')
+        porcelain.remove(self.repo, paths=[os.path.join(self.repo_path, 'deleted.txt')])
+        os.rename(os.path.join(self.repo_path, 'dir'), os.path.join(self.repo_path, 'moved'))
+        porcelain.remove(self.repo, paths=[os.path.join(self.repo_path, 'dir/renamed.txt')], cached=True)
+        os.remove(os.path.join(self.repo_path, 'link'))
+        os.symlink('added.txt', os.path.join(self.repo_path, 'link'))
+        os.symlink('moved/renamed.txt', os.path.join(self.repo_path, 'new_link'))
+        self.commit('Second commit')
+
+        self.backend._update(local_path)
+
+        self.assertEqual(self.get_files(local_path), {
+            'unchanged.txt': 'unchanged',
+            'modified.txt': 'modified',
+            'added.txt': 'added',
+            'moved/renamed.txt': 'renamed',
+            'link': ('link', 'added.txt'),
+            'new_link': ('link', 'moved/renamed.txt'),
+        })
+        self.assertEqual(self.get_files(local_path), self.get_files(self.repo_path))
+        self.assertFalse(os.path.exists(os.path.join(local_path, 'dir')))
+
+        # Unchanged files are not rewritten
+        self.assertEqual(os.stat(unchanged_path).st_mtime, 0)
+
+    def test_fetch(self):
+        with self.backend.fetch() as local_path:
+            self.assertEqual(self.get_files(local_path), self.get_files(self.repo_path))
+
+        # The clone directory is accessible only by the current user
+        self.assertEqual(stat.S_IMODE(os.stat(self.clone_root).st_mode), 0o700)
+
+    def test_fetch_clone_root_symlink(self):
+        os.symlink(self.tempdir.name, self.clone_root)
+
+        with self.assertRaises(SyncError):
+            with self.backend.fetch():
+                pass
+
+    def test_prune_clones(self):
+        with self.backend.fetch() as local_path:
+            pass
+
+        # Recently used clones are retained
+        GitBackend._prune_clones()
+        self.assertTrue(os.path.isdir(local_path))
+
+        expired = time.time() - (GIT_CLONE_MAX_AGE + 1) * 86400
+        os.utime(f'{local_path}.lock', (expired, expired))
+        GitBackend._prune_clones()
+        self.assertFalse(os.path.exists(local_path))
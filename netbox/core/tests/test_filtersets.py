@@ -77,7 +77,7 @@ class DataSourceTestCase(TestCase, ChangeLoggedFilterSetTests):
 class DataFileTestCase(TestCase, ChangeLoggedFilterSetTests):
     queryset = DataFile.objects.all()
     filterset = DataFileFilterSet
-    ignore_fields = ('data',)
+    ignore_fields = ('data', 'mtime')
 
     @classmethod
     def setUpTestData(cls):
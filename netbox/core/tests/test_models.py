@@ -1,6 +1,9 @@
+import os
+import tempfile
+
 from django.test import TestCase
 
-from core.models import DataSource
+from core.models import DataFile, DataSource
 from core.choices import ObjectChangeActionChoices
 from netbox.constants import CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
 
@@ -120,3 +123,63 @@ class DataSourceChangeLoggingTestCase(TestCase):
         self.assertEqual(objectchange.prechange_data['parameters']['password'], CENSOR_TOKEN)
         self.assertEqual(objectchange.postchange_data['parameters']['username'], 'username2')
         self.assertEqual(objectchange.postchange_data['parameters']['password'], CENSOR_TOKEN)
+
+
+class DataSourceSyncTestCase(TestCase):
+
+    def setUp(self):
+        self.source_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.source_dir.cleanup)
+        for name in ('file1.txt', 'file2.txt'):
+            self.write_file(name, name)
+        self.datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url=f'file://{self.source_dir.name}'
+        )
+
+    def write_file(self, name, content, mtime_ns=None):
+        file_path = os.path.join(self.source_dir.name, name)
+        with open(file_path, 'w') as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+    def get_data(self):
+        return {
+            datafile.path: datafile.data_as_string for datafile in DataFile.objects.filter(source=self.datasource)
+        }
+
+    def test_sync(self):
+        self.datasource.sync()
+        self.assertEqual(self.get_data(), {'file1.txt': 'file1.txt', 'file2.txt': 'file2.txt'})
+        datafile = DataFile.objects.get(source=self.datasource, path='file1.txt')
+        self.assertEqual(datafile.mtime, os.stat(os.path.join(self.source_dir.name, 'file1.txt')).st_mtime_ns)
+
+        # Create, modify, and delete files
+        self.write_file('file1.txt', 'file1 modified')
+        self.write_file('file3.txt', 'file3.txt')
+        os.remove(os.path.join(self.source_dir.name, 'file2.txt'))
+        self.datasource.sync()
+        self.assertEqual(self.get_data(), {'file1.txt': 'file1 modified', 'file3.txt': 'file3.txt'})
+
+    def test_incremental_sync(self):
+        self.datasource.sync()
+        datafile = DataFile.objects.get(source=self.datasource, path='file1.txt')
+
+        # A file with an unchanged size & modification time is not read during an incremental sync
+        self.write_file('file1.txt', 'FILE1.TXT', mtime_ns=datafile.mtime)
+        self.datasource.sync()
+        self.assertEqual(self.get_data()['file1.txt'], 'file1.txt')
+
+        # A full sync verifies the contents of every file
+        self.datasource.sync(incremental=False)
+        self.assertEqual(self.get_data()['file1.txt'], 'FILE1.TXT')
+
+        # A file whose modification time has changed is re-read, but is updated only if its content has changed
+        self.write_file('file2.txt', 'file2.txt', mtime_ns=datafile.mtime + 1_000_000_000)
+        last_updated = DataFile.objects.get(source=self.datasource, path='file2.txt').last_updated
+        self.datasource.sync()
+        datafile = DataFile.objects.get(source=self.datasource, path='file2.txt')
+        self.assertEqual(datafile.mtime, os.stat(os.path.join(self.source_dir.name, 'file2.txt')).st_mtime_ns)
+        self.assertEqual(datafile.last_updated, last_updated)
@@ -23,6 +23,7 @@ urlpatterns = (
     path('jobs/', views.JobListView.as_view(), name='job_list'),
     path('jobs/delete/', views.JobBulkDeleteView.as_view(), name='job_bulk_delete'),
     path('jobs/<int:pk>/', views.JobView.as_view(), name='job'),
+    path('jobs/<int:pk>/download/', views.JobDownloadView.as_view(), name='job_download'),
     path('jobs/<int:pk>/delete/', views.JobDeleteView.as_view(), name='job_delete'),
 
     # Change logging
@@ -6,8 +6,9 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.db import connection, ProgrammingError
-from django.http import HttpResponse, HttpResponseForbidden, Http404
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden, Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -33,9 +34,11 @@ from utilities.forms import ConfirmationForm
 from utilities.htmx import htmx_partial
 from utilities.json import ConfigJSONEncoder
 from utilities.query import count_related
-from utilities.views import ContentTypePermissionRequiredMixin, GetRelatedModelsMixin, register_model_view
+from utilities.views import (
+    ContentTypePermissionRequiredMixin, GetRelatedModelsMixin, GetReturnURLMixin, register_model_view,
+)
 from . import filtersets, forms, tables
-from .choices import DataSourceStatusChoices
+from .choices import DataSourceStatusChoices, JobStatusChoices
 from .jobs import SyncDataSourceJob
 from .models import *
 from .plugins import get_catalog_plugins, get_local_plugins
@@ -174,6 +177,29 @@ class JobView(generic.ObjectView):
     queryset = Job.objects.all()
 
 
+class JobDownloadView(GetReturnURLMixin, View):
+    """
+    Download the file produced by a job (e.g. a background export). The file may be downloaded only by the user who
+    enqueued the job, or by a superuser: it may contain objects which other users are not permitted to view.
+    """
+    def get(self, request, pk):
+        job = get_object_or_404(Job, pk=pk)
+        if not request.user.is_authenticated or (job.user != request.user and not request.user.is_superuser):
+            raise Http404
+
+        if not job.export_file:
+            if job.status in JobStatusChoices.TERMINAL_STATE_CHOICES:
+                raise Http404(_("This job has not produced a file."))
+            messages.info(request, _("The export has not yet completed. Please try again shortly."))
+            return redirect(self.get_return_url(request))
+
+        return FileResponse(
+            default_storage.open(job.export_file),
+            as_attachment=True,
+            filename=job.data.get('filename')
+        )
+
+
 class JobDeleteView(generic.ObjectDeleteView):
     queryset = Job.objects.all()
 
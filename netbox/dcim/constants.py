@@ -94,6 +94,13 @@ MODULAR_COMPONENT_MODELS = Q(
 
 CABLE_TRACE_SVG_DEFAULT_WIDTH = 400
 
+# Number of low-order bits holding the object ID within a packed CablePath node. The remaining high-order bits hold
+# the ContentType ID.
+PATH_NODE_OBJECT_ID_BITS = 48
+PATH_NODE_OBJECT_ID_MASK = (1 << PATH_NODE_OBJECT_ID_BITS) - 1
+# Packed nodes are stored as signed 64-bit integers, leaving 15 bits for the ContentType ID
+PATH_NODE_CT_ID_MAX = (1 << (63 - PATH_NODE_OBJECT_ID_BITS)) - 1
+
 # Cable endpoint types
 CABLE_TERMINATION_MODELS = Q(
     Q(app_label='circuits', model__in=(
@@ -4,10 +4,11 @@ from django.db import models
 from django.utils.translation import gettext as _
 from netaddr import AddrFormatError, EUI, eui64_unix_expanded, mac_unix_expanded
 
-from .lookups import PathContains
+from .lookups import PackedPathContains, PathContains
 
 __all__ = (
     'MACAddressField',
+    'PackedPathField',
     'PathField',
     'WWNField',
 )
@@ -81,11 +82,22 @@ class WWNField(models.Field):
 
 class PathField(ArrayField):
     """
-    An ArrayField which holds a set of objects, each identified by a (type, ID) tuple.
+    An ArrayField which holds a set of objects, each identified by a (type, ID) tuple. (Retained for historical
+    migrations; superseded by PackedPathField.)
     """
     def __init__(self, **kwargs):
         kwargs['base_field'] = models.CharField(max_length=40)
         super().__init__(**kwargs)
 
 
+class PackedPathField(ArrayField):
+    """
+    An ArrayField which holds a set of objects, each identified by a (type, ID) tuple packed into a single integer.
+    """
+    def __init__(self, **kwargs):
+        kwargs['base_field'] = models.BigIntegerField()
+        super().__init__(**kwargs)
+
+
 PathField.register_lookup(PathContains)
+PackedPathField.register_lookup(PackedPathContains)
@@ -1,6 +1,6 @@
 from django.contrib.postgres.fields.array import ArrayContains
 
-from dcim.utils import object_to_path_node
+from dcim.utils import object_to_packed_path_node, object_to_path_node
 
 
 class PathContains(ArrayContains):
@@ -8,3 +8,10 @@ class PathContains(ArrayContains):
     def get_prep_lookup(self):
         self.rhs = [object_to_path_node(self.rhs)]
         return super().get_prep_lookup()
+
+
+class PackedPathContains(ArrayContains):
+
+    def get_prep_lookup(self):
+        self.rhs = [object_to_packed_path_node(self.rhs)]
+        return super().get_prep_lookup()
@@ -1,10 +1,15 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
-from django.db import connection
+from django.db import connection, connections, transaction
 from django.db.models import Q
 
 from dcim.models import CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
-from dcim.signals import create_cablepath
+from dcim.utils import create_cablepaths, retrace_cablepaths
 
 ENDPOINT_MODELS = (
     ConsolePort,
@@ -15,6 +20,28 @@ ENDPOINT_MODELS = (
     PowerPort
 )
 
+# Number of originating objects for which paths are traced together
+BATCH_SIZE = 1000
+
+
+def trace_origins(model, origin_ids):
+    """
+    Create CablePaths for the specified originating objects, committing them as a single transaction. Returns the
+    number of paths created.
+    """
+    with transaction.atomic():
+        origins = model.objects.filter(pk__in=origin_ids)
+        return len(create_cablepaths([[obj] for obj in origins]))
+
+
+def retrace_paths(path_ids):
+    """
+    Retrace the specified CablePaths in place, committing them as a single transaction. Returns a dictionary reporting
+    the number of paths updated, unchanged, and deleted.
+    """
+    with transaction.atomic():
+        return retrace_cablepaths(CablePath.objects.filter(pk__in=path_ids))
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in NetBox"
@@ -24,10 +51,30 @@ class Command(BaseCommand):
             "--force", action='store_true', dest='force',
             help="Force recalculation of all existing cable paths"
         )
+        parser.add_argument(
+            "--retrace", action='store_true', dest='retrace',
+            help="Retrace all existing cable paths in place, updating only those which have changed"
+        )
+        parser.add_argument(
+            "--site", action='append', dest='sites', metavar='SLUG',
+            help="Trace only paths originating from the specified site (may be passed multiple times)"
+        )
+        parser.add_argument(
+            "--device", action='append', dest='devices', metavar='NAME',
+            help="Trace only paths originating from the specified device (may be passed multiple times)"
+        )
+        parser.add_argument(
+            "--workers", type=int, dest='workers', default=1,
+            help="Number of worker processes among which to divide tracing (default: 1)"
+        )
         parser.add_argument(
             "--no-input", action='store_true', dest='no_input',
             help="Do not prompt user for any input/confirmation"
         )
+        parser.add_argument(
+            "--batch-size", type=int, dest='batch_size', default=BATCH_SIZE,
+            help=f"Number of origins to trace and commit together (default: {BATCH_SIZE})"
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -36,11 +83,128 @@ class Command(BaseCommand):
         bar_size = int(percentage / 5)
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20 - bar_size)}] {int(percentage)}%", ending='')
 
+    def get_origins(self, model, sites=None, devices=None):
+        """
+        Return a QuerySet of all cabled objects of the given model, optionally limited to the specified sites and/or
+        devices. Returns None if the model is excluded by the given scope.
+        """
+        params = Q(cable__isnull=False)
+        if hasattr(model, 'wireless_link'):
+            params |= Q(wireless_link__isnull=False)
+        origins = model.objects.filter(params)
+
+        if model is PowerFeed:
+            # Power feeds do not belong to a device
+            if devices:
+                return None
+            if sites:
+                origins = origins.filter(power_panel__site__slug__in=sites)
+        else:
+            if sites:
+                origins = origins.filter(device__site__slug__in=sites)
+            if devices:
+                origins = origins.filter(device__name__in=devices)
+
+        return origins
+
+    @staticmethod
+    def get_batches(origins, batch_size):
+        """
+        Divide the given origins into batches of approximately batch_size objects, keeping all origins which belong to
+        the same device (or power panel) together. Returns a list of lists of origin IDs.
+        """
+        parent_field = 'power_panel_id' if origins.model is PowerFeed else 'device_id'
+        origins_by_parent = defaultdict(list)
+        for pk, parent_id in origins.order_by(parent_field, 'pk').values_list('pk', parent_field):
+            origins_by_parent[parent_id].append(pk)
+
+        batches = []
+        batch = []
+        for origin_ids in origins_by_parent.values():
+            batch.extend(origin_ids)
+            if len(batch) >= batch_size:
+                batches.append(batch)
+                batch = []
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def run_batches(self, func, batches, workers):
+        """
+        Call func for each batch of arguments, either serially or distributed among a pool of worker processes, and
+        yield each batch along with its result as it is completed.
+        """
+        if workers < 2:
+            for batch in batches:
+                yield batch, func(*batch)
+            return
+
+        # Close all database connections prior to forking so that none are shared with the worker processes
+        connections.close_all()
+        mp_context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = {executor.submit(func, *batch): batch for batch in batches}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def retrace_existing_paths(self, batch_size, workers):
+        """
+        Retrace all existing CablePaths in place, reporting the number of paths updated, unchanged, and deleted.
+        """
+        path_ids = list(CablePath.objects.order_by('pk').values_list('pk', flat=True))
+        paths_count = len(path_ids)
+        self.stdout.write(f'Retracing {paths_count} existing cable paths...')
+        totals = {
+            'updated': 0,
+            'unchanged': 0,
+            'deleted': 0,
+        }
+        batches = [(path_ids[i:i + batch_size],) for i in range(0, paths_count, batch_size)]
+        start_time = time.monotonic()
+        retraced_count = 0
+        for _, results in self.run_batches(retrace_paths, batches, workers):
+            for key, count in results.items():
+                totals[key] += count
+            retraced_count += sum(results.values())
+            self.draw_progress_bar(retraced_count * 100 / paths_count)
+        elapsed = time.monotonic() - start_time
+        self.stdout.write(self.style.SUCCESS(
+            f"\n  Updated {totals['updated']}, unchanged {totals['unchanged']}, deleted {totals['deleted']} paths "
+            f"in {elapsed:.1f}s ({retraced_count / (elapsed or 1):.0f} paths/sec)"
+        ))
+
     def handle(self, *model_names, **options):
+        sites = options['sites']
+        devices = options['devices']
+        batch_size = options['batch_size']
+        workers = options['workers']
+        if batch_size < 1:
+            raise CommandError("Batch size must be a positive integer.")
+        if workers < 1:
+            raise CommandError("Number of workers must be a positive integer.")
+
+        # If --retrace was passed, first update all existing CablePaths in place
+        if options['retrace'] and not options['force']:
+            if sites or devices:
+                raise CommandError("Existing paths cannot be retraced for a specific site or device.")
+            self.retrace_existing_paths(batch_size, workers)
 
-        # If --force was passed, first delete all existing CablePaths
+        # If --force was passed, first delete all existing CablePaths (within the specified scope, if any)
         if options['force']:
-            cable_paths = CablePath.objects.all()
+            if sites or devices:
+                path_ids = set()
+                for model in ENDPOINT_MODELS:
+                    if (origins := self.get_origins(model, sites, devices)) is not None:
+                        path_ids.update(origins.filter(_path__isnull=False).values_list('_path', flat=True))
+                cable_paths = CablePath.objects.filter(pk__in=path_ids)
+            else:
+                cable_paths = CablePath.objects.all()
             paths_count = cable_paths.count()
 
             # Prompt the user to confirm recalculation of all paths
@@ -56,35 +220,49 @@ class Command(BaseCommand):
 
             # Delete all existing CablePath instances
             self.stdout.write(f"Deleting {paths_count} existing cable paths...")
-            deleted_count, _ = CablePath.objects.all().delete()
+            deleted_count, _ = cable_paths.delete()
             self.stdout.write((self.style.SUCCESS(f'  Deleted {deleted_count} paths')))
 
             # Reinitialize the model's PK sequence
-            self.stdout.write(f'Resetting database sequence for CablePath model')
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
-            with connection.cursor() as cursor:
-                for sql in sequence_sql:
-                    cursor.execute(sql)
+            if not (sites or devices):
+                self.stdout.write(f'Resetting database sequence for CablePath model')
+                sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
+                with connection.cursor() as cursor:
+                    for sql in sequence_sql:
+                        cursor.execute(sql)
 
-        # Retrace paths
+        # Retrace missing paths. Each batch of paths is committed as it completes, so an interrupted run can be resumed
+        # simply by running the command again (without --force).
         for model in ENDPOINT_MODELS:
-            params = Q(cable__isnull=False)
-            if hasattr(model, 'wireless_link'):
-                params |= Q(wireless_link__isnull=False)
-            origins = model.objects.filter(params)
-            if not options['force']:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
+            origins = self.get_origins(model, sites, devices)
+            if origins is None:
+                continue
+            origins = origins.filter(_path__isnull=True)
+            batches = [(model, batch) for batch in self.get_batches(origins, batch_size)]
+            origins_count = sum(len(batch) for _, batch in batches)
             if not origins_count:
                 self.stdout.write(f'Found no missing {model._meta.verbose_name} paths; skipping')
                 continue
             self.stdout.write(f'Retracing {origins_count} cabled {model._meta.verbose_name_plural}...')
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath([obj])
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f'\n  Retraced {i} {model._meta.verbose_name_plural}'))
+
+            start_time = time.monotonic()
+            traced_count = 0
+            paths_count = 0
+            try:
+                for (_, batch), count in self.run_batches(trace_origins, batches, workers):
+                    traced_count += len(batch)
+                    paths_count += count
+                    self.draw_progress_bar(traced_count * 100 / origins_count)
+            except KeyboardInterrupt:
+                self.stdout.write(self.style.WARNING(
+                    f'\nInterrupted after retracing {paths_count} {model._meta.verbose_name_plural}. Run this command '
+                    f'again (without --force) to resume.'
+                ))
+                raise
+            elapsed = time.monotonic() - start_time
+            self.stdout.write(self.style.SUCCESS(
+                f'\n  Retraced {paths_count} {model._meta.verbose_name_plural} in {elapsed:.1f}s '
+                f'({paths_count / (elapsed or 1):.0f} paths/sec)'
+            ))
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,83 @@
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+from django.db.models import Max
+
+import dcim.fields
+
+# Number of low-order bits holding the object ID within a packed path node
+OBJECT_ID_BITS = 48
+
+# Number of CablePaths to convert per UPDATE statement
+BATCH_SIZE = 10000
+
+
+def update_in_batches(apps, schema_editor, sql):
+    """
+    Execute the given UPDATE statement against successive ranges of CablePath IDs.
+    """
+    CablePath = apps.get_model('dcim', 'CablePath')
+    max_id = CablePath.objects.aggregate(max_id=Max('pk'))['max_id'] or 0
+    for start in range(0, max_id + 1, BATCH_SIZE):
+        schema_editor.execute(sql, params=(start, start + BATCH_SIZE))
+
+
+def pack_nodes(apps, schema_editor):
+    """
+    Convert each "<ContentType ID>:<Object ID>" node string to a packed integer.
+    """
+    update_in_batches(apps, schema_editor, (
+        'UPDATE dcim_cablepath SET _nodes = ARRAY('
+        f"SELECT split_part(node, ':', 1)::bigint << {OBJECT_ID_BITS} | split_part(node, ':', 2)::bigint "
+        'FROM unnest(_nodes_legacy) WITH ORDINALITY AS t(node, i) ORDER BY i'
+        ') WHERE id >= %s AND id < %s'
+    ))
+
+
+def unpack_nodes(apps, schema_editor):
+    """
+    Convert each packed integer node back to a "<ContentType ID>:<Object ID>" string.
+    """
+    update_in_batches(apps, schema_editor, (
+        'UPDATE dcim_cablepath SET _nodes_legacy = ARRAY('
+        f"SELECT (node >> {OBJECT_ID_BITS})::text || ':' || (node & {(1 << OBJECT_ID_BITS) - 1})::text "
+        'FROM unnest(_nodes) WITH ORDINALITY AS t(node, i) ORDER BY i'
+        ') WHERE id >= %s AND id < %s'
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0190_nested_modules'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='cablepath',
+            old_name='_nodes',
+            new_name='_nodes_legacy',
+        ),
+        migrations.AlterField(
+            model_name='cablepath',
+            name='_nodes_legacy',
+            field=dcim.fields.PathField(base_field=models.CharField(max_length=40), null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='cablepath',
+            name='_nodes',
+            field=dcim.fields.PackedPathField(base_field=models.BigIntegerField(), default=list, size=None),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            code=pack_nodes,
+            reverse_code=unpack_nodes
+        ),
+        migrations.RemoveField(
+            model_name='cablepath',
+            name='_nodes_legacy',
+        ),
+        migrations.AddIndex(
+            model_name='cablepath',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['_nodes'], name='dcim_cablep__nodes_b23b96_gin'),
+        ),
+    ]
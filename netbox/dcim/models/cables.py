@@ -2,6 +2,7 @@ import itertools
 from collections import defaultdict
 
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Sum
@@ -12,14 +13,13 @@ from django.utils.translation import gettext_lazy as _
 from core.models import ObjectType
 from dcim.choices import *
 from dcim.constants import *
-from dcim.fields import PathField
-from dcim.utils import decompile_path_node, object_to_path_node
+from dcim.fields import PackedPathField
+from dcim.utils import decompile_path_node, pack_path, unpack_path_node
 from netbox.models import ChangeLoggedModel, PrimaryModel
 from utilities.conversion import to_meters
 from utilities.fields import ColorField
 from utilities.querysets import RestrictedQuerySet
-from wireless.models import WirelessLink
-from .device_components import FrontPort, RearPort, PathEndpoint
+from .device_components import FrontPort, RearPort
 
 __all__ = (
     'Cable',
@@ -438,7 +438,9 @@ class CablePath(models.Model):
     if the instance represents a complete end-to-end path from origin(s) to destination(s). `is_split` is True if the
     path diverges across multiple cables.
 
-    `_nodes` retains a flattened list of all nodes within the path to enable simple filtering.
+    `_nodes` retains a flattened list of all nodes within the path to enable simple filtering. Each node is stored as
+    a single integer packing its (type, ID) tuple (see `pack_path_node()`), allowing membership lookups, cable ID
+    extraction, and path rendering without parsing node strings.
     """
     path = models.JSONField(
         verbose_name=_('path'),
@@ -456,11 +458,14 @@ class CablePath(models.Model):
         verbose_name=_('is split'),
         default=False
     )
-    _nodes = PathField()
+    _nodes = PackedPathField()
 
     _netbox_private = True
 
     class Meta:
+        indexes = (
+            GinIndex(fields=['_nodes']),
+        )
         verbose_name = _('cable path')
         verbose_name_plural = _('cable paths')
 
@@ -470,13 +475,13 @@ class CablePath(models.Model):
     def save(self, *args, **kwargs):
 
         # Save the flattened nodes list
-        self._nodes = list(itertools.chain(*self.path))
+        self._nodes = pack_path(self.path)
 
         super().save(*args, **kwargs)
 
         # Record a direct reference to this CablePath on its originating object(s)
         origin_model = self.origin_type.model_class()
-        origin_ids = [decompile_path_node(node)[1] for node in self.path[0]]
+        origin_ids = [unpack_path_node(node)[1] for node in self._nodes[:len(self.path[0])]]
         origin_model.objects.filter(pk__in=origin_ids).update(_path=self.pk)
 
     @property
@@ -526,200 +531,12 @@ class CablePath(models.Model):
         Create a new CablePath instance as traced from the given termination objects. These can be any object to which a
         Cable or WirelessLink connects (interfaces, console ports, circuit termination, etc.). All terminations must be
         of the same type and must belong to the same parent object.
-        """
-        from circuits.models import CircuitTermination
-
-        if not terminations:
-            return None
-
-        # Ensure all originating terminations are attached to the same link
-        if len(terminations) > 1:
-            assert all(t.link == terminations[0].link for t in terminations[1:])
 
-        path = []
-        position_stack = []
-        is_complete = False
-        is_active = True
-        is_split = False
-
-        while terminations:
-
-            # Terminations must all be of the same type
-            assert all(isinstance(t, type(terminations[0])) for t in terminations[1:])
-
-            # All mid-span terminations must all be attached to the same device
-            if not isinstance(terminations[0], PathEndpoint):
-                assert all(isinstance(t, type(terminations[0])) for t in terminations[1:])
-                assert all(t.parent_object == terminations[0].parent_object for t in terminations[1:])
-
-            # Check for a split path (e.g. rear port fanning out to multiple front ports with
-            # different cables attached)
-            if len(set(t.link for t in terminations)) > 1 and (
-                    position_stack and len(terminations) != len(position_stack[-1])
-            ):
-                is_split = True
-                break
-
-            # Step 1: Record the near-end termination object(s)
-            path.append([
-                object_to_path_node(t) for t in terminations
-            ])
-
-            # Step 2: Determine the attached links (Cable or WirelessLink), if any
-            links = [termination.link for termination in terminations if termination.link is not None]
-            if len(links) == 0:
-                if len(path) == 1:
-                    # If this is the start of the path and no link exists, return None
-                    return None
-                # Otherwise, halt the trace if no link exists
-                break
-            assert all(type(link) in (Cable, WirelessLink) for link in links)
-            assert all(isinstance(link, type(links[0])) for link in links)
-
-            # Step 3: Record asymmetric paths as split
-            not_connected_terminations = [termination.link for termination in terminations if termination.link is None]
-            if len(not_connected_terminations) > 0:
-                is_complete = False
-                is_split = True
-
-            # Step 4: Record the links, keeping cables in order to allow for SVG rendering
-            cables = []
-            for link in links:
-                if object_to_path_node(link) not in cables:
-                    cables.append(object_to_path_node(link))
-            path.append(cables)
-
-            # Step 5: Update the path status if a link is not connected
-            links_status = [link.status for link in links if link.status != LinkStatusChoices.STATUS_CONNECTED]
-            if any([status != LinkStatusChoices.STATUS_CONNECTED for status in links_status]):
-                is_active = False
-
-            # Step 6: Determine the far-end terminations
-            if isinstance(links[0], Cable):
-                termination_type = ObjectType.objects.get_for_model(terminations[0])
-                local_cable_terminations = CableTermination.objects.filter(
-                    termination_type=termination_type,
-                    termination_id__in=[t.pk for t in terminations]
-                )
-
-                q_filter = Q()
-                for lct in local_cable_terminations:
-                    cable_end = 'A' if lct.cable_end == 'B' else 'B'
-                    q_filter |= Q(cable=lct.cable, cable_end=cable_end)
-
-                remote_cable_terminations = CableTermination.objects.filter(q_filter)
-                remote_terminations = [ct.termination for ct in remote_cable_terminations]
-            else:
-                # WirelessLink
-                remote_terminations = [
-                    link.interface_b if link.interface_a is terminations[0] else link.interface_a for link in links
-                ]
-
-            # Remote Terminations must all be of the same type, otherwise return a split path
-            if not all(isinstance(t, type(remote_terminations[0])) for t in remote_terminations[1:]):
-                is_complete = False
-                is_split = True
-                break
-
-            # Step 7: Record the far-end termination object(s)
-            path.append([
-                object_to_path_node(t) for t in remote_terminations if t is not None
-            ])
-
-            # Step 8: Determine the "next hop" terminations, if applicable
-            if not remote_terminations:
-                break
-
-            if isinstance(remote_terminations[0], FrontPort):
-                # Follow FrontPorts to their corresponding RearPorts
-                rear_ports = RearPort.objects.filter(
-                    pk__in=[t.rear_port_id for t in remote_terminations]
-                )
-                if len(rear_ports) > 1 or rear_ports[0].positions > 1:
-                    position_stack.append([fp.rear_port_position for fp in remote_terminations])
+        To trace paths from many sets of terminations at once, use CablePathTracer directly.
+        """
+        from dcim.tracing import CablePathTracer
 
-                terminations = rear_ports
-
-            elif isinstance(remote_terminations[0], RearPort):
-                if len(remote_terminations) == 1 and remote_terminations[0].positions == 1:
-                    front_ports = FrontPort.objects.filter(
-                        rear_port_id__in=[rp.pk for rp in remote_terminations],
-                        rear_port_position=1
-                    )
-                # Obtain the individual front ports based on the termination and all positions
-                elif len(remote_terminations) > 1 and position_stack:
-                    positions = position_stack.pop()
-
-                    # Ensure we have a number of positions equal to the amount of remote terminations
-                    assert len(remote_terminations) == len(positions)
-
-                    # Get our front ports
-                    q_filter = Q()
-                    for rt in remote_terminations:
-                        position = positions.pop()
-                        q_filter |= Q(rear_port_id=rt.pk, rear_port_position=position)
-                    assert q_filter is not Q()
-                    front_ports = FrontPort.objects.filter(q_filter)
-                # Obtain the individual front ports based on the termination and position
-                elif position_stack:
-                    front_ports = FrontPort.objects.filter(
-                        rear_port_id=remote_terminations[0].pk,
-                        rear_port_position__in=position_stack.pop()
-                    )
-                else:
-                    # No position indicated: path has split, so we stop at the RearPorts
-                    is_split = True
-                    break
-
-                terminations = front_ports
-
-            elif isinstance(remote_terminations[0], CircuitTermination):
-                # Follow a CircuitTermination to its corresponding CircuitTermination (A to Z or vice versa)
-                if len(remote_terminations) > 1:
-                    is_split = True
-                    break
-                circuit_termination = CircuitTermination.objects.filter(
-                    circuit=remote_terminations[0].circuit,
-                    term_side='Z' if remote_terminations[0].term_side == 'A' else 'A'
-                ).first()
-                if circuit_termination is None:
-                    break
-                elif circuit_termination.provider_network:
-                    # Circuit terminates to a ProviderNetwork
-                    path.extend([
-                        [object_to_path_node(circuit_termination)],
-                        [object_to_path_node(circuit_termination.provider_network)],
-                    ])
-                    is_complete = True
-                    break
-                elif circuit_termination.site and not circuit_termination.cable:
-                    # Circuit terminates to a Site
-                    path.extend([
-                        [object_to_path_node(circuit_termination)],
-                        [object_to_path_node(circuit_termination.site)],
-                    ])
-                    break
-
-                terminations = [circuit_termination]
-
-            else:
-                # Check for non-symmetric path
-                if all(isinstance(t, type(remote_terminations[0])) for t in remote_terminations[1:]):
-                    is_complete = True
-                elif len(remote_terminations) == 0:
-                    is_complete = False
-                else:
-                    # Unsupported topology, mark as split and exit
-                    is_complete = False
-                    is_split = True
-                break
-
-        return cls(
-            path=path,
-            is_complete=is_complete,
-            is_active=is_active,
-            is_split=is_split
-        )
+        return CablePathTracer().trace([terminations])[0]
 
     def retrace(self):
         """
@@ -727,6 +544,11 @@ class CablePath(models.Model):
         """
         _new = self.from_origin(self.origins)
         if _new:
+            if (self.path, self.is_complete, self.is_active, self.is_split) == (
+                _new.path, _new.is_complete, _new.is_active, _new.is_split
+            ):
+                # Nothing has changed
+                return
             self.path = _new.path
             self.is_complete = _new.is_complete
             self.is_active = _new.is_active
@@ -740,10 +562,11 @@ class CablePath(models.Model):
         """
         Return the path as a list of prefetched objects.
         """
+        nodes = [unpack_path_node(node) for node in (self._nodes or pack_path(self.path))]
+
         # Compile a list of IDs to prefetch for each type of model in the path
         to_prefetch = defaultdict(list)
-        for node in self._nodes:
-            ct_id, object_id = decompile_path_node(node)
+        for ct_id, object_id in nodes:
             to_prefetch[ct_id].append(object_id)
 
         # Prefetch path objects using one query per model type. Prefetch related devices where appropriate.
@@ -757,18 +580,19 @@ class CablePath(models.Model):
                 obj.id: obj for obj in queryset
             }
 
-        # Replicate the path using the prefetched objects.
+        # Replicate the path using the prefetched objects. The flattened nodes list is divided according to the
+        # number of nodes in each step of the path.
         path = []
+        nodes = iter(nodes)
         for step in self.path:
-            nodes = []
-            for node in step:
-                ct_id, object_id = decompile_path_node(node)
+            objects = []
+            for ct_id, object_id in itertools.islice(nodes, len(step)):
                 try:
-                    nodes.append(prefetched[ct_id][object_id])
+                    objects.append(prefetched[ct_id][object_id])
                 except KeyError:
                     # Ignore stale (deleted) object IDs
                     pass
-            path.append(nodes)
+            path.append(objects)
 
         return path
 
@@ -780,7 +604,7 @@ class CablePath(models.Model):
         cable_ids = []
 
         for node in self._nodes:
-            ct, id = decompile_path_node(node)
+            ct, id = unpack_path_node(node)
             if ct == cable_ct:
                 cable_ids.append(id)
 
@@ -1,4 +1,6 @@
 import decimal
+import math
+from collections import defaultdict
 from functools import cached_property
 
 from django.conf import settings
@@ -20,7 +22,7 @@ from netbox.models.features import ContactsMixin, ImageAttachmentsMixin
 from utilities.conversion import to_grams
 from utilities.data import array_to_string, drange
 from utilities.fields import ColorField, NaturalOrderingField
-from .device_components import PowerPort
+from .device_components import PowerOutlet, PowerPort
 from .devices import Device, Module
 from .mixins import WeightMixin
 from .power import PowerFeed
@@ -518,34 +520,47 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, RackBase):
         :param ignore_excluded_devices: Ignore devices that are marked to exclude from utilization calculations
         """
         # Gather all devices which consume U space within the rack
-        devices = self.devices.prefetch_related('device_type').filter(position__gte=1)
+        devices = self.devices.filter(position__gte=1)
         if ignore_excluded_devices:
             devices = devices.exclude(device_type__exclude_from_utilization=True)
 
         if exclude is not None:
             devices = devices.exclude(pk__in=exclude)
 
-        # Initialize the rack unit skeleton
-        units = list(self.units)
-
-        # Remove units consumed by installed devices
-        for d in devices:
-            if rack_face is None or d.face == rack_face or d.device_type.is_full_depth:
-                for u in drange(d.position, d.position + d.device_type.u_height, 0.5):
-                    try:
-                        units.remove(u)
-                    except ValueError:
-                        # Found overlapping devices in the rack!
-                        pass
-
-        # Remove units without enough space above them to accommodate a device of the specified height
-        available_units = []
-        for u in units:
-            if set(drange(u, u + decimal.Decimal(u_height), 0.5)).issubset(units):
-                available_units.append(u)
+        # Mark the units consumed by installed devices
+        occupied = 0
+        for position, face, device_height, is_full_depth in devices.values_list(
+            'position', 'face', 'device_type__u_height', 'device_type__is_full_depth'
+        ):
+            if rack_face is None or face == rack_face or is_full_depth:
+                occupied |= self.get_unit_bitmap(position, device_height)
+
+        # Find the units with enough contiguous free space above them to accommodate a device of the specified height
+        free = ~occupied & self.get_unit_bitmap(self.starting_unit, self.u_height)
+        available = free
+        for i in range(1, math.ceil(u_height * 2)):
+            available &= free >> i
+
+        available_units = [
+            u for u in self.units if available >> int((u - self.starting_unit) * 2) & 1
+        ]
 
         return list(reversed(available_units))
 
+    def get_unit_bitmap(self, position, u_height):
+        """
+        Return an integer bitmap of the half-units spanned by an object of the given height installed at the given
+        position. The least significant bit represents the bottom half of the rack's starting unit; units beyond the
+        top of the rack are omitted.
+
+        :param position: The lowest unit occupied
+        :param u_height: The height of the object, in units
+        """
+        offset = int((position - self.starting_unit) * 2)
+        bitmap = (1 << math.ceil(u_height * 2)) - 1
+        bitmap = bitmap << offset if offset >= 0 else bitmap >> -offset
+        return bitmap & ((1 << self.u_height * 2) - 1)
+
     def get_reserved_units(self):
         """
         Return a dictionary mapping all reserved units within the rack to their reservation.
@@ -604,41 +619,134 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, RackBase):
         Determine the utilization rate of the rack and return it as a percentage. Occupied and reserved units both count
         as utilized.
         """
-        # Determine unoccupied units
-        total_units = len(list(self.units))
-        available_units = self.get_available_units(u_height=0.5, ignore_excluded_devices=True)
-
-        # Remove reserved units
-        for ru in self.get_reserved_units():
-            for u in drange(ru, ru + 1, 0.5):
-                if u in available_units:
-                    available_units.remove(u)
-
-        occupied_unit_count = total_units - len(available_units)
-        percentage = float(occupied_unit_count) / total_units * 100
-
-        return percentage
+        if hasattr(self, '_utilization'):
+            return self._utilization
+        return self.calculate_utilization([self])[self.pk]
 
     def get_power_utilization(self):
         """
         Determine the utilization rate of power in the rack and return it as a percentage.
         """
-        powerfeeds = PowerFeed.objects.filter(rack=self)
-        available_power_total = sum(pf.available_power for pf in powerfeeds)
-        if not available_power_total:
-            return 0
-
-        powerports = []
-        for powerfeed in powerfeeds:
-            powerports.extend([
-                peer for peer in powerfeed.link_peers if isinstance(peer, PowerPort)
-            ])
-
-        allocated_draw = sum([
-            powerport.get_power_draw()['allocated'] for powerport in powerports
-        ])
-
-        return round(allocated_draw / available_power_total * 100, 1)
+        if hasattr(self, '_power_utilization'):
+            return self._power_utilization
+        return self.calculate_power_utilization([self])[self.pk]
+
+    @classmethod
+    def calculate_utilization(cls, racks):
+        """
+        Determine the utilization rate of each of the given racks, returning a dictionary mapping rack PKs to
+        percentages. All devices and reservations are retrieved in one query apiece.
+        """
+        racks = {rack.pk: rack for rack in racks}
+        occupied = defaultdict(int)
+
+        # Mark the units consumed by installed devices
+        devices = Device.objects.filter(
+            rack__in=list(racks),
+            position__gte=1
+        ).exclude(
+            device_type__exclude_from_utilization=True
+        ).values_list('rack_id', 'position', 'device_type__u_height')
+        for rack_id, position, u_height in devices:
+            occupied[rack_id] |= racks[rack_id].get_unit_bitmap(position, u_height)
+
+        # Mark reserved units
+        for rack_id, units in RackReservation.objects.filter(rack__in=list(racks)).values_list('rack_id', 'units'):
+            for u in units:
+                occupied[rack_id] |= racks[rack_id].get_unit_bitmap(u, 1)
+
+        return {
+            pk: float(occupied[pk].bit_count()) / (rack.u_height * 2) * 100
+            for pk, rack in racks.items()
+        }
+
+    @classmethod
+    def calculate_power_utilization(cls, racks):
+        """
+        Determine the power utilization rate of each of the given racks, returning a dictionary mapping rack PKs to
+        percentages. The allocated draw of each PowerPort connected to a rack's PowerFeeds is calculated as by
+        PowerPort.get_power_draw(), using a fixed number of queries regardless of the number of racks.
+        """
+        racks = {rack.pk: rack for rack in racks}
+
+        # Retrieve all PowerFeeds within the racks
+        available_power = defaultdict(int)
+        feed_cables = defaultdict(list)
+        powerfeeds = PowerFeed.objects.filter(rack__in=list(racks)).values_list(
+            'rack_id', 'available_power', 'cable_id', 'cable_end'
+        )
+        for rack_id, power, cable_id, cable_end in powerfeeds:
+            available_power[rack_id] += power
+            if cable_id:
+                feed_cables[rack_id].append((cable_id, cable_end))
+
+        # Retrieve the PowerPorts connected to each PowerFeed
+        powerports = defaultdict(list)
+        cable_ids = [cable_id for cables in feed_cables.values() for cable_id, _ in cables]
+        for pk, cable_id, cable_end, allocated_draw, maximum_draw in PowerPort.objects.filter(
+            cable__in=cable_ids
+        ).values_list('pk', 'cable_id', 'cable_end', 'allocated_draw', 'maximum_draw'):
+            powerports[cable_id].append((pk, cable_end, allocated_draw, maximum_draw))
+
+        # Where no draw has been defined on a PowerPort, sum the allocated draw of all PowerPorts connected to its
+        # PowerOutlets
+        downstream_draw = defaultdict(dict)
+        undefined_pks = [
+            pk for ports in powerports.values() for pk, _, allocated_draw, maximum_draw in ports
+            if allocated_draw is None and maximum_draw is None
+        ]
+        if undefined_pks:
+            poweroutlets = PowerOutlet.objects.filter(
+                power_port__in=undefined_pks,
+                cable__isnull=False
+            ).values_list('power_port_id', 'cable_id', 'cable_end')
+            downstream_ports = defaultdict(list)
+            for pk, cable_id, cable_end, allocated_draw in PowerPort.objects.filter(
+                cable__in=[cable_id for _, cable_id, _ in poweroutlets]
+            ).values_list('pk', 'cable_id', 'cable_end', 'allocated_draw'):
+                downstream_ports[(cable_id, cable_end)].append((pk, allocated_draw))
+            for power_port_id, cable_id, cable_end in poweroutlets:
+                opposite_end = CableEndChoices.SIDE_A if cable_end == CableEndChoices.SIDE_B else CableEndChoices.SIDE_B
+                for pk, allocated_draw in downstream_ports[(cable_id, opposite_end)]:
+                    downstream_draw[power_port_id][pk] = allocated_draw or 0
+
+        utilization = {}
+        for pk in racks:
+            if not available_power[pk]:
+                utilization[pk] = 0
+                continue
+            allocated_draw_total = 0
+            for cable_id, feed_cable_end in feed_cables[pk]:
+                for port_pk, cable_end, allocated_draw, maximum_draw in powerports[cable_id]:
+                    if cable_end == feed_cable_end:
+                        continue
+                    if allocated_draw is None and maximum_draw is None:
+                        allocated_draw_total += sum(downstream_draw[port_pk].values())
+                    else:
+                        allocated_draw_total += allocated_draw or 0
+            utilization[pk] = round(allocated_draw_total / available_power[pk] * 100, 1)
+
+        return utilization
+
+    @classmethod
+    def prefetch_utilization(cls, racks, space=True, power=True):
+        """
+        Calculate the space and/or power utilization of many racks at once, caching the results on each instance for
+        subsequent calls to get_utilization() and get_power_utilization().
+
+        :param racks: An iterable of Rack instances
+        :param space: Calculate space utilization
+        :param power: Calculate power utilization
+        """
+        racks = list(racks)
+        if space:
+            utilization = cls.calculate_utilization(racks)
+            for rack in racks:
+                rack._utilization = utilization[rack.pk]
+        if power:
+            utilization = cls.calculate_power_utilization(racks)
+            for rack in racks:
+                rack._power_utilization = utilization[rack.pk]
 
     @cached_property
     def total_weight(self):
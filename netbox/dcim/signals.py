@@ -8,7 +8,7 @@ from .models import (
     Cable, CablePath, CableTermination, Device, FrontPort, PathEndpoint, PowerPanel, Rack, Location, VirtualChassis,
 )
 from .models.cables import trace_paths
-from .utils import create_cablepath, rebuild_paths
+from .utils import create_cablepaths, rebuild_paths, retrace_cablepaths
 
 
 #
@@ -85,19 +85,26 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
     if instance._terminations_modified:
         a_terminations = []
         b_terminations = []
-        for t in instance.terminations.all():
+        for t in instance.terminations.prefetch_related('termination'):
             if t.cable_end == CableEndChoices.SIDE_A:
                 a_terminations.append(t.termination)
             else:
                 b_terminations.append(t.termination)
+        origins = []
+        pass_through_nodes = []
         for nodes in [a_terminations, b_terminations]:
             # Examine type of first termination to determine object type (all must be the same)
             if not nodes:
                 continue
             if isinstance(nodes[0], PathEndpoint):
-                create_cablepath(nodes)
+                origins.append(nodes)
             else:
-                rebuild_paths(nodes)
+                pass_through_nodes.extend(nodes)
+        # Trace new paths from both ends of the cable together
+        if origins:
+            create_cablepaths(origins)
+        if pass_through_nodes:
+            rebuild_paths(pass_through_nodes)
 
     # Update status of CablePaths if Cable status has been changed
     elif instance.status != instance._orig_status:
@@ -112,8 +119,7 @@ def retrace_cable_paths(instance, **kwargs):
     """
     When a Cable is deleted, check for and update its connected endpoints
     """
-    for cablepath in CablePath.objects.filter(_nodes__contains=instance):
-        cablepath.retrace()
+    retrace_cablepaths(CablePath.objects.filter(_nodes__contains=instance))
 
 
 @receiver(post_delete, sender=CableTermination)
@@ -137,6 +143,4 @@ def extend_rearport_cable_paths(instance, created, raw, **kwargs):
     When a new FrontPort is created, add it to any CablePaths which end at its corresponding RearPort.
     """
     if created and not raw:
-        rearport = instance.rear_port
-        for cablepath in CablePath.objects.filter(_nodes__contains=rearport):
-            cablepath.retrace()
+        retrace_cablepaths(CablePath.objects.filter(_nodes__contains=instance.rear_port))
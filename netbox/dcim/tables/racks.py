@@ -192,6 +192,19 @@ class RackTable(TenancyColumnsMixin, ContactsColumnMixin, NetBoxTable):
             'device_count', 'get_utilization',
         )
 
+    def paginate(self, *args, **kwargs):
+        super().paginate(*args, **kwargs)
+
+        # Calculate the utilization of all racks on the page at once, rather than row by row
+        space = self.columns['get_utilization'].visible
+        power = self.columns['get_power_utilization'].visible
+        if space or power:
+            Rack.prefetch_utilization(
+                [row.record for row in self.page.object_list],
+                space=space,
+                power=power
+            )
+
 
 #
 # Rack reservations
@@ -1,3 +1,6 @@
+import json
+import os
+
 from django.test import override_settings
 from django.urls import reverse
 from django.utils.translation import gettext as _
@@ -1342,6 +1345,41 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_200_OK)
         self.assertEqual(response.data['content'], f'Config for device {device.name}')
 
+    def test_render_configs(self):
+        configtemplate = ConfigTemplate.objects.create(
+            name='Config Template 1',
+            template_code='Config for device {{ device.name }} ({{ foo }})'
+        )
+        role = DeviceRole.objects.first()
+        role.config_template = configtemplate
+        role.save()
+        Device.objects.update(role=role)
+        devices = Device.objects.order_by('pk')
+
+        self.add_permissions('dcim.add_device')
+        url = reverse('dcim-api:device-list') + f'render-configs/?id={devices[0].pk}&id={devices[1].pk}'
+        response = self.client.post(url, {'context': {'foo': 'bar'}}, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        results = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(results, [
+            {
+                'id': device.pk,
+                'name': device.name,
+                'configtemplate': configtemplate.pk,
+                'content': f'Config for device {device.name} (bar)',
+            } for device in devices[:2]
+        ])
+
+    def test_render_configs_invalid_workers(self):
+        self.add_permissions('dcim.add_device')
+        url = reverse('dcim-api:device-list') + 'render-configs/'
+        for workers in (0, (os.cpu_count() or 1) + 1, 'foo'):
+            data = {'background': True, 'workers': workers}
+            response = self.client.post(url, data, format='json', **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('workers', response.data)
+
 
 class ModuleTest(APIViewTestCases.APIViewTestCase):
     model = Module
@@ -1,10 +1,17 @@
-from django.test import TestCase
+import itertools
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 
 from circuits.models import *
 from dcim.choices import LinkStatusChoices
 from dcim.models import *
 from dcim.svg import CableTraceSVG
-from dcim.utils import object_to_path_node
+from dcim.tracing import CablePathTracer
+from dcim.utils import (
+    compile_path_node, object_to_path_node, pack_path_node, rebuild_paths, unpack_path_node,
+)
 
 
 class CablePathTestCase(TestCase):
@@ -2300,3 +2307,124 @@ class CablePathTestCase(TestCase):
             is_active=True
         )
         self.assertEqual(CablePath.objects.count(), 0)
+
+
+class CablePathTracerTestCase(TestCase):
+    """
+    Test the tracing of many CablePaths together using CablePathTracer.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name='Site', slug='site')
+        manufacturer = Manufacturer.objects.create(name='Generic', slug='generic')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Test Device')
+        role = DeviceRole.objects.create(name='Device Role', slug='device-role')
+        devices = [
+            Device.objects.create(site=site, device_type=device_type, role=role, name=name)
+            for name in ('Device 1', 'Patch Panel 1', 'Patch Panel 2', 'Device 2')
+        ]
+
+        # [IFn] --C-- [FP1:n][RP1:n] --C-- [RP2:n][FP2:n] --C-- [IFn]
+        for i in range(1, 11):
+            interface1 = Interface.objects.create(device=devices[0], name=f'Interface {i}')
+            interface2 = Interface.objects.create(device=devices[3], name=f'Interface {i}')
+            rearport1 = RearPort.objects.create(device=devices[1], name=f'Rear Port {i}', positions=1)
+            rearport2 = RearPort.objects.create(device=devices[2], name=f'Rear Port {i}', positions=1)
+            frontport1 = FrontPort.objects.create(
+                device=devices[1], name=f'Front Port {i}', rear_port=rearport1, rear_port_position=1
+            )
+            frontport2 = FrontPort.objects.create(
+                device=devices[2], name=f'Front Port {i}', rear_port=rearport2, rear_port_position=1
+            )
+            Cable(a_terminations=[interface1], b_terminations=[frontport1]).save()
+            Cable(a_terminations=[rearport1], b_terminations=[rearport2]).save()
+            Cable(a_terminations=[frontport2], b_terminations=[interface2]).save()
+
+    def test_trace(self):
+        expected_paths = {}
+        for i in range(1, 11):
+            interface1 = Interface.objects.get(device__name='Device 1', name=f'Interface {i}')
+            frontport1 = FrontPort.objects.get(device__name='Patch Panel 1', name=f'Front Port {i}')
+            rearport1 = RearPort.objects.get(device__name='Patch Panel 1', name=f'Rear Port {i}')
+            rearport2 = RearPort.objects.get(device__name='Patch Panel 2', name=f'Rear Port {i}')
+            frontport2 = FrontPort.objects.get(device__name='Patch Panel 2', name=f'Front Port {i}')
+            interface2 = Interface.objects.get(device__name='Device 2', name=f'Interface {i}')
+            nodes = [
+                interface1, interface1.cable, frontport1, rearport1, rearport1.cable, rearport2, frontport2,
+                interface2.cable, interface2,
+            ]
+            expected_paths[interface1] = nodes
+            expected_paths[interface2] = nodes[::-1]
+
+        origins = list(expected_paths)
+        cable_paths = CablePathTracer().trace([[origin] for origin in origins])
+
+        self.assertEqual(len(cable_paths), 20)
+        for origin, cp in zip(origins, cable_paths):
+            self.assertEqual(cp.path, [[object_to_path_node(node)] for node in expected_paths[origin]])
+            self.assertTrue(cp.is_complete)
+            self.assertTrue(cp.is_active)
+            self.assertFalse(cp.is_split)
+
+    def test_query_count_independent_of_path_count(self):
+        """
+        The number of queries needed to trace a batch of paths should depend only on path length.
+        """
+        origins = list(Interface.objects.filter(device__name='Device 1'))
+
+        # Populate the ContentType cache
+        CablePathTracer().trace([origins[:1]])
+
+        with CaptureQueriesContext(connection) as single_trace:
+            CablePathTracer().trace([origins[:1]])
+        with CaptureQueriesContext(connection) as batch_trace:
+            CablePathTracer().trace([[origin] for origin in origins])
+
+        self.assertEqual(len(batch_trace), len(single_trace))
+
+    def test_rebuild_paths_in_place(self):
+        """
+        Rebuilding paths should update only those which have changed, preserving their primary keys.
+        """
+        rearport = RearPort.objects.get(device__name='Patch Panel 1', name='Rear Port 1')
+        path_ids = set(CablePath.objects.filter(_nodes__contains=rearport).values_list('pk', flat=True))
+        self.assertEqual(len(path_ids), 2)
+
+        results = rebuild_paths([rearport])
+        self.assertEqual(results, {'updated': 0, 'unchanged': 2, 'deleted': 0})
+
+        # Mark the paths inactive and rebuild them
+        CablePath.objects.filter(pk__in=path_ids).update(is_active=False)
+        results = rebuild_paths([rearport])
+        self.assertEqual(results, {'updated': 2, 'unchanged': 0, 'deleted': 0})
+        self.assertEqual(
+            set(CablePath.objects.filter(_nodes__contains=rearport, is_active=True).values_list('pk', flat=True)),
+            path_ids
+        )
+
+    def test_packed_nodes(self):
+        """
+        Each path's packed nodes should encode the flattened nodes of the path.
+        """
+        for cp in CablePath.objects.all():
+            self.assertEqual(
+                [compile_path_node(*unpack_path_node(node)) for node in cp._nodes],
+                list(itertools.chain(*cp.path))
+            )
+            self.assertEqual(len(cp.get_cable_ids()), 3)
+
+
+class PackedPathNodeTestCase(SimpleTestCase):
+
+    def test_pack_path_node(self):
+        for ct_id, object_id in ((1, 1), (123, 456), (32767, 2 ** 48 - 1)):
+            self.assertEqual(unpack_path_node(pack_path_node(ct_id, object_id)), (ct_id, object_id))
+
+    def test_pack_path_node_invalid_object_id(self):
+        with self.assertRaises(ValueError):
+            pack_path_node(1, 2 ** 48)
+
+    def test_pack_path_node_invalid_ct_id(self):
+        for ct_id in (0, 2 ** 15):
+            with self.assertRaises(ValueError):
+                pack_path_node(ct_id, 1)
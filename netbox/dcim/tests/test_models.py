@@ -7,6 +7,7 @@ from dcim.choices import *
 from dcim.models import *
 from extras.models import CustomField
 from tenancy.models import Tenant
+from users.models import User
 from utilities.data import drange
 from virtualization.models import Cluster, ClusterType
 
@@ -330,6 +331,81 @@ class RackTestCase(TestCase):
         rack.refresh_from_db()
         self.assertEqual(rack.get_utilization(), 1 / 42 * 100)
 
+    def test_utilization_multiple_racks(self):
+        site = Site.objects.first()
+        rack1 = Rack.objects.first()
+        rack2 = Rack.objects.create(name='Rack 2', site=site, u_height=10, starting_unit=5, desc_units=True)
+        attrs = {
+            'device_type': DeviceType.objects.get(u_height=0.5),
+            'role': DeviceRole.objects.first(),
+            'site': site,
+            'face': DeviceFaceChoices.FACE_FRONT,
+        }
+        Device(name='Device 1', rack=rack1, position=1, **attrs).save()
+        Device(name='Device 2', rack=rack2, position=5.5, **attrs).save()
+        RackReservation.objects.create(rack=rack2, units=[5, 6], user=User.objects.create_user(username='user1'))
+
+        utilization = Rack.calculate_utilization([rack1, rack2])
+        self.assertEqual(utilization[rack1.pk], 1 / 84 * 100)
+        self.assertEqual(utilization[rack2.pk], 4 / 20 * 100)
+
+        # Prefetched values are returned by get_utilization()
+        Rack.prefetch_utilization([rack1, rack2], power=False)
+        self.assertEqual(rack1.get_utilization(), utilization[rack1.pk])
+        self.assertEqual(rack2.get_utilization(), utilization[rack2.pk])
+
+    def test_available_units(self):
+        rack = Rack.objects.first()
+        DeviceType.objects.filter(u_height=0.5).update(is_full_depth=False)
+        attrs = {
+            'role': DeviceRole.objects.first(),
+            'site': Site.objects.first(),
+            'rack': rack,
+        }
+        Device(
+            name='Device 1', device_type=DeviceType.objects.get(u_height=1), position=2,
+            face=DeviceFaceChoices.FACE_FRONT, **attrs
+        ).save()
+        Device(
+            name='Device 2', device_type=DeviceType.objects.get(u_height=0.5), position=4.5,
+            face=DeviceFaceChoices.FACE_REAR, **attrs
+        ).save()
+
+        # Units are listed bottom to top
+        available_units = rack.get_available_units(u_height=1, rack_face=DeviceFaceChoices.FACE_FRONT)
+        self.assertEqual(available_units[:4], [1, 3, 3.5, 4])
+        self.assertEqual(available_units[-1], 42)
+        available_units = rack.get_available_units(u_height=1)
+        self.assertEqual(available_units[:4], [1, 3, 3.5, 5])
+
+    def test_power_utilization(self):
+        site = Site.objects.first()
+        rack = Rack.objects.first()
+        device = Device.objects.create(
+            name='Device 1',
+            device_type=DeviceType.objects.first(),
+            role=DeviceRole.objects.first(),
+            site=site
+        )
+        powerpanel = PowerPanel.objects.create(site=site, name='Power Panel 1')
+        powerfeed1 = PowerFeed.objects.create(power_panel=powerpanel, rack=rack, name='Power Feed 1')
+        powerfeed2 = PowerFeed.objects.create(power_panel=powerpanel, rack=rack, name='Power Feed 2')
+        self.assertEqual(rack.get_power_utilization(), 0)
+
+        # PowerPort with an allocated draw
+        powerport1 = PowerPort.objects.create(device=device, name='Power Port 1', allocated_draw=240)
+        Cable(a_terminations=[powerfeed1], b_terminations=[powerport1]).save()
+
+        # PowerPort with no draw defined, supplying another PowerPort via a PowerOutlet
+        powerport2 = PowerPort.objects.create(device=device, name='Power Port 2')
+        Cable(a_terminations=[powerfeed2], b_terminations=[powerport2]).save()
+        poweroutlet = PowerOutlet.objects.create(device=device, name='Power Outlet 1', power_port=powerport2)
+        powerport3 = PowerPort.objects.create(device=device, name='Power Port 3', allocated_draw=96)
+        Cable(a_terminations=[poweroutlet], b_terminations=[powerport3]).save()
+
+        available_power = powerfeed1.available_power + powerfeed2.available_power
+        self.assertEqual(rack.get_power_utilization(), round((240 + 96) / available_power * 100, 1))
+
 
 class DeviceTestCase(TestCase):
 
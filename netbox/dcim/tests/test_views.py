@@ -2,18 +2,23 @@ from decimal import Decimal
 from zoneinfo import ZoneInfo
 
 import yaml
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from netaddr import EUI
 
+from core.models import ObjectType
 from dcim.choices import *
 from dcim.constants import *
 from dcim.models import *
+from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField
 from ipam.models import ASN, RIR, VLAN, VRF
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
 from tenancy.models import Tenant
 from users.models import User
-from utilities.testing import ViewTestCases, create_tags, create_test_device, post_data
+from utilities.testing import TestCase, ViewTestCases, create_tags, create_test_device, post_data
 from wireless.models import WirelessLAN
 
 
@@ -938,7 +943,7 @@ inventory-items:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(b''.join(response.streaming_content), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Device Type 1')
@@ -1238,7 +1243,7 @@ front-ports:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(b''.join(response.streaming_content), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Module Type 1')
@@ -1935,6 +1940,84 @@ class DeviceTestCase(ViewTestCases.PrimaryObjectViewTestCase):
         self.assertHttpStatus(self.client.get(url), 200)
 
 
+class DeviceCustomFieldQueryTestCase(TestCase):
+    """
+    Check that device views read CustomField definitions from memory rather than querying them on every request.
+    """
+    user_permissions = ('dcim.view_device', 'dcim.add_device', 'dcim.change_device')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.create(name='Site 1', slug='site-1')
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        cls.device_type = DeviceType.objects.create(
+            model='Device Type 1', slug='device-type-1', manufacturer=manufacturer
+        )
+        cls.role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        Device.objects.bulk_create([
+            Device(name=f'Device {i}', site=cls.site, device_type=cls.device_type, role=cls.role)
+            for i in range(1, 11)
+        ])
+
+        object_type = ObjectType.objects.get_for_model(Device)
+        for i in range(1, 4):
+            cf = CustomField.objects.create(type=CustomFieldTypeChoices.TYPE_TEXT, name=f'text_{i}')
+            cf.object_types.set([object_type])
+
+    def get_form_data(self, name):
+        return {
+            'device_type': self.device_type.pk,
+            'role': self.role.pk,
+            'site': self.site.pk,
+            'status': DeviceStatusChoices.STATUS_ACTIVE,
+            'name': name,
+            'cf_text_1': 'foo',
+        }
+
+    def assertNoCustomFieldQueries(self, request, expected_status=200):
+        # The first request may load all CustomFields
+        self.assertHttpStatus(request(1), expected_status)
+        with CaptureQueriesContext(connection) as context:
+            self.assertHttpStatus(request(2), expected_status)
+        queries = [query['sql'] for query in context.captured_queries if '"extras_customfield' in query['sql']]
+        self.assertEqual(queries, [])
+
+    def test_device_list(self):
+        url = reverse('dcim:device_list')
+        self.assertNoCustomFieldQueries(lambda i: self.client.get(url))
+
+    def test_device_create(self):
+        url = reverse('dcim:device_add')
+        self.assertNoCustomFieldQueries(lambda i: self.client.get(url))
+        self.assertNoCustomFieldQueries(
+            lambda i: self.client.post(url, self.get_form_data(f'Device X{i}')),
+            expected_status=302
+        )
+        self.assertEqual(Device.objects.get(name='Device X2').custom_field_data['text_1'], 'foo')
+
+    def test_device_edit(self):
+        device = Device.objects.first()
+        url = reverse('dcim:device_edit', kwargs={'pk': device.pk})
+        self.assertNoCustomFieldQueries(lambda i: self.client.get(url))
+        self.assertNoCustomFieldQueries(
+            lambda i: self.client.post(url, self.get_form_data(f'Device Y{i}')),
+            expected_status=302
+        )
+        device.refresh_from_db()
+        self.assertEqual(device.name, 'Device Y2')
+        self.assertEqual(device.custom_field_data['text_1'], 'foo')
+
+    def test_cache_invalidation(self):
+        url = reverse('dcim:device_add')
+        response = self.client.get(url)
+        self.assertNotIn('cf_text_4', response.context['form'].fields)
+
+        cf = CustomField.objects.create(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_4')
+        cf.object_types.set([ObjectType.objects.get_for_model(Device)])
+        response = self.client.get(url)
+        self.assertIn('cf_text_4', response.context['form'].fields)
+
+
 class ModuleTestCase(
     # Module does not support bulk renaming (no name field) or
     # bulk creation (need to specify module bays)
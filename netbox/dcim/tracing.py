@@ -0,0 +1,439 @@
+from collections import defaultdict
+
+from circuits.models import CircuitTermination
+from core.models import ObjectType
+from dcim.choices import CableEndChoices, LinkStatusChoices
+from dcim.models import Cable, CablePath, CableTermination, FrontPort, PathEndpoint, RearPort
+from dcim.utils import compile_path_node
+from wireless.models import WirelessLink
+
+__all__ = (
+    'CablePathTracer',
+)
+
+# Maximum number of primary keys to include in a single lookup query
+BATCH_SIZE = 2000
+
+
+class MissingData(Exception):
+    """
+    Raised when a path walk requires data which has not yet been loaded by the tracer.
+    """
+    pass
+
+
+class CablePathTracer:
+    """
+    Trace CablePaths from many sets of originating terminations at once.
+
+    Rather than querying the database at each hop, the tracer walks each path in Python against in-memory maps of
+    cables, cable terminations, termination objects, front/rear port mappings, and circuit terminations. When a walk
+    needs data which has not been loaded yet, the missing keys are recorded and the walk is suspended. Once every walk
+    has been either completed or suspended, all missing data is fetched using one query per kind, and the suspended
+    walks are restarted. The number of queries is thus bounded by the length of the longest path, regardless of how
+    many paths are traced.
+
+    A tracer retains its loaded data, so it may be reused to trace additional batches of paths which traverse the same
+    objects. It should not be reused after the underlying objects have been modified.
+    """
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+
+        # Loaded data, organized by kind and key
+        self._objects = defaultdict(dict)           # Model -> {pk: instance}
+        self._cables = {}                           # Cable ID -> status
+        self._cable_terminations = {}               # Cable ID -> [CableTermination, ...]
+        self._wireless_links = {}                   # WirelessLink ID -> WirelessLink
+        self._rear_ports = {}                       # Device ID -> [RearPort, ...]
+        self._front_ports = {}                      # Device ID -> [FrontPort, ...]
+        self._circuit_terminations = {}             # Circuit ID -> [CircuitTermination, ...]
+        self._object_type_ids = {}                  # Model -> ObjectType ID
+
+        # Keys which have been requested but not yet loaded, organized by kind
+        self._missing = defaultdict(set)
+
+        # The number of database queries executed to load path data
+        self.query_count = 0
+
+    def trace(self, origins):
+        """
+        Trace a path from each set of originating terminations. Returns a list of unsaved CablePath instances (or
+        None where no path exists) in the same order as the given origins.
+
+        :param origins: Iterable of lists of termination objects, each of which may originate a CablePath
+        """
+        origins = [list(terminations) for terminations in origins]
+        for terminations in origins:
+            for termination in terminations:
+                self._objects[type(termination)].setdefault(termination.pk, termination)
+
+        results = [None] * len(origins)
+        pending = list(range(len(origins)))
+        while pending:
+            suspended = []
+            for i in pending:
+                try:
+                    results[i] = self._trace(origins[i])
+                except MissingData:
+                    suspended.append(i)
+            self._load_missing()
+            pending = suspended
+
+        return results
+
+    #
+    # Data loading
+    #
+
+    def _require(self, cache, kind, keys):
+        """
+        Record any of the given keys which are absent from the cache as missing.
+        """
+        missing = [key for key in keys if key not in cache]
+        self._missing[kind].update(missing)
+        return not missing
+
+    def _lookup(self, cache, kind, keys):
+        """
+        Return the cached values for the given keys, or raise MissingData if any have not yet been loaded.
+        """
+        if not self._require(cache, kind, keys):
+            raise MissingData()
+        return [cache[key] for key in keys]
+
+    def _get_objects(self, model, pks):
+        return self._lookup(self._objects[model], model, pks)
+
+    def _load_missing(self):
+        """
+        Fetch all data recorded as missing, issuing one query per kind (and per batch of keys).
+        """
+        missing, self._missing = self._missing, defaultdict(set)
+        for kind, keys in missing.items():
+            keys = sorted(keys)
+            for i in range(0, len(keys), self.batch_size):
+                self._load(kind, keys[i:i + self.batch_size])
+                self.query_count += 1
+
+    def _load(self, kind, keys):
+
+        # Cable statuses
+        if kind == 'cables':
+            self._cables.update(dict.fromkeys(keys))
+            self._cables.update(Cable.objects.filter(pk__in=keys).values_list('pk', 'status'))
+
+        # Cable terminations, grouped by cable
+        elif kind == 'cableterminations':
+            for key in keys:
+                self._cable_terminations[key] = []
+            for ct in CableTermination.objects.filter(cable_id__in=keys).order_by():
+                self._cable_terminations[ct.cable_id].append(ct)
+
+        # Wireless links
+        elif kind == 'wirelesslinks':
+            self._wireless_links.update(dict.fromkeys(keys))
+            self._wireless_links.update(WirelessLink.objects.in_bulk(keys))
+
+        # Rear & front ports, grouped by device. Each device's ports are loaded in a single query to preserve their
+        # natural ordering.
+        elif kind in ('rearports', 'frontports'):
+            model, cache = (RearPort, self._rear_ports) if kind == 'rearports' else (FrontPort, self._front_ports)
+            for key in keys:
+                cache[key] = []
+            for port in model.objects.filter(device_id__in=keys):
+                cache[port.device_id].append(port)
+                self._objects[model].setdefault(port.pk, port)
+
+        # Circuit terminations, grouped by circuit
+        elif kind == 'circuitterminations':
+            for key in keys:
+                self._circuit_terminations[key] = []
+            for termination in CircuitTermination.objects.filter(circuit_id__in=keys):
+                self._circuit_terminations[termination.circuit_id].append(termination)
+
+        # Termination objects of a particular model
+        else:
+            cache = self._objects[kind]
+            cache.update(dict.fromkeys(keys))
+            cache.update(kind.objects.order_by().in_bulk(keys))
+
+    #
+    # Helpers
+    #
+
+    def _get_object_type_id(self, model):
+        if model not in self._object_type_ids:
+            self._object_type_ids[model] = ObjectType.objects.get_for_model(model).pk
+        return self._object_type_ids[model]
+
+    def _get_node(self, obj):
+        return compile_path_node(self._get_object_type_id(type(obj)), obj.pk)
+
+    @staticmethod
+    def _get_link(termination):
+        """
+        Return a (model, ID) tuple identifying the Cable or WirelessLink attached to a termination, if any.
+        """
+        if getattr(termination, 'cable_id', None):
+            return Cable, termination.cable_id
+        if getattr(termination, 'wireless_link_id', None):
+            return WirelessLink, termination.wireless_link_id
+        return None
+
+    @staticmethod
+    def _get_parent(termination):
+        """
+        Return a key identifying the parent object (Device or Circuit) of a mid-span termination.
+        """
+        return getattr(termination, 'device_id', None), getattr(termination, 'circuit_id', None)
+
+    def _get_remote_cable_terminations(self, terminations, cable_ids):
+        """
+        Return the termination objects attached to the far end(s) of the given cables, relative to the specified
+        near-end terminations.
+        """
+        cable_terminations = dict(zip(cable_ids, self._lookup(self._cable_terminations, 'cableterminations', cable_ids)))
+        local_keys = {(self._get_object_type_id(type(t)), t.pk) for t in terminations}
+
+        # Identify the far end of each cable attached to a local termination
+        far_ends = set()
+        for cable_id, cts in cable_terminations.items():
+            for ct in cts:
+                if (ct.termination_type_id, ct.termination_id) in local_keys:
+                    far_end = CableEndChoices.SIDE_A if ct.cable_end == CableEndChoices.SIDE_B else CableEndChoices.SIDE_B
+                    far_ends.add((cable_id, far_end))
+
+        # Replicate the default ordering of CableTerminations (cable, cable_end, pk)
+        remote_cts = sorted(
+            [
+                ct for cable_id, cts in cable_terminations.items() for ct in cts
+                if (cable_id, ct.cable_end) in far_ends
+            ],
+            key=lambda ct: (ct.cable_id, ct.cable_end, ct.pk)
+        )
+
+        # Resolve the remote termination objects, grouped by type
+        object_ids = defaultdict(list)
+        for ct in remote_cts:
+            object_ids[ct.termination_type_id].append(ct.termination_id)
+        resolved = {}
+        missing = False
+        for object_type_id, pks in object_ids.items():
+            model = ObjectType.objects.get_for_id(object_type_id).model_class()
+            if self._require(self._objects[model], model, pks):
+                for pk in pks:
+                    resolved[(object_type_id, pk)] = self._objects[model][pk]
+            else:
+                missing = True
+        if missing:
+            raise MissingData()
+
+        return [resolved[(ct.termination_type_id, ct.termination_id)] for ct in remote_cts]
+
+    #
+    # Tracing
+    #
+
+    def _trace(self, terminations):
+        """
+        Trace a single path from the given terminations, returning an unsaved CablePath (or None). Raises MissingData
+        if any required data has not yet been loaded.
+        """
+        if not terminations:
+            return None
+
+        # Ensure all originating terminations are attached to the same link
+        if len(terminations) > 1:
+            assert all(self._get_link(t) == self._get_link(terminations[0]) for t in terminations[1:])
+
+        path = []
+        position_stack = []
+        is_complete = False
+        is_active = True
+        is_split = False
+
+        while terminations:
+
+            # Terminations must all be of the same type
+            assert all(isinstance(t, type(terminations[0])) for t in terminations[1:])
+
+            # All mid-span terminations must all be attached to the same device
+            if not isinstance(terminations[0], PathEndpoint):
+                assert all(self._get_parent(t) == self._get_parent(terminations[0]) for t in terminations[1:])
+
+            # Check for a split path (e.g. rear port fanning out to multiple front ports with
+            # different cables attached)
+            if len(set(self._get_link(t) for t in terminations)) > 1 and (
+                    position_stack and len(terminations) != len(position_stack[-1])
+            ):
+                is_split = True
+                break
+
+            # Step 1: Record the near-end termination object(s)
+            path.append([
+                self._get_node(t) for t in terminations
+            ])
+
+            # Step 2: Determine the attached links (Cable or WirelessLink), if any
+            links = [self._get_link(t) for t in terminations if self._get_link(t) is not None]
+            if len(links) == 0:
+                if len(path) == 1:
+                    # If this is the start of the path and no link exists, return None
+                    return None
+                # Otherwise, halt the trace if no link exists
+                break
+            link_model = links[0][0]
+            assert all(model is link_model for model, _ in links)
+
+            # Step 3: Record asymmetric paths as split
+            if len(links) < len(terminations):
+                is_complete = False
+                is_split = True
+
+            # Step 4: Record the links, keeping cables in order to allow for SVG rendering
+            link_ids = []
+            for _, link_id in links:
+                if link_id not in link_ids:
+                    link_ids.append(link_id)
+            path.append([
+                compile_path_node(self._get_object_type_id(link_model), link_id) for link_id in link_ids
+            ])
+
+            # Step 5: Update the path status if a link is not connected
+            if link_model is Cable:
+                # Cable terminations are needed for step 6; request them alongside the cables
+                self._require(self._cable_terminations, 'cableterminations', link_ids)
+                statuses = self._lookup(self._cables, 'cables', link_ids)
+            else:
+                wireless_links = self._lookup(self._wireless_links, 'wirelesslinks', link_ids)
+                statuses = [link.status for link in wireless_links if link is not None]
+            if any(status != LinkStatusChoices.STATUS_CONNECTED for status in statuses):
+                is_active = False
+
+            # Step 6: Determine the far-end terminations
+            if link_model is Cable:
+                remote_terminations = self._get_remote_cable_terminations(terminations, link_ids)
+            else:
+                # WirelessLink
+                remote_ids = [
+                    link.interface_b_id if link.interface_a_id == terminations[0].pk else link.interface_a_id
+                    for link in wireless_links if link is not None
+                ]
+                remote_model = WirelessLink._meta.get_field('interface_a').related_model
+                remote_terminations = self._get_objects(remote_model, remote_ids)
+
+            # Remote Terminations must all be of the same type, otherwise return a split path
+            if not all(isinstance(t, type(remote_terminations[0])) for t in remote_terminations[1:]):
+                is_complete = False
+                is_split = True
+                break
+
+            # Step 7: Record the far-end termination object(s)
+            path.append([
+                self._get_node(t) for t in remote_terminations if t is not None
+            ])
+
+            # Step 8: Determine the "next hop" terminations, if applicable
+            if not remote_terminations:
+                break
+
+            if isinstance(remote_terminations[0], FrontPort):
+                # Follow FrontPorts to their corresponding RearPorts
+                device_ids = list(dict.fromkeys(t.device_id for t in remote_terminations))
+                rear_port_ids = {t.rear_port_id for t in remote_terminations}
+                rear_ports = [
+                    rp for ports in self._lookup(self._rear_ports, 'rearports', device_ids) for rp in ports
+                    if rp.pk in rear_port_ids
+                ]
+                if len(rear_ports) > 1 or rear_ports[0].positions > 1:
+                    position_stack.append([fp.rear_port_position for fp in remote_terminations])
+
+                terminations = rear_ports
+
+            elif isinstance(remote_terminations[0], RearPort):
+                device_ids = list(dict.fromkeys(t.device_id for t in remote_terminations))
+                if len(remote_terminations) == 1 and remote_terminations[0].positions == 1:
+                    front_port_keys = {(remote_terminations[0].pk, 1)}
+                # Obtain the individual front ports based on the termination and all positions
+                elif len(remote_terminations) > 1 and position_stack:
+                    positions = position_stack.pop()
+
+                    # Ensure we have a number of positions equal to the amount of remote terminations
+                    assert len(remote_terminations) == len(positions)
+
+                    # Get our front ports
+                    front_port_keys = set()
+                    for rt in remote_terminations:
+                        position = positions.pop()
+                        front_port_keys.add((rt.pk, position))
+                    assert front_port_keys
+                # Obtain the individual front ports based on the termination and position
+                elif position_stack:
+                    front_port_keys = {
+                        (remote_terminations[0].pk, position) for position in position_stack.pop()
+                    }
+                else:
+                    # No position indicated: path has split, so we stop at the RearPorts
+                    is_split = True
+                    break
+
+                terminations = [
+                    fp for ports in self._lookup(self._front_ports, 'frontports', device_ids) for fp in ports
+                    if (fp.rear_port_id, fp.rear_port_position) in front_port_keys
+                ]
+
+            elif isinstance(remote_terminations[0], CircuitTermination):
+                # Follow a CircuitTermination to its corresponding CircuitTermination (A to Z or vice versa)
+                if len(remote_terminations) > 1:
+                    is_split = True
+                    break
+                term_side = 'Z' if remote_terminations[0].term_side == 'A' else 'A'
+                circuit_terminations, = self._lookup(
+                    self._circuit_terminations, 'circuitterminations', [remote_terminations[0].circuit_id]
+                )
+                circuit_termination = next(
+                    (ct for ct in circuit_terminations if ct.term_side == term_side), None
+                )
+                if circuit_termination is None:
+                    break
+                elif circuit_termination.provider_network_id:
+                    # Circuit terminates to a ProviderNetwork
+                    provider_network_model = CircuitTermination._meta.get_field('provider_network').related_model
+                    path.extend([
+                        [self._get_node(circuit_termination)],
+                        [compile_path_node(
+                            self._get_object_type_id(provider_network_model),
+                            circuit_termination.provider_network_id
+                        )],
+                    ])
+                    is_complete = True
+                    break
+                elif circuit_termination.site_id and not circuit_termination.cable_id:
+                    # Circuit terminates to a Site
+                    site_model = CircuitTermination._meta.get_field('site').related_model
+                    path.extend([
+                        [self._get_node(circuit_termination)],
+                        [compile_path_node(self._get_object_type_id(site_model), circuit_termination.site_id)],
+                    ])
+                    break
+
+                terminations = [circuit_termination]
+
+            else:
+                # Check for non-symmetric path
+                if all(isinstance(t, type(remote_terminations[0])) for t in remote_terminations[1:]):
+                    is_complete = True
+                elif len(remote_terminations) == 0:
+                    is_complete = False
+                else:
+                    # Unsupported topology, mark as split and exit
+                    is_complete = False
+                    is_split = True
+                break
+
+        return CablePath(
+            path=path,
+            is_complete=is_complete,
+            is_active=is_active,
+            is_split=is_split
+        )
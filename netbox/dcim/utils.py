@@ -1,7 +1,12 @@
 import itertools
+import logging
+from collections import defaultdict
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.db.models import Case, Q, Value, When
+
+from .constants import PATH_NODE_CT_ID_MAX, PATH_NODE_OBJECT_ID_BITS, PATH_NODE_OBJECT_ID_MASK
 
 
 def compile_path_node(ct_id, object_id):
@@ -13,6 +18,31 @@ def decompile_path_node(repr):
     return int(ct_id), int(object_id)
 
 
+def pack_path_node(ct_id, object_id):
+    """
+    Pack a ContentType ID and object ID into a single integer, as stored in CablePath._nodes.
+    """
+    if not 0 < ct_id <= PATH_NODE_CT_ID_MAX:
+        raise ValueError(f"ContentType ID {ct_id} cannot be represented in a packed path node")
+    if not 0 < object_id <= PATH_NODE_OBJECT_ID_MASK:
+        raise ValueError(f"Object ID {object_id} cannot be represented in a packed path node")
+    return ct_id << PATH_NODE_OBJECT_ID_BITS | object_id
+
+
+def unpack_path_node(value):
+    """
+    Return the ContentType ID and object ID encoded in a packed path node.
+    """
+    return value >> PATH_NODE_OBJECT_ID_BITS, value & PATH_NODE_OBJECT_ID_MASK
+
+
+def pack_path(path):
+    """
+    Return a flattened list of packed nodes from a CablePath path.
+    """
+    return [pack_path_node(*decompile_path_node(node)) for node in itertools.chain(*path)]
+
+
 def object_to_path_node(obj):
     """
     Return a representation of an object suitable for inclusion in a CablePath path. Node representation is in the
@@ -22,6 +52,14 @@ def object_to_path_node(obj):
     return compile_path_node(ct.pk, obj.pk)
 
 
+def object_to_packed_path_node(obj):
+    """
+    Return the packed integer representation of an object, suitable for matching against CablePath._nodes.
+    """
+    ct = ContentType.objects.get_for_model(obj)
+    return pack_path_node(ct.pk, obj.pk)
+
+
 def path_node_to_object(repr):
     """
     Given the string representation of a path node, return the corresponding instance. If the object no longer
@@ -38,23 +76,154 @@ def create_cablepath(terminations):
 
     :param terminations: Iterable of CableTermination objects
     """
+    create_cablepaths([terminations])
+
+
+def create_cablepaths(origins):
+    """
+    Create CablePaths for all paths originating from each of the specified sets of nodes. All paths are traced together
+    and saved in bulk. Returns the list of created CablePaths.
+
+    :param origins: Iterable of lists of CableTermination objects
+    """
+    from dcim.tracing import CablePathTracer
+
+    cable_paths = [cp for cp in CablePathTracer().trace(origins) if cp is not None]
+    save_cablepaths(cable_paths)
+
+    return cable_paths
+
+
+def save_cablepaths(cable_paths, batch_size=1000):
+    """
+    Save the given CablePaths in bulk, and record a reference to each path on its originating object(s). This is
+    equivalent to calling save() on each path individually.
+
+    :param cable_paths: Iterable of new and/or existing CablePath instances
+    :param batch_size: Maximum number of objects to create or update in a single query
+    """
     from dcim.models import CablePath
 
-    cp = CablePath.from_origin(terminations)
-    if cp:
-        cp.save()
+    new_paths = []
+    existing_paths = []
+    for cp in cable_paths:
+        cp._nodes = pack_path(cp.path)
+        if cp.pk is None:
+            new_paths.append(cp)
+        else:
+            existing_paths.append(cp)
+    CablePath.objects.bulk_create(new_paths, batch_size=batch_size)
+    CablePath.objects.bulk_update(
+        existing_paths,
+        fields=('path', 'is_active', 'is_complete', 'is_split', '_nodes'),
+        batch_size=batch_size
+    )
+
+    # Map the ID of each originating object to its CablePath, organized by object type
+    origin_paths = defaultdict(dict)
+    for cp in cable_paths:
+        for node in cp._nodes[:len(cp.path[0])]:
+            ct_id, object_id = unpack_path_node(node)
+            origin_paths[ct_id][object_id] = cp.pk
+
+    # Record a direct reference to each CablePath on its originating object(s)
+    for ct_id, path_ids in origin_paths.items():
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        field = model._meta.get_field('_path')
+        path_ids = list(path_ids.items())
+        for i in range(0, len(path_ids), batch_size):
+            batch = path_ids[i:i + batch_size]
+            model.objects.filter(pk__in=[pk for pk, _ in batch]).update(_path=Case(
+                *[When(pk=pk, then=Value(path_id, output_field=field)) for pk, path_id in batch],
+                output_field=field
+            ))
+
+
+def retrace_cablepaths(cable_paths):
+    """
+    Retrace the given CablePaths from their originating objects and update them in place, preserving their primary
+    keys. Paths whose recomputed nodes and status are unchanged are not written to the database, and paths which no
+    longer originate from a connected object are deleted.
+
+    Returns a dictionary reporting the number of paths which were updated, unchanged, or deleted.
+
+    :param cable_paths: Iterable of existing CablePath instances
+    """
+    from dcim.models import CablePath
+    from dcim.tracing import CablePathTracer
+
+    cable_paths = list(cable_paths)
+    results = {
+        'updated': 0,
+        'unchanged': 0,
+        'deleted': 0,
+    }
+    if not cable_paths:
+        return results
+
+    # Resolve the originating objects of each path, using one query per object type
+    origin_ids = defaultdict(set)
+    for cp in cable_paths:
+        for node in cp._nodes[:len(cp.path[0])]:
+            ct_id, object_id = unpack_path_node(node)
+            origin_ids[ct_id].add(object_id)
+    origin_objects = {
+        ct_id: ContentType.objects.get_for_id(ct_id).model_class().objects.in_bulk(object_ids)
+        for ct_id, object_ids in origin_ids.items()
+    }
+    origins = []
+    for cp in cable_paths:
+        origins.append([
+            origin_objects[ct_id][object_id]
+            for ct_id, object_id in map(unpack_path_node, cp._nodes[:len(cp.path[0])])
+            # Ignore stale (deleted) objects
+            if object_id in origin_objects[ct_id]
+        ])
+
+    # Compare each retraced path with its current state
+    updated_paths = []
+    deleted_path_ids = []
+    for cp, new_path in zip(cable_paths, CablePathTracer().trace(origins)):
+        if new_path is None:
+            deleted_path_ids.append(cp.pk)
+            continue
+        attrs = ('path', 'is_active', 'is_complete', 'is_split')
+        if all(getattr(cp, attr) == getattr(new_path, attr) for attr in attrs):
+            results['unchanged'] += 1
+            continue
+        for attr in attrs:
+            setattr(cp, attr, getattr(new_path, attr))
+        updated_paths.append(cp)
+
+    with transaction.atomic():
+        if deleted_path_ids:
+            CablePath.objects.filter(pk__in=deleted_path_ids).delete()
+        save_cablepaths(updated_paths)
+    results['updated'] = len(updated_paths)
+    results['deleted'] = len(deleted_path_ids)
+
+    return results
 
 
 def rebuild_paths(terminations):
     """
-    Rebuild all CablePaths which traverse the specified nodes.
+    Rebuild all CablePaths which traverse the specified nodes. Returns a dictionary reporting the number of paths which
+    were updated, unchanged, or deleted.
     """
     from dcim.models import CablePath
 
+    logger = logging.getLogger('netbox.dcim.cable')
+
+    query = Q()
     for obj in terminations:
-        cable_paths = CablePath.objects.filter(_nodes__contains=obj)
+        query |= Q(_nodes__contains=obj)
+    if not query:
+        return retrace_cablepaths([])
+
+    results = retrace_cablepaths(CablePath.objects.filter(query))
+    logger.debug(
+        f"Rebuilt cable paths: {results['updated']} updated, {results['unchanged']} unchanged, "
+        f"{results['deleted']} deleted"
+    )
 
-        with transaction.atomic():
-            for cp in cable_paths:
-                cp.delete()
-                create_cablepath(cp.origins)
+    return results
@@ -1,12 +1,13 @@
+from django.db.models import Manager
 from django.utils.translation import gettext as _
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import Field
-from rest_framework.serializers import ValidationError
+from rest_framework.serializers import ListSerializer, ValidationError
 
-from core.models import ObjectType
 from extras.choices import CustomFieldTypeChoices
 from extras.constants import CUSTOMFIELD_EMPTY_VALUES
+from extras.customfields import custom_field_cache
 from extras.models import CustomField
 from utilities.api import get_serializer_for_model
 
@@ -25,8 +26,7 @@ class CustomFieldDefaultValues:
         self.model = serializer_field.parent.Meta.model
 
         # Retrieve the CustomFields for the parent model
-        object_type = ObjectType.objects.get_for_model(self.model)
-        fields = CustomField.objects.filter(object_types=object_type)
+        fields = custom_field_cache.get_for_model(self.model)
 
         # Populate the default value for each CustomField
         value = {}
@@ -47,16 +47,35 @@ class CustomFieldsDataField(Field):
         Cache CustomFields assigned to this model to avoid redundant database queries
         """
         if not hasattr(self, '_custom_fields'):
-            object_type = ObjectType.objects.get_for_model(self.parent.Meta.model)
-            self._custom_fields = CustomField.objects.filter(object_types=object_type)
+            self._custom_fields = custom_field_cache.get_for_model(self.parent.Meta.model)
         return self._custom_fields
 
+    def _get_related_objects(self):
+        """
+        Retrieve the objects referenced by object and multi-object custom fields for all instances being serialized
+        together (e.g. a page of results), so that each need not be queried individually.
+        """
+        list_serializer = self.parent.parent
+        if not isinstance(list_serializer, ListSerializer):
+            return None
+        instances = list_serializer.instance
+        if instances is None or isinstance(instances, Manager):
+            return None
+        if getattr(self, '_related_objects_for', None) is not instances:
+            self._related_objects_for = instances
+            self._related_objects = CustomField.objects.get_related_objects(
+                self._get_custom_fields(),
+                [instance.custom_field_data for instance in instances]
+            )
+        return self._related_objects
+
     def to_representation(self, obj):
         # TODO: Fix circular import
         from utilities.api import get_serializer_for_model
         data = {}
+        related_objects = self._get_related_objects()
         for cf in self._get_custom_fields():
-            value = cf.deserialize(obj.get(cf.name))
+            value = cf.deserialize(obj.get(cf.name), related_objects)
             if value is not None and cf.type == CustomFieldTypeChoices.TYPE_OBJECT:
                 serializer = get_serializer_for_model(cf.related_object_type.model_class())
                 value = serializer(value, nested=True, context=self.parent.context).data
@@ -1,9 +1,19 @@
+import json
+import os
+
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext as _
 from jinja2.exceptions import TemplateError
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
+from core.api.serializers import JobSerializer
+from extras.configcontexts import config_context_resolver
+from extras.configtemplates import render_configs
+from extras.jobs import RenderConfigsJob
 from netbox.api.renderers import TextRenderer
 from .serializers import ConfigTemplateSerializer
 
@@ -17,23 +27,25 @@ __all__ = (
 class ConfigContextQuerySetMixin:
     """
     Used by views that work with config context models (device and virtual machine).
-    Provides a get_queryset() method which deals with adding the config context
-    data annotation or not.
+    Resolves the config context data for all objects being serialized in bulk (unless
+    config context data has been excluded from the response).
     """
-    def get_queryset(self):
+    def get_serializer(self, *args, **kwargs):
         """
-        Build the proper queryset based on the request context
-
-        If the `brief` query param equates to True or the `exclude` query param
-        includes `config_context` as a value, return the base queryset.
+        If the `brief` query param equates to True or the `exclude` query param includes
+        `config_context` as a value, return the serializer unaltered.
 
-        Else, return the queryset annotated with config context data
+        Else, attach the config context data to each object prior to serialization
         """
-        queryset = super().get_queryset()
         request = self.get_serializer_context()['request']
-        if self.brief or 'config_context' in request.query_params.get('exclude', []):
-            return queryset
-        return queryset.annotate_config_context_data()
+        if (
+            kwargs.get('many') and args and 'data' not in kwargs and not self.brief and
+            'config_context' not in request.query_params.get('exclude', [])
+        ):
+            instances = list(args[0])
+            config_context_resolver.annotate(instances)
+            args = (instances, *args[1:])
+        return super().get_serializer(*args, **kwargs)
 
 
 class ConfigTemplateRenderMixin:
@@ -62,7 +74,8 @@ class ConfigTemplateRenderMixin:
 
 class RenderConfigMixin(ConfigTemplateRenderMixin):
     """
-    Provides a /render-config/ endpoint for REST API views whose model may have a ConfigTemplate assigned.
+    Provides /render-config/ and /render-configs/ endpoints for REST API views whose model may have a ConfigTemplate
+    assigned.
     """
     @action(detail=True, methods=['post'], url_path='render-config', renderer_classes=[JSONRenderer, TextRenderer])
     def render_config(self, request, pk):
@@ -83,3 +96,45 @@ class RenderConfigMixin(ConfigTemplateRenderMixin):
         context_data.update({object_type: instance})
 
         return self.render_configtemplate(request, configtemplate, context_data)
+
+    @action(detail=False, methods=['post'], url_path='render-configs', renderer_classes=[JSONRenderer])
+    def render_configs(self, request):
+        """
+        Resolve and render the preferred ConfigTemplate for all objects matching the given filters. Rendered
+        configurations are streamed as newline-delimited JSON, one object per line. If `background` is true, rendering
+        is instead performed by a background job, which saves the results to file storage as a tarball.
+        """
+        context = request.data.get('context') or {}
+        if not isinstance(context, dict):
+            raise ValidationError({'context': _("Context data must be a dictionary.")})
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if not request.data.get('background'):
+            def stream():
+                for result in render_configs(queryset, context):
+                    yield json.dumps(result) + '\n'
+            return StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+
+        # Enqueue a job to render the configurations and save them to file storage
+        max_workers = os.cpu_count() or 1
+        try:
+            workers = int(request.data.get('workers', 1))
+        except (TypeError, ValueError):
+            workers = None
+        if workers is None or not 1 <= workers <= max_workers:
+            raise ValidationError({
+                'workers': _("Workers must be an integer between 1 and {max}.").format(max=max_workers)
+            })
+        model = queryset.model
+        filename = os.path.basename(request.data.get('filename') or '') or f'{model._meta.model_name}-configs.tar.gz'
+        job = RenderConfigsJob.enqueue(
+            user=request.user,
+            model=model._meta.label_lower,
+            pks=list(queryset.values_list('pk', flat=True)),
+            filename=filename,
+            context=context,
+            workers=workers
+        )
+        serializer = JobSerializer(job, context={'request': request})
+
+        return Response(serializer.data)
@@ -1,4 +1,3 @@
-import functools
 import re
 from django.utils.translation import gettext as _
 
@@ -64,18 +63,25 @@ class Condition:
         self.eval_func = getattr(self, f'eval_{op}')
         self.negate = negate
 
+        # Pre-split the attribute path and compile any regular expression
+        self.path = attr.split('.')
+        if op == self.REGEX:
+            try:
+                self.pattern = re.compile(value)
+            except re.error as e:
+                raise ValueError(_("Invalid regular expression: {value}").format(value=e))
+
     def eval(self, data):
         """
         Evaluate the provided data to determine whether it matches the condition.
         """
-        def _get(obj, key):
-            if isinstance(obj, list):
-                return [dict.get(i, key) for i in obj]
-
-            return dict.get(obj, key)
-
+        value = data
         try:
-            value = functools.reduce(_get, self.attr.split('.'), data)
+            for key in self.path:
+                if isinstance(value, list):
+                    value = [dict.get(i, key) for i in value]
+                else:
+                    value = dict.get(value, key)
         except TypeError:
             # Invalid key path
             value = None
@@ -118,7 +124,7 @@ class Condition:
     # Regular expressions
 
     def eval_regex(self, value):
-        return re.match(self.value, value) is not None
+        return self.pattern.match(value) is not None
 
 
 class ConditionSet:
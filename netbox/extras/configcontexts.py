@@ -0,0 +1,182 @@
+import json
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from utilities.caching import VersionedCache
+
+__all__ = (
+    'ConfigContextResolver',
+    'config_context_resolver',
+)
+
+# ConfigContext fields by which assignment to an object may be restricted
+ASSIGNMENT_FIELDS = (
+    'regions', 'site_groups', 'sites', 'locations', 'device_types', 'roles', 'platforms', 'cluster_types',
+    'cluster_groups', 'clusters', 'tenant_groups', 'tenants', 'tags',
+)
+
+
+class ConfigContextResolver(VersionedCache):
+    """
+    Resolve the ConfigContexts which apply to devices and virtual machines in memory. All active ConfigContexts and
+    their assignments are loaded once and held until they are invalidated (either locally, or by another process via
+    the cache). Assignments to regions and site groups are expanded to include all of their descendants, so that each
+    object can be matched against a context using simple set membership.
+    """
+    # Cache key holding a token which changes whenever any process modifies config context assignments
+    cache_key = 'config_context_version'
+
+    @staticmethod
+    def _get_descendants(pks, children):
+        """
+        Expand the given set of primary keys to include the primary keys of all descendant objects.
+        """
+        descendants = set()
+        queue = list(pks)
+        while queue:
+            pk = queue.pop()
+            if pk not in descendants:
+                descendants.add(pk)
+                queue.extend(children[pk])
+        return descendants
+
+    def load(self):
+        from dcim.models import Region, SiteGroup
+        from extras.models import ConfigContext
+
+        contexts = {
+            pk: (json.dumps(data), {})
+            for pk, data in ConfigContext.objects.filter(is_active=True).order_by('weight', 'name').values_list(
+                'pk', 'data'
+            )
+        }
+
+        # Retrieve all assignments for each field in a single query
+        for field_name in ASSIGNMENT_FIELDS:
+            field = ConfigContext._meta.get_field(field_name)
+            source_field = field.m2m_field_name()
+            target_field = field.m2m_reverse_field_name()
+            assignments = field.remote_field.through.objects.filter(
+                **{f'{source_field}__in': list(contexts)}
+            ).values_list(f'{source_field}_id', f'{target_field}_id')
+            for context_id, target_id in assignments:
+                contexts[context_id][1].setdefault(field_name, set()).add(target_id)
+
+        # Extend region and site group assignments to all child regions/groups
+        for field_name, model in (('regions', Region), ('site_groups', SiteGroup)):
+            if any(field_name in assignments for _, assignments in contexts.values()):
+                children = defaultdict(list)
+                for pk, parent_id in model.objects.values_list('pk', 'parent_id'):
+                    children[parent_id].append(pk)
+                for _, assignments in contexts.values():
+                    if field_name in assignments:
+                        assignments[field_name] = self._get_descendants(assignments[field_name], children)
+
+        contexts = tuple(
+            (data, {field_name: frozenset(pks) for field_name, pks in assignments.items()})
+            for data, assignments in contexts.values()
+        )
+        fields = frozenset(field_name for _, assignments in contexts for field_name in assignments)
+
+        return contexts, fields
+
+    @staticmethod
+    def _get_object_values(objects, fields):
+        """
+        Return a list of dictionaries mapping each assignment field to the relevant value(s) for each object. Related
+        values are retrieved only for the given assignment fields.
+        """
+        from dcim.models import Site
+        from extras.models import TaggedItem
+        from tenancy.models import Tenant
+        from virtualization.models import Cluster
+
+        sites = {}
+        if fields & {'regions', 'site_groups'}:
+            site_ids = {obj.site_id for obj in objects if obj.site_id}
+            sites = {
+                pk: (region_id, group_id)
+                for pk, region_id, group_id in Site.objects.filter(pk__in=site_ids).values_list(
+                    'pk', 'region_id', 'group_id'
+                )
+            }
+        clusters = {}
+        if fields & {'cluster_types', 'cluster_groups'}:
+            cluster_ids = {obj.cluster_id for obj in objects if obj.cluster_id}
+            clusters = {
+                pk: (type_id, group_id)
+                for pk, type_id, group_id in Cluster.objects.filter(pk__in=cluster_ids).values_list(
+                    'pk', 'type_id', 'group_id'
+                )
+            }
+        tenants = {}
+        if 'tenant_groups' in fields:
+            tenant_ids = {obj.tenant_id for obj in objects if obj.tenant_id}
+            tenants = dict(Tenant.objects.filter(pk__in=tenant_ids).values_list('pk', 'group_id'))
+        tags = defaultdict(set)
+        if 'tags' in fields:
+            tagged_items = TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(objects[0]),
+                object_id__in=[obj.pk for obj in objects]
+            ).values_list('object_id', 'tag_id')
+            for object_id, tag_id in tagged_items:
+                tags[object_id].add(tag_id)
+
+        values = []
+        for obj in objects:
+            region_id, sitegroup_id = sites.get(obj.site_id, (None, None))
+            cluster_type_id, cluster_group_id = clusters.get(obj.cluster_id, (None, None))
+            values.append({
+                'regions': region_id,
+                'site_groups': sitegroup_id,
+                'sites': obj.site_id,
+                'locations': getattr(obj, 'location_id', None),
+                'device_types': getattr(obj, 'device_type_id', None),
+                'roles': obj.role_id,
+                'platforms': obj.platform_id,
+                'cluster_types': cluster_type_id,
+                'cluster_groups': cluster_group_id,
+                'clusters': obj.cluster_id,
+                'tenant_groups': tenants.get(obj.tenant_id),
+                'tenants': obj.tenant_id,
+                'tags': tags[obj.pk],
+            })
+
+        return values
+
+    def get_config_context_data(self, objects):
+        """
+        Return a list of the data of all ConfigContexts (ordered by weight and name) which apply to each of the given
+        devices or virtual machines.
+        """
+        if not objects:
+            return []
+        contexts, fields = self.get()
+
+        results = []
+        for values in self._get_object_values(objects, fields):
+            data = []
+            for context_data, assignments in contexts:
+                for field_name, pks in assignments.items():
+                    if field_name == 'tags':
+                        if pks.isdisjoint(values['tags']):
+                            break
+                    elif values[field_name] not in pks:
+                        break
+                else:
+                    data.append(json.loads(context_data))
+            results.append(data)
+
+        return results
+
+    def annotate(self, objects):
+        """
+        Attach the applicable ConfigContext data to each of the given objects as `config_context_data` (equivalent to
+        ConfigContextModelQuerySet.annotate_config_context_data()).
+        """
+        for obj, data in zip(objects, self.get_config_context_data(objects)):
+            obj.config_context_data = data
+
+
+config_context_resolver = ConfigContextResolver()
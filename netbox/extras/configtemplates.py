@@ -0,0 +1,151 @@
+import io
+import json
+import multiprocessing
+import tarfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.db import connections
+from jinja2.exceptions import TemplateError
+
+from extras.configcontexts import config_context_resolver
+
+__all__ = (
+    'render_config_batch',
+    'render_configs',
+    'write_configs_tarball',
+)
+
+# Number of objects to load and render together
+BATCH_SIZE = 500
+
+# Related objects to retrieve along with each object, by model
+RELATED_OBJECTS = {
+    'dcim.device': {
+        'select_related': (
+            'config_template', 'role__config_template', 'platform__config_template', 'site', 'location', 'rack',
+            'tenant', 'primary_ip4', 'primary_ip6', 'oob_ip',
+        ),
+        'prefetch_related': ('interfaces', 'tags'),
+    },
+    'virtualization.virtualmachine': {
+        'select_related': (
+            'config_template', 'role__config_template', 'platform__config_template', 'site', 'cluster', 'tenant',
+            'primary_ip4', 'primary_ip6',
+        ),
+        'prefetch_related': ('interfaces', 'tags'),
+    },
+}
+
+
+def render_config_batch(model_label, pks, context=None):
+    """
+    Render the preferred ConfigTemplate for each of the specified devices or virtual machines. The objects are retrieved
+    (along with their config context data) in bulk, and each ConfigTemplate is compiled only once. Returns a list of
+    dictionaries, each containing the object's ID and name along with either the rendered content or an error.
+
+    Args:
+        model_label: The label of the model (e.g. "dcim.device")
+        pks: An iterable of primary keys
+        context: Additional context data with which to render each template (optional)
+    """
+    model = apps.get_model(model_label)
+    object_type = model._meta.model_name
+    related_objects = RELATED_OBJECTS.get(model._meta.label_lower, {})
+    instances = list(
+        model.objects.filter(pk__in=pks).select_related(
+            *related_objects.get('select_related', ())
+        ).prefetch_related(
+            *related_objects.get('prefetch_related', ())
+        ).order_by('pk')
+    )
+    config_context_resolver.annotate(instances)
+
+    results = []
+    configtemplates = {}
+    for instance in instances:
+        result = {
+            'id': instance.pk,
+            'name': str(instance),
+        }
+        results.append(result)
+
+        if (configtemplate := instance.get_config_template()) is None:
+            result['error'] = f'No config template found for this {object_type}.'
+            continue
+        # Share a single instance of each ConfigTemplate among all objects
+        configtemplate = configtemplates.setdefault(configtemplate.pk, configtemplate)
+        result['configtemplate'] = configtemplate.pk
+
+        context_data = instance.get_config_context()
+        context_data.update(context or {})
+        context_data.update({object_type: instance})
+        try:
+            result['content'] = configtemplate.render(context=context_data)
+        except TemplateError as e:
+            result['error'] = f"An error occurred while rendering the template (line {e.lineno}): {e}"
+
+    return results
+
+
+def render_configs(queryset, context=None, batch_size=BATCH_SIZE, workers=1):
+    """
+    Render the preferred ConfigTemplate for all devices or virtual machines in the given QuerySet, yielding the result
+    for each object (see render_config_batch()). Objects are rendered in batches, which may be distributed among a pool
+    of worker processes. Results are yielded as each batch completes.
+
+    Args:
+        queryset: A QuerySet of devices or virtual machines
+        context: Additional context data with which to render each template (optional)
+        batch_size: The number of objects to render per batch
+        workers: The number of worker processes among which to divide rendering
+    """
+    model_label = queryset.model._meta.label_lower
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    batches = [pks[i:i + batch_size] for i in range(0, len(pks), batch_size)]
+
+    if workers < 2:
+        for batch in batches:
+            yield from render_config_batch(model_label, batch, context)
+        return
+
+    # Close all database connections prior to forking so that none are shared with the worker processes
+    connections.close_all()
+    mp_context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        futures = [executor.submit(render_config_batch, model_label, batch, context) for batch in batches]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def write_configs_tarball(results, fileobj):
+    """
+    Write the given rendering results to a gzipped tarball. Each rendered configuration is written to a file named for
+    its object; any errors are recorded in errors.json. Returns a tuple of the number of configurations written and a
+    dictionary mapping object names to errors.
+    """
+    count = 0
+    errors = {}
+    with tarfile.open(fileobj=fileobj, mode='w:gz') as tarball:
+
+        def add_file(name, content):
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tarball.addfile(info, io.BytesIO(data))
+
+        for result in results:
+            if 'error' in result:
+                errors[result['name']] = result['error']
+            else:
+                add_file(f"{result['name'].replace('/', '_')}-{result['id']}.txt", result['content'])
+                count += 1
+        if errors:
+            add_file('errors.json', json.dumps(errors, indent=4))
+
+    return count, errors
@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from core.models import ObjectType
+from utilities.caching import VersionedCache
+
+__all__ = (
+    'CustomFieldCache',
+    'custom_field_cache',
+)
+
+
+class CustomFieldCache(VersionedCache):
+    """
+    Hold the CustomFields assigned to each object type in memory. All CustomFields are loaded at once and held until
+    they are invalidated (either locally, or by another process via the cache). The CustomField instances returned are
+    shared and must not be modified.
+    """
+    # Cache key holding a token which changes whenever any process modifies a CustomField
+    cache_key = 'custom_field_version'
+
+    def load(self):
+        from extras.models import CustomField
+
+        custom_fields = defaultdict(list)
+        for cf in CustomField.objects.select_related('choice_set', 'related_object_type').prefetch_related(
+            'object_types'
+        ):
+            for object_type in cf.object_types.all():
+                custom_fields[object_type.pk].append(cf)
+
+        return {
+            object_type_id: tuple(cfs) for object_type_id, cfs in custom_fields.items()
+        }
+
+    def get_for_model(self, model):
+        """
+        Return a tuple of all CustomFields assigned to the given model (or instance), in their default ordering.
+        """
+        object_type = ObjectType.objects.get_for_model(model._meta.concrete_model)
+        return self.get().get(object_type.pk, ())
+
+
+custom_field_cache = CustomFieldCache()
@@ -0,0 +1,70 @@
+import copy
+from collections import defaultdict
+
+from extras.conditions import ConditionSet
+from utilities.caching import VersionedCache
+
+__all__ = (
+    'EventRuleCache',
+    'event_rule_cache',
+)
+
+
+class EventRuleCache(VersionedCache):
+    """
+    Hold all enabled EventRules in memory, indexed by event type and object type, with their conditions compiled in
+    advance. EventRules are loaded at once and held until they are invalidated (either locally, or by another process
+    via the cache).
+    """
+    # Cache key holding a token which changes whenever any process modifies an EventRule
+    cache_key = 'event_rule_version'
+
+    def load(self):
+        from extras.models import EventRule
+
+        event_rules = {
+            event_rule.pk: event_rule for event_rule in EventRule.objects.filter(enabled=True)
+        }
+        for event_rule in event_rules.values():
+            if event_rule.conditions:
+                try:
+                    event_rule._condition_set = ConditionSet(event_rule.conditions)
+                except (TypeError, ValueError):
+                    # Leave invalid conditions to raise an exception upon evaluation
+                    pass
+
+        # Index EventRules by event type & object type, retaining their default ordering
+        object_types = defaultdict(list)
+        for event_rule_id, object_type_id in EventRule.object_types.through.objects.filter(
+            eventrule_id__in=event_rules
+        ).values_list('eventrule_id', 'objecttype_id'):
+            object_types[event_rule_id].append(object_type_id)
+        indexed_rules = defaultdict(list)
+        for event_rule in event_rules.values():
+            for event_type in event_rule.event_types:
+                for object_type_id in object_types[event_rule.pk]:
+                    indexed_rules[(event_type, object_type_id)].append(event_rule)
+
+        return dict(indexed_rules)
+
+    def has_event_rules(self, event_type, object_type):
+        """
+        Return True if any enabled EventRule applies to the given event type and object type.
+        """
+        if object_type is None:
+            return False
+        return bool(self.get().get((event_type, object_type.pk)))
+
+    def get_event_rules(self, event_type, object_type):
+        """
+        Return a list of all enabled EventRules which apply to the given event type and object type. Each EventRule
+        returned is a copy, and may be modified (e.g. by caching its action object) without affecting the cache.
+        """
+        if object_type is None:
+            return []
+        return [
+            copy.copy(event_rule) for event_rule in self.get().get((event_type, object_type.pk), ())
+        ]
+
+
+event_rule_cache = EventRuleCache()
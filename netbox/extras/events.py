@@ -17,10 +17,14 @@ from utilities.api import get_serializer_for_model
 from utilities.rqworker import get_rq_retry
 from utilities.serialization import serialize_object
 from .choices import EventRuleActionChoices
-from .models import EventRule
+from .eventrules import event_rule_cache
 
 logger = logging.getLogger('netbox.events_processor')
 
+DEFAULT_EVENTS_PIPELINE = (
+    'extras.events.process_event_queue',
+)
+
 
 def serialize_for_event(instance):
     """
@@ -50,10 +54,21 @@ def get_snapshots(instance, event_type):
     return snapshots
 
 
+def has_event_rules(event_type, object_type):
+    """
+    Return True if an event of the given type for the given object type might be acted upon. This is always the case
+    when a custom events pipeline has been configured; otherwise, only if an enabled EventRule applies to it.
+    """
+    if tuple(settings.EVENTS_PIPELINE) != DEFAULT_EVENTS_PIPELINE:
+        return True
+    return event_rule_cache.has_event_rules(event_type, object_type)
+
+
 def enqueue_event(queue, instance, user, request_id, event_type):
     """
-    Enqueue a serialized representation of a created/updated/deleted object for the processing of
-    events once the request has completed.
+    Enqueue a created/updated/deleted object for the processing of events once the request has completed. To avoid
+    serializing an object which is saved repeatedly, serialization is deferred until the queue is flushed (see
+    serialize_events()), except for objects being deleted.
     """
     # Determine whether this type of object supports event rules
     app_label = instance._meta.app_label
@@ -64,8 +79,7 @@ def enqueue_event(queue, instance, user, request_id, event_type):
     assert instance.pk is not None
     key = f'{app_label}.{model_name}:{instance.pk}'
     if key in queue:
-        queue[key]['data'] = serialize_for_event(instance)
-        queue[key]['snapshots']['postchange'] = get_snapshots(instance, event_type)['postchange']
+        queue[key]['instance'] = instance
         # If the object is being deleted, update any prior "update" event to "delete"
         if event_type == OBJECT_DELETED:
             queue[key]['event_type'] = event_type
@@ -74,14 +88,60 @@ def enqueue_event(queue, instance, user, request_id, event_type):
             'object_type': ContentType.objects.get_for_model(instance),
             'object_id': instance.pk,
             'event_type': event_type,
-            'data': serialize_for_event(instance),
-            'snapshots': get_snapshots(instance, event_type),
+            'instance': instance,
+            'data': None,
+            'snapshots': {
+                'prechange': getattr(instance, '_prechange_snapshot', None),
+                'postchange': None,
+            },
             'username': user.username,
             'request_id': request_id
         }
 
+    # An object being deleted must be serialized immediately (if the event might be acted upon)
+    if event_type == OBJECT_DELETED:
+        event = queue[key]
+        del event['instance']
+        event['snapshots']['postchange'] = None
+        if has_event_rules(event_type, event['object_type']):
+            event['data'] = serialize_for_event(instance)
+
+
+def serialize_events(events):
+    """
+    Complete the serialization of queued events, returning those which might be acted upon. When no custom events
+    pipeline has been configured, events to which no enabled EventRules apply are discarded without being serialized.
+
+    Serialization typically takes place once the changes have been committed, so an event which fails to serialize is
+    logged and discarded rather than raising an exception (which would cause all other queued events to be lost).
+    """
+    serialized_events = []
+    for event in events:
+        if not ('instance' in event or event['data'] is not None) or not has_event_rules(
+            event['event_type'], event['object_type']
+        ):
+            continue
+        if (instance := event.pop('instance', None)) is not None:
+            try:
+                event['data'] = serialize_for_event(instance)
+                event['snapshots']['postchange'] = get_snapshots(instance, event['event_type'])['postchange']
+            except Exception as e:
+                logger.exception(
+                    f"Failed to serialize {event['event_type']} event for {event['object_type']} "
+                    f"{event['object_id']}: {e}"
+                )
+                continue
+        serialized_events.append(event)
+
+    return serialized_events
 
-def process_event_rules(event_rules, object_type, event_type, data, username=None, snapshots=None, request_id=None):
+
+def process_event_rules(event_rules, object_type, event_type, data, username=None, snapshots=None, request_id=None,
+                        webhook_deliveries=None):
+    """
+    Perform the actions of each applicable EventRule for an event. If a list is passed as `webhook_deliveries`,
+    webhooks are appended to it for batched delivery rather than being queued individually.
+    """
     user = User.objects.get(username=username) if username else None
 
     for event_rule in event_rules:
@@ -113,6 +173,12 @@ def process_event_rules(event_rules, object_type, event_type, data, username=Non
             if request_id:
                 params["request_id"] = request_id
 
+            # Defer the webhook for batched delivery
+            if webhook_deliveries is not None:
+                del params["retry"]
+                webhook_deliveries.append(params)
+                continue
+
             # Enqueue the task
             rq_queue.enqueue(
                 "extras.webhooks.send_webhook",
@@ -154,6 +220,7 @@ def process_event_queue(events):
     Flush a list of object representation to RQ for EventRule processing.
     """
     events_cache = defaultdict(dict)
+    webhook_deliveries = [] if settings.WEBHOOK_BATCH_SIZE > 1 else None
 
     for event in events:
         event_type = event['event_type']
@@ -161,11 +228,7 @@ def process_event_queue(events):
 
         # Cache applicable Event Rules
         if object_type not in events_cache[event_type]:
-            events_cache[event_type][object_type] = EventRule.objects.filter(
-                event_types__contains=[event['event_type']],
-                object_types=object_type,
-                enabled=True
-            )
+            events_cache[event_type][object_type] = event_rule_cache.get_event_rules(event_type, object_type)
         event_rules = events_cache[event_type][object_type]
 
         process_event_rules(
@@ -175,15 +238,34 @@ def process_event_queue(events):
             data=event['data'],
             username=event['username'],
             snapshots=event['snapshots'],
-            request_id=event['request_id']
+            request_id=event['request_id'],
+            webhook_deliveries=webhook_deliveries
         )
 
+    if webhook_deliveries:
+        enqueue_webhook_batches(webhook_deliveries)
+
+
+def enqueue_webhook_batches(webhook_deliveries):
+    """
+    Group webhook deliveries by webhook, and enqueue a task for each batch of up to WEBHOOK_BATCH_SIZE deliveries.
+    """
+    rq_queue = get_queue(get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT))
+    deliveries_by_webhook = defaultdict(list)
+    for delivery in webhook_deliveries:
+        deliveries_by_webhook[delivery['event_rule'].action_object_id].append(delivery)
+
+    batch_size = settings.WEBHOOK_BATCH_SIZE
+    for deliveries in deliveries_by_webhook.values():
+        for i in range(0, len(deliveries), batch_size):
+            rq_queue.enqueue("extras.webhooks.send_webhooks", deliveries=deliveries[i:i + batch_size])
+
 
 def flush_events(events):
     """
     Flush a list of object representations to RQ for event processing.
     """
-    if events:
+    if events := serialize_events(events):
         for name in settings.EVENTS_PIPELINE:
             try:
                 func = import_string(name)
@@ -1,11 +1,18 @@
 import logging
+import os
+import tempfile
 import traceback
 from contextlib import nullcontext
 
+from django.apps import apps
+from django.core.files import File
+from django.core.files.storage import default_storage
 from django.db import transaction
 from django.utils.translation import gettext as _
 
+from core.changelog import batch_changelog
 from core.signals import clear_events
+from extras.configtemplates import render_configs, write_configs_tarball
 from extras.models import Script as ScriptModel
 from netbox.context_managers import event_tracking
 from netbox.jobs import JobRunner
@@ -41,7 +48,7 @@ class ScriptJob(JobRunner):
 
         try:
             try:
-                with transaction.atomic():
+                with transaction.atomic(), batch_changelog():
                     script.output = script.run(data, commit)
                     if not commit:
                         raise AbortTransaction()
@@ -105,3 +112,39 @@ class ScriptJob(JobRunner):
         # change logging, event rules, etc.
         with event_tracking(request) if commit else nullcontext():
             self.run_script(script, request, data, commit)
+
+
+class RenderConfigsJob(JobRunner):
+    """
+    Render the preferred ConfigTemplate for many devices or virtual machines, and save the rendered configurations as a
+    gzipped tarball to file storage so that it can be downloaded once the job has completed.
+    """
+
+    class Meta:
+        name = 'Config rendering'
+
+    def run(self, model, pks, filename, context=None, workers=1, **kwargs):
+        """
+        Render configurations.
+
+        Args:
+            model: The label of the model being rendered (e.g. "dcim.device")
+            pks: A list of primary keys identifying the objects to render
+            filename: The name of the file to be saved
+            context: Additional context data with which to render each template (optional)
+            workers: The number of worker processes among which to divide rendering (limited to the number of CPUs)
+        """
+        workers = min(workers, os.cpu_count() or 1)
+        queryset = apps.get_model(model).objects.filter(pk__in=pks)
+
+        with tempfile.TemporaryFile() as fileobj:
+            count, errors = write_configs_tarball(render_configs(queryset, context, workers=workers), fileobj)
+            fileobj.seek(0)
+            path = default_storage.save(f'rendered-configs/{self.job.job_id}/{filename}', File(fileobj))
+
+        self.job.data = {
+            'export_file': path,
+            'filename': filename,
+            'rendered': count,
+            'errors': errors,
+        }
@@ -0,0 +1,61 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from extras.configcontexts import config_context_resolver
+
+
+class Command(BaseCommand):
+    help = "Measure the time taken to resolve the config context of existing devices or virtual machines"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", type=str, dest='model', default='dcim.device',
+            choices=('dcim.device', 'virtualization.virtualmachine'),
+            help="The model for which to resolve config contexts (default: dcim.device)"
+        )
+        parser.add_argument(
+            "--count", type=int, dest='count', default=20000,
+            help="Maximum number of objects for which to resolve config contexts (default: 20000)"
+        )
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("The number of objects must be a positive integer.")
+        model = apps.get_model(options['model'])
+
+        pks = list(model.objects.order_by('pk').values_list('pk', flat=True)[:options['count']])
+        if not pks:
+            raise CommandError(f"No {model._meta.verbose_name_plural} exist for which to resolve config contexts.")
+        self.stdout.write(f"Resolving config contexts for {len(pks)} {model._meta.verbose_name_plural}...")
+
+        def run_annotation():
+            queryset = model.objects.filter(pk__in=pks).order_by('pk').annotate_config_context_data()
+            return [obj.get_config_context() for obj in queryset]
+
+        def run_resolver():
+            objects = list(model.objects.filter(pk__in=pks).order_by('pk'))
+            config_context_resolver.annotate(objects)
+            return [obj.get_config_context() for obj in objects]
+
+        # Load the resolver's ConfigContexts in advance, as they would be by any previous request
+        config_context_resolver.get()
+
+        results = {}
+        outputs = {}
+        for label, func in (('annotation', run_annotation), ('resolver', run_resolver)):
+            start_time = time.perf_counter()
+            outputs[label] = func()
+            elapsed = time.perf_counter() - start_time
+            results[label] = elapsed
+            self.stdout.write(
+                f'  {label}: {elapsed:.2f}s ({len(pks) / (elapsed or 1):.0f} objects/sec)'
+            )
+
+        if outputs['annotation'] != outputs['resolver']:
+            raise CommandError("Resolved config contexts do not match")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['annotation'] / (results['resolver'] or 1):.1f}x"
+        ))
@@ -0,0 +1,108 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from jinja2.sandbox import SandboxedEnvironment
+
+from dcim.models import Device
+from extras.models import ConfigTemplate
+from netbox.config import get_config
+from utilities.jinja2 import get_template
+
+SAMPLE_TEMPLATE = """\
+hostname {{ device.name }}
+!
+{%- for vlan in config_context.vlans %}
+vlan {{ vlan.vid }}
+ name {{ vlan.name | upper }}
+{%- endfor %}
+!
+{%- for interface in config_context.interfaces %}
+interface {{ interface.name }}
+ description {{ interface.description | default('unused', true) }}
+ {%- if interface.enabled %}
+ no shutdown
+ {%- else %}
+ shutdown
+ {%- endif %}
+{%- endfor %}
+!
+snmp-server location {{ config_context.location }}
+snmp-server contact {{ device.serial or 'unknown' }}
+"""
+
+
+class Command(BaseCommand):
+    help = "Measure the time taken to render a config template for many devices, with and without template caching"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, dest='count', default=5000,
+            help="Number of (synthetic) devices for which to render the template (default: 5000)"
+        )
+        parser.add_argument(
+            "--template", dest='template', metavar='NAME',
+            help="Name of the config template to render (default: a built-in sample template)"
+        )
+
+    @staticmethod
+    def get_context(i):
+        device = Device(pk=i, name=f'device-{i}', serial=f'SN{i:08}')
+        return {
+            'device': device,
+            'config_context': {
+                'location': f'Rack {i // 40 + 1}',
+                'vlans': [{'vid': vid, 'name': f'vlan-{vid}'} for vid in range(100, 110)],
+                'interfaces': [
+                    {'name': f'Ethernet{n}', 'description': f'Port {n}' if n % 2 else '', 'enabled': n % 3 != 0}
+                    for n in range(1, 49)
+                ],
+            },
+        }
+
+    @staticmethod
+    def render_uncached(template_code, environment_params, context):
+        """
+        Construct a new environment and compile the template for each render.
+        """
+        environment = SandboxedEnvironment(**(environment_params or {}))
+        environment.filters.update(get_config().JINJA2_FILTERS)
+        return environment.from_string(template_code).render(**context)
+
+    @staticmethod
+    def render_cached(template_code, environment_params, context):
+        """
+        Render the template using the shared compiled template cache.
+        """
+        return get_template(template_code, environment_params).render(**context)
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("Count must be a positive integer.")
+        if name := options['template']:
+            try:
+                config_template = ConfigTemplate.objects.get(name=name)
+            except ConfigTemplate.DoesNotExist:
+                raise CommandError(f"Config template not found: {name}")
+        else:
+            config_template = ConfigTemplate(name='Benchmark', template_code=SAMPLE_TEMPLATE)
+        template_code = config_template.template_code
+        environment_params = config_template.environment_params
+
+        contexts = [self.get_context(i) for i in range(1, options['count'] + 1)]
+        self.stdout.write(f"Rendering {config_template} for {len(contexts)} devices...")
+
+        results = {}
+        for label, func in (('uncached', self.render_uncached), ('cached', self.render_cached)):
+            start_time = time.perf_counter()
+            for context in contexts:
+                func(template_code, environment_params, context)
+            elapsed = time.perf_counter() - start_time
+            results[label] = elapsed
+            self.stdout.write(
+                f'  {label}: {elapsed:.2f}s ({elapsed * 1000 / len(contexts):.2f}ms per device, '
+                f'{len(contexts) / (elapsed or 1):.0f} devices/sec)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['uncached'] / (results['cached'] or 1):.1f}x"
+        ))
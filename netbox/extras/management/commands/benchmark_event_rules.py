@@ -0,0 +1,86 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from extras.conditions import ConditionSet
+from extras.models import EventRule
+
+
+class Command(BaseCommand):
+    help = "Measure the time taken to evaluate event rule conditions, with and without precompiled conditions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rules", type=int, dest='rules', default=100,
+            help="Number of (synthetic) event rules to evaluate (default: 100)"
+        )
+        parser.add_argument(
+            "--events", type=int, dest='events', default=10000,
+            help="Number of (synthetic) event payloads against which to evaluate each rule (default: 10000)"
+        )
+
+    @staticmethod
+    def get_event_rules(count):
+        conditions = (
+            lambda i: {'attr': 'status.value', 'value': 'active'},
+            lambda i: {'attr': 'name', 'value': f'^site-{i}', 'op': 'regex'},
+            lambda i: {'and': [
+                {'attr': 'tenant.slug', 'value': f'tenant-{i}'},
+                {'attr': 'tags.slug', 'value': 'core', 'op': 'contains'},
+            ]},
+            lambda i: {'or': [
+                {'attr': 'id', 'value': i, 'op': 'gt'},
+                {'attr': 'region.name', 'value': ['North', 'South'], 'op': 'in', 'negate': True},
+            ]},
+        )
+        return [
+            EventRule(name=f'Event Rule {i}', conditions=conditions[i % len(conditions)](i))
+            for i in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def get_data(i):
+        return {
+            'id': i,
+            'name': f'site-{i}',
+            'status': {'value': 'active' if i % 2 else 'planned', 'label': 'Active'},
+            'tenant': {'id': i % 10, 'slug': f'tenant-{i % 10}'},
+            'region': {'name': 'North' if i % 3 else 'East'},
+            'tags': [{'slug': 'core'}, {'slug': 'edge'}],
+        }
+
+    def handle(self, *args, **options):
+        if options['rules'] < 1 or options['events'] < 1:
+            raise CommandError("The number of rules and events must be positive integers.")
+
+        event_rules = self.get_event_rules(options['rules'])
+        payloads = [self.get_data(i) for i in range(1, options['events'] + 1)]
+        evaluations = len(event_rules) * len(payloads)
+        self.stdout.write(f"Evaluating {len(event_rules)} event rules against {len(payloads)} events...")
+
+        def run_uncompiled():
+            # Construct the ConditionSet for every evaluation
+            for data in payloads:
+                for event_rule in event_rules:
+                    ConditionSet(event_rule.conditions).eval(data)
+
+        def run_compiled():
+            for event_rule in event_rules:
+                event_rule._condition_set = ConditionSet(event_rule.conditions)
+            for data in payloads:
+                for event_rule in event_rules:
+                    event_rule.eval_conditions(data)
+
+        results = {}
+        for label, func in (('uncompiled', run_uncompiled), ('compiled', run_compiled)):
+            start_time = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start_time
+            results[label] = elapsed
+            self.stdout.write(
+                f'  {label}: {elapsed:.2f}s ({evaluations / (elapsed or 1):.0f} evaluations/sec)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['uncompiled'] / (results['compiled'] or 1):.1f}x"
+        ))
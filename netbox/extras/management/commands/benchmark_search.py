@@ -0,0 +1,142 @@
+import random
+import statistics
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+from dcim.models import Site
+from extras.models import CachedValue
+from netbox.search import FieldTypes, LookupTypes
+
+WORDS = (
+    'alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel', 'india', 'juliett', 'kilo', 'lima',
+    'mike', 'november', 'oscar', 'papa', 'quebec', 'romeo', 'sierra', 'tango', 'uniform', 'victor', 'whiskey',
+    'xray', 'yankee', 'zulu',
+)
+
+# Number of synthetic CachedValues to create per INSERT
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Measure the search latency of one or more search backends against a synthetic search cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, dest='count', default=100000,
+            help="Number of synthetic cached values to create (default: 100000)"
+        )
+        parser.add_argument(
+            "--queries", type=int, dest='queries', default=100,
+            help="Number of searches to perform per backend and lookup type (default: 100)"
+        )
+        parser.add_argument(
+            "--backend", action='append', dest='backends', metavar='PATH',
+            help="Dotted path of a search backend class to benchmark (may be passed multiple times; default: "
+                 "all backends provided by NetBox)"
+        )
+        parser.add_argument(
+            "--lookup", action='append', dest='lookups', metavar='TYPE',
+            choices=[v for k, v in vars(LookupTypes).items() if not k.startswith('_')],
+            help="Lookup type to benchmark (may be passed multiple times; default: all)"
+        )
+        parser.add_argument(
+            "--seed", type=int, dest='seed', default=0,
+            help="Seed for the generation of synthetic values and search terms"
+        )
+
+    def populate(self, count, rng):
+        """
+        Create the specified number of synthetic CachedValues, assigned to non-existent sites.
+        """
+        object_type = ContentType.objects.get_for_model(Site)
+        buffer = []
+        for i in range(count):
+            buffer.append(CachedValue(
+                object_type=object_type,
+                object_id=i // 5 + 1,
+                field='name',
+                type=FieldTypes.STRING,
+                weight=rng.choice((100, 500, 1000)),
+                value=f'{rng.choice(WORDS)}-{rng.choice(WORDS)}-{rng.randint(1, 9999)}'
+            ))
+            if len(buffer) >= BATCH_SIZE:
+                CachedValue.objects.bulk_create(buffer)
+                buffer = []
+        if buffer:
+            CachedValue.objects.bulk_create(buffer)
+
+        # Update planner statistics to reflect the new values
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {CachedValue._meta.db_table}')
+
+    @staticmethod
+    def get_search_term(lookup, rng):
+        word = rng.choice(WORDS)
+        if lookup == LookupTypes.EXACT:
+            return f'{word}-{rng.choice(WORDS)}-{rng.randint(1, 9999)}'
+        if lookup == LookupTypes.STARTSWITH:
+            return f'{word}-{rng.choice(WORDS)[:3]}'
+        if lookup == LookupTypes.ENDSWITH:
+            return f'-{rng.randint(1, 9999)}'
+        if lookup == LookupTypes.REGEX:
+            return f'^{word}-.*-{rng.randint(1, 9)}$'
+        return f'{word[1:]}-{rng.choice(WORDS)[:2]}'
+
+    def handle(self, *args, **options):
+        if options['count'] < 0:
+            raise CommandError("Count must not be negative.")
+        if options['queries'] < 2:
+            raise CommandError("At least two queries must be performed.")
+        backend_paths = options['backends'] or [
+            'netbox.search.backends.CachedValueSearchBackend',
+            'netbox.search.backends.TrigramSearchBackend',
+        ]
+        backends = {}
+        for path in backend_paths:
+            try:
+                backends[path] = import_string(path)()
+            except ImportError:
+                raise CommandError(f"Failed to import search backend: {path}")
+        lookups = options['lookups'] or [
+            LookupTypes.PARTIAL, LookupTypes.EXACT, LookupTypes.STARTSWITH, LookupTypes.ENDSWITH, LookupTypes.REGEX
+        ]
+        rng = random.Random(options['seed'])
+
+        # TrigramSearchBackend requires the pg_trgm index, which is not created by migrations
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('extras_cachedvalue_value_trgm') IS NOT NULL")
+            if not cursor.fetchone()[0]:
+                self.stdout.write(self.style.WARNING(
+                    "The pg_trgm search cache index does not exist; create it with the trigram_index command."
+                ))
+
+        # All synthetic data is discarded upon completion
+        with transaction.atomic():
+            self.stdout.write(f"Creating {options['count']} synthetic cached values...", ending='')
+            self.stdout.flush()
+            start_time = time.monotonic()
+            self.populate(options['count'], rng)
+            self.stdout.write(self.style.SUCCESS(f' done ({time.monotonic() - start_time:.1f}s)'))
+            self.stdout.write(f'Total cached values: {CachedValue.objects.count()}')
+
+            for lookup in lookups:
+                terms = [self.get_search_term(lookup, rng) for _ in range(options['queries'])]
+                for path, backend in backends.items():
+                    timings = []
+                    for term in terms:
+                        start_time = time.perf_counter()
+                        backend.search(term, lookup=lookup)
+                        timings.append((time.perf_counter() - start_time) * 1000)
+                    quantiles = statistics.quantiles(timings, n=20)
+                    self.stdout.write(
+                        f'  {path} ({lookup}): p50 {quantiles[9]:.1f}ms, p95 {quantiles[18]:.1f}ms, '
+                        f'max {max(timings):.1f}ms'
+                    )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
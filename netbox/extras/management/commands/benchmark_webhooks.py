@@ -0,0 +1,108 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.events import OBJECT_UPDATED
+from extras.models import EventRule, Webhook
+from extras.webhooks import SessionPool, deliver_webhooks, send_webhook
+from .webhook_receiver import WebhookHandler
+
+
+class BenchmarkWebhookHandler(WebhookHandler):
+    """
+    A quiet webhook receiver which supports persistent (HTTP/1.1) connections.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format_str, *args):
+        pass
+
+    def do_ANY(self):
+        if content_length := self.headers.get('Content-Length'):
+            self.rfile.read(int(content_length))
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class Command(BaseCommand):
+    help = "Measure the rate at which webhooks can be delivered to a local receiver"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, dest='count', default=1000,
+            help="Number of webhooks to deliver (default: 1000)"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, dest='batch_size', default=100,
+            help="Number of deliveries per batch (default: 100)"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, dest='concurrency', default=4,
+            help="Number of concurrent requests per batch (default: 4)"
+        )
+
+    @staticmethod
+    def get_deliveries(webhook, count):
+        event_rule = EventRule(name='Benchmark', action_object=webhook)
+        timestamp = timezone.now().isoformat()
+        return [
+            {
+                'event_rule': event_rule,
+                'model_name': 'site',
+                'event_type': OBJECT_UPDATED,
+                'data': {'id': i, 'name': f'Site {i}', 'slug': f'site-{i}', 'status': 'active'},
+                'timestamp': timestamp,
+                'username': 'admin',
+            } for i in range(1, count + 1)
+        ]
+
+    def handle(self, *args, **options):
+        if min(options['count'], options['batch_size'], options['concurrency']) < 1:
+            raise CommandError("Count, batch size, and concurrency must be positive integers.")
+
+        # Start a local receiver on an available port
+        httpd = ThreadingHTTPServer(('localhost', 0), BenchmarkWebhookHandler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        payload_url = f'http://localhost:{httpd.server_port}/'
+        self.stdout.write(f"Delivering {options['count']} webhooks to {payload_url}...")
+
+        def run_individual(deliveries):
+            for delivery in deliveries:
+                send_webhook(**delivery)
+
+        def run_batched(deliveries):
+            session_pool = SessionPool(pool_size=options['concurrency'])
+            batch_size = options['batch_size']
+            for i in range(0, len(deliveries), batch_size):
+                if deliver_webhooks(deliveries[i:i + batch_size], session_pool, options['concurrency']):
+                    raise CommandError("Webhook delivery failed")
+            session_pool.close()
+
+        # Webhooks with a non-JSON content type are never coalesced
+        modes = (
+            ('individual', 'application/json', run_individual),
+            ('pooled', 'text/plain', run_batched),
+            ('batched', 'application/json', run_batched),
+        )
+        try:
+            results = {}
+            for label, content_type, func in modes:
+                webhook = Webhook(name='Benchmark', payload_url=payload_url, http_content_type=content_type)
+                deliveries = self.get_deliveries(webhook, options['count'])
+                start_time = time.perf_counter()
+                func(deliveries)
+                elapsed = time.perf_counter() - start_time
+                results[label] = elapsed
+                self.stdout.write(
+                    f'  {label}: {elapsed:.2f}s ({len(deliveries) / (elapsed or 1):.0f} deliveries/sec)'
+                )
+        finally:
+            httpd.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['individual'] / (results['batched'] or 1):.1f}x"
+        ))
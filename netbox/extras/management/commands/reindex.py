@@ -1,10 +1,56 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max, Min
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.translation import gettext as _
 
 from netbox.registry import registry
 from netbox.search.backends import search_backend
 
+# Number of objects to retrieve from the database at a time
+CHUNK_SIZE = 2000
+
+# Number of primary keys spanned by each range of objects indexed by a worker
+BATCH_SIZE = 50000
+
+
+def reindex_range(label, start, end, since=None):
+    """
+    Cache all objects of the indexed model whose primary keys fall within the given range, optionally limited to those
+    updated since the specified time. Returns the number of objects indexed and the number of entries cached.
+    """
+    indexer = registry['search'][label]
+    queryset = indexer.model.objects.filter(pk__gte=start, pk__lt=end)
+
+    # Objects updated since a given time may already have been cached, so flush them through the backend (which
+    # removes any existing cache entries) rather than caching them directly.
+    if since is not None:
+        pks = list(queryset.filter(last_updated__gte=since).values_list('pk', flat=True))
+        if pks:
+            search_backend.flush({indexer.model: pks})
+        return len(pks), None
+
+    # Retrieve only those fields needed to cache each object
+    if (fields := indexer.get_required_fields()) is not None:
+        queryset = queryset.only(*fields)
+    objects_count = 0
+
+    def iterate():
+        nonlocal objects_count
+        for obj in queryset.order_by('pk').iterator(chunk_size=CHUNK_SIZE):
+            objects_count += 1
+            yield obj
+
+    entries_count = search_backend.cache(iterate(), indexer=indexer, remove_existing=False)
+    return objects_count, entries_count
+
 
 class Command(BaseCommand):
     help = 'Reindex objects for search'
@@ -21,6 +67,23 @@ class Command(BaseCommand):
             action='store_true',
             help="For each model, reindex objects only if no cache entries already exist"
         )
+        parser.add_argument(
+            '--since',
+            metavar='TIMESTAMP',
+            help="Reindex only objects updated since the specified date or time (ISO 8601 format)"
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="Number of worker processes among which to divide reindexing (default: 1)"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of primary keys spanned by each batch of objects assigned to a worker (default: {BATCH_SIZE})"
+        )
 
     def _get_indexers(self, *model_names):
         indexers = {}
@@ -58,7 +121,71 @@ class Command(BaseCommand):
 
         return indexers
 
+    @staticmethod
+    def _parse_timestamp(value):
+        """
+        Parse an ISO 8601 date or datetime string, returning an aware datetime.
+        """
+        try:
+            if (dt := parse_datetime(value)) is None and (date := parse_date(value)) is not None:
+                dt = datetime.combine(date, datetime.min.time())
+        except ValueError:
+            dt = None
+        if dt is None:
+            raise CommandError(f"Invalid timestamp: {value}")
+        if timezone.is_naive(dt):
+            dt = timezone.make_aware(dt)
+        return dt
+
+    def _run_batches(self, batches, executor=None):
+        """
+        Reindex each batch of objects, either serially or using the given process pool, and yield the results as each
+        batch is completed.
+        """
+        if executor is None:
+            for batch in batches:
+                yield reindex_range(*batch)
+            return
+
+        # Close all database connections prior to (possibly) forking so that none are shared with the worker processes
+        connections.close_all()
+        futures = [executor.submit(reindex_range, *batch) for batch in batches]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _reindex_model(self, label, model, since, batch_size, executor):
+        """
+        Divide the model's objects into ranges of primary keys and reindex each range. Returns the number of objects
+        indexed and the number of entries cached.
+        """
+        pk_range = model.objects.aggregate(min_pk=Min('pk'), max_pk=Max('pk'))
+        if pk_range['min_pk'] is None:
+            return 0, 0
+        batches = [
+            (label, start, start + batch_size, since)
+            for start in range(pk_range['min_pk'], pk_range['max_pk'] + 1, batch_size)
+        ]
+
+        objects_count = 0
+        entries_count = 0
+        for objects, entries in self._run_batches(batches, executor):
+            objects_count += objects
+            entries_count += entries or 0
+        return objects_count, entries_count
+
     def handle(self, *model_labels, **kwargs):
+        since = self._parse_timestamp(kwargs['since']) if kwargs['since'] else None
+        workers = kwargs['workers']
+        batch_size = kwargs['batch_size']
+        if workers < 1:
+            raise CommandError(_("Number of workers must be a positive integer."))
+        if batch_size < 1:
+            raise CommandError(_("Batch size must be a positive integer."))
 
         # Determine which models to reindex
         indexers = self._get_indexers(*model_labels)
@@ -66,8 +193,8 @@ class Command(BaseCommand):
             raise CommandError(_("No indexers found!"))
         self.stdout.write(f'Reindexing {len(indexers)} models.')
 
-        # Clear cached values for the specified models (if not being lazy)
-        if not kwargs['lazy']:
+        # Clear cached values for the specified models (if not being lazy or reindexing only recent changes)
+        if not kwargs['lazy'] and since is None:
             if model_labels:
                 content_types = [ContentType.objects.get_for_model(model) for model in indexers.keys()]
             else:
@@ -78,25 +205,48 @@ class Command(BaseCommand):
             deleted_count = search_backend.clear(object_types=content_types)
             self.stdout.write(f'{deleted_count} entries deleted.')
 
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+
         # Index models
         self.stdout.write('Indexing models')
-        for model, idx in indexers.items():
-            app_label = model._meta.app_label
-            model_name = model._meta.model_name
-            self.stdout.write(f'  {app_label}.{model_name}... ', ending='')
-            self.stdout.flush()
-
-            if kwargs['lazy']:
-                content_type = ContentType.objects.get_for_model(model)
-                if cached_count := search_backend.count(object_types=[content_type]):
-                    self.stdout.write(f'Skipping (found {cached_count} existing).')
+        try:
+            for model, idx in indexers.items():
+                app_label = model._meta.app_label
+                model_name = model._meta.model_name
+                self.stdout.write(f'  {app_label}.{model_name}... ', ending='')
+                self.stdout.flush()
+
+                if kwargs['lazy']:
+                    content_type = ContentType.objects.get_for_model(model)
+                    if cached_count := search_backend.count(object_types=[content_type]):
+                        self.stdout.write(f'Skipping (found {cached_count} existing).')
+                        continue
+
+                if since is not None and not hasattr(model, 'last_updated'):
+                    self.stdout.write('Skipping (model does not record last update time).')
                     continue
 
-            i = search_backend.cache(model.objects.iterator(), remove_existing=False)
-            if i:
-                self.stdout.write(f'{i} entries cached.')
-            else:
-                self.stdout.write(f'No objects found.')
+                start_time = time.monotonic()
+                objects_count, entries_count = self._reindex_model(
+                    f'{app_label}.{model_name}', model, since, batch_size, executor
+                )
+                elapsed = time.monotonic() - start_time
+                if not objects_count:
+                    self.stdout.write(f'No objects found.')
+                elif since is not None:
+                    self.stdout.write(
+                        f'{objects_count} objects reindexed ({objects_count / (elapsed or 1):.0f} rows/sec).'
+                    )
+                else:
+                    self.stdout.write(
+                        f'{entries_count} entries cached for {objects_count} objects '
+                        f'({objects_count / (elapsed or 1):.0f} rows/sec).'
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         msg = f'Completed.'
         if total_count := search_backend.size:
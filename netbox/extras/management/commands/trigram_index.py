@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection
+
+INDEX_NAME = 'extras_cachedvalue_value_trgm'
+
+
+class Command(BaseCommand):
+    help = (
+        "Create (or drop) the pg_trgm index on the global search cache, which is required by TrigramSearchBackend. The "
+        "index is built concurrently, without locking the search cache against writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--drop', action='store_true', dest='drop',
+            help="Drop the index rather than creating it (the pg_trgm extension is retained)"
+        )
+
+    def execute_sql(self, sql):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+        except DatabaseError as e:
+            raise CommandError(f"Failed to execute \"{sql}\": {e}")
+
+    def index_is_valid(self):
+        """
+        Return True if the index exists and is valid, False if it exists but is invalid (i.e. a previous concurrent
+        build failed), or None if it does not exist.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+                [INDEX_NAME]
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def handle(self, *args, **options):
+        if connection.in_atomic_block:
+            raise CommandError("This command cannot be run within a transaction.")
+
+        if options['drop']:
+            self.execute_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+            self.stdout.write(self.style.SUCCESS(f"Dropped index {INDEX_NAME}."))
+            return
+
+        # Creating an extension requires the CREATE privilege on the database (PostgreSQL 13 and later) or superuser
+        # privileges, depending on the extension
+        self.stdout.write("Creating the pg_trgm extension...")
+        self.execute_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        valid = self.index_is_valid()
+        if valid:
+            self.stdout.write(self.style.SUCCESS(f"Index {INDEX_NAME} already exists."))
+            return
+        if valid is False:
+            self.stdout.write(f"Dropping invalid index {INDEX_NAME} left by a previous failed build...")
+            self.execute_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+        self.stdout.write(f"Building index {INDEX_NAME} (this may take some time)...")
+        self.execute_sql(
+            f"CREATE INDEX CONCURRENTLY {INDEX_NAME} ON extras_cachedvalue USING gin (UPPER(value) gin_trgm_ops)"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Created index {INDEX_NAME}."))
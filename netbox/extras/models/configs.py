@@ -4,16 +4,14 @@ from django.core.validators import ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
-from jinja2.loaders import BaseLoader
-from jinja2.sandbox import SandboxedEnvironment
 
+from extras.configcontexts import config_context_resolver
 from extras.querysets import ConfigContextQuerySet
-from netbox.config import get_config
 from netbox.models import ChangeLoggedModel
 from netbox.models.features import CloningMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin
 from netbox.registry import registry
 from utilities.data import deepmerge
-from utilities.jinja2 import DataFileLoader
+from utilities.jinja2 import get_environment, get_template
 
 __all__ = (
     'ConfigContext',
@@ -181,8 +179,8 @@ class ConfigContextModel(models.Model):
         data = {}
 
         if not hasattr(self, 'config_context_data'):
-            # The annotation is not available, so we fall back to manually querying for the config context objects
-            config_context_data = ConfigContext.objects.get_for_object(self, aggregate_data=True) or []
+            # The annotation is not available, so resolve the applicable config contexts in memory
+            config_context_data = config_context_resolver.get_config_context_data([self])[0]
         else:
             # The attribute may exist, but the annotated value could be None if there is no config context data
             config_context_data = self.config_context_data or []
@@ -273,12 +271,11 @@ class ConfigTemplate(SyncedDataMixin, CustomLinksMixin, ExportTemplatesMixin, Ta
         if context is not None:
             _context.update(context)
 
-        # Initialize the Jinja2 environment and instantiate the Template
-        environment = self._get_environment()
+        # Retrieve the compiled Template
         if self.data_file:
-            template = environment.get_template(self.data_file.path)
+            template = self._get_environment().get_template(self.data_file.path)
         else:
-            template = environment.from_string(self.template_code)
+            template = get_template(self.template_code, self.environment_params)
         output = template.render(**_context)
 
         # Replace CRLF-style line terminators
@@ -286,20 +283,15 @@ class ConfigTemplate(SyncedDataMixin, CustomLinksMixin, ExportTemplatesMixin, Ta
 
     def _get_environment(self):
         """
-        Instantiate and return a Jinja2 environment suitable for rendering the ConfigTemplate.
+        Return a (shared) Jinja2 environment suitable for rendering the ConfigTemplate.
         """
-        # Initialize the template loader & cache the base template code (if applicable)
-        if self.data_file:
-            loader = DataFileLoader(data_source=self.data_source)
-            loader.cache_templates({
-                self.data_file.path: self.template_code
-            })
-        else:
-            loader = BaseLoader()
-
-        # Initialize the environment
-        env_params = self.environment_params or {}
-        environment = SandboxedEnvironment(loader=loader, **env_params)
-        environment.filters.update(get_config().JINJA2_FILTERS)
-
-        return environment
+        if not self.data_file:
+            return get_environment(self.environment_params)
+
+        # Serve the base template code from this ConfigTemplate. Any templates it references are loaded from the
+        # DataSource as needed.
+        return get_environment(
+            self.environment_params,
+            data_source=self.data_source,
+            templates={self.data_file.path: self.template_code}
+        )
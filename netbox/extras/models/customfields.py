@@ -1,6 +1,7 @@
 import decimal
 import json
 import re
+from collections import defaultdict
 from datetime import datetime, date
 
 import django_filters
@@ -62,11 +63,52 @@ class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
         """
         Return a dictionary of serialized default values for all CustomFields applicable to the given model.
         """
-        custom_fields = self.get_for_model(model).filter(default__isnull=False)
+        from extras.customfields import custom_field_cache
         return {
-            cf.name: cf.default for cf in custom_fields
+            cf.name: cf.default for cf in custom_field_cache.get_for_model(model) if cf.default is not None
         }
 
+    def get_related_objects(self, custom_fields, data):
+        """
+        Retrieve all objects referenced by the given object and multi-object CustomFields within an iterable of custom
+        field data dictionaries, using a single query per related object type. Returns a dictionary mapping each
+        related ObjectType ID to a dictionary of objects (in the model's default ordering) keyed by primary key. The
+        result may be passed to CustomField.deserialize() to resolve object values without further queries.
+
+        Args:
+            custom_fields: An iterable of CustomFields
+            data: An iterable of custom field data dictionaries (e.g. the custom_field_data of a list of objects)
+        """
+        object_fields = [
+            cf for cf in custom_fields
+            if cf.type in (CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        ]
+        if not object_fields:
+            return {}
+
+        # Collect the primary keys of all referenced objects by related object type
+        object_types = {cf.related_object_type_id: cf.related_object_type for cf in object_fields}
+        pks = defaultdict(set)
+        for custom_field_data in data:
+            for cf in object_fields:
+                value = custom_field_data.get(cf.name)
+                if cf.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT and type(value) is list:
+                    pks[cf.related_object_type_id].update(v for v in value if type(v) is int)
+                elif type(value) is int:
+                    pks[cf.related_object_type_id].add(value)
+
+        related_objects = {}
+        for object_type_id, object_type in object_types.items():
+            model = object_type.model_class()
+            if model is None or not pks[object_type_id]:
+                related_objects[object_type_id] = {}
+                continue
+            related_objects[object_type_id] = {
+                obj.pk: obj for obj in model.objects.filter(pk__in=pks[object_type_id])
+            }
+
+        return related_objects
+
 
 class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
     object_types = models.ManyToManyField(
@@ -406,9 +448,15 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
             return [obj.pk for obj in value] or None
         return value
 
-    def deserialize(self, value):
+    def deserialize(self, value, related_objects=None):
         """
         Convert JSON data to a Python object suitable for the field type.
+
+        Args:
+            value: The serialized value
+            related_objects: The objects referenced by object and multi-object fields, as returned by
+                CustomFieldManager.get_related_objects(). If provided, object values are resolved from these rather
+                than queried individually, and multi-object values are returned as a list rather than a QuerySet.
         """
         if value is None:
             return value
@@ -423,9 +471,17 @@ class CustomField(CloningMixin, ExportTemplatesMixin, ChangeLoggedModel):
             except ValueError:
                 return value
         if self.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            objects = related_objects.get(self.related_object_type_id) if related_objects is not None else None
+            if objects is not None and type(value) is int and value in objects:
+                return objects[value]
             model = self.related_object_type.model_class()
             return model.objects.filter(pk=value).first()
         if self.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+            objects = related_objects.get(self.related_object_type_id) if related_objects is not None else None
+            if objects is not None and type(value) is list:
+                pks = set(value)
+                if pks.issubset(objects):
+                    return [obj for pk, obj in objects.items() if pk in pks]
             model = self.related_object_type.model_class()
             return model.objects.filter(pk__in=value)
         return value
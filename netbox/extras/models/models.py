@@ -1,12 +1,13 @@
 import json
 import urllib.parse
+from itertools import chain
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import ValidationError
 from django.db import models
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -23,8 +24,9 @@ from netbox.models import ChangeLoggedModel
 from netbox.models.features import (
     CloningMixin, CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin,
 )
+from utilities.export import iter_buffered
 from utilities.html import clean_html
-from utilities.jinja2 import render_jinja2
+from utilities.jinja2 import get_template, render_jinja2
 from utilities.querydict import dict_to_querydict
 from utilities.querysets import RestrictedQuerySet
 
@@ -140,7 +142,10 @@ class EventRule(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, ChangeLogged
         if not self.conditions:
             return True
 
-        return ConditionSet(self.conditions).eval(data)
+        # Use the precompiled ConditionSet, if one has been attached (see EventRuleCache)
+        condition_set = getattr(self, '_condition_set', None) or ConditionSet(self.conditions)
+
+        return condition_set.eval(data)
 
 
 class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, ChangeLoggedModel):
@@ -469,15 +474,35 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
 
         return output
 
+    def render_stream(self, queryset):
+        """
+        Render the contents of the template incrementally, returning an iterator of strings. The beginning of the
+        output is rendered immediately, so that most errors are raised by this method rather than while streaming.
+        """
+        output = iter_buffered(get_template(self.template_code).generate(queryset=queryset))
+        first = next(output, '')
+
+        def replace_crlf(strings):
+            # Replace CRLF-style line terminators (which may be split between strings)
+            pending = ''
+            for string in strings:
+                string = pending + string
+                pending = '\r' if string.endswith('\r') else ''
+                yield string[:len(string) - len(pending)].replace('\r\n', '\n')
+            if pending:
+                yield pending
+
+        return replace_crlf(chain([first], output))
+
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to a streaming HTTP response, delivered as a named file attachment
         """
-        output = self.render(queryset)
+        output = self.render_stream(queryset)
         mime_type = 'text/plain; charset=utf-8' if not self.mime_type else self.mime_type
 
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = StreamingHttpResponse(output, content_type=mime_type)
 
         if self.as_attachment:
             basename = queryset.model._meta.verbose_name_plural.replace(' ', '_')
@@ -1,17 +1,20 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from core.events import *
 from core.models import ObjectType
 from core.signals import job_end, job_start
+from extras.configcontexts import ASSIGNMENT_FIELDS, config_context_resolver
+from extras.customfields import custom_field_cache
 from extras.events import process_event_rules
+from extras.eventrules import event_rule_cache
 from extras.models import EventRule, Notification, Subscription
 from netbox.config import get_config
 from netbox.registry import registry
 from netbox.signals import post_clean
 from utilities.exceptions import AbortRequest
-from .models import CustomField, TaggedItem
+from .models import ConfigContext, CustomField, CustomFieldChoiceSet, TaggedItem
 from .utils import run_validators
 
 
@@ -56,6 +59,42 @@ m2m_changed.connect(handle_cf_added_obj_types, sender=CustomField.object_types.t
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.object_types.through)
 
 
+def invalidate_custom_fields(**kwargs):
+    """
+    Invalidate the loaded CustomFields when a CustomField, its assignment to object types, or a choice set changes.
+    """
+    custom_field_cache.invalidate()
+
+
+post_save.connect(invalidate_custom_fields, sender=CustomField)
+post_delete.connect(invalidate_custom_fields, sender=CustomField)
+m2m_changed.connect(invalidate_custom_fields, sender=CustomField.object_types.through)
+post_save.connect(invalidate_custom_fields, sender=CustomFieldChoiceSet)
+post_delete.connect(invalidate_custom_fields, sender=CustomFieldChoiceSet)
+
+
+#
+# Config contexts
+#
+
+def invalidate_config_contexts(**kwargs):
+    """
+    Invalidate the loaded ConfigContexts when a ConfigContext or its assignments change, when the hierarchy of regions
+    or site groups changes, or when an object to which ConfigContexts may be assigned is deleted.
+    """
+    config_context_resolver.invalidate()
+
+
+post_save.connect(invalidate_config_contexts, sender=ConfigContext)
+post_delete.connect(invalidate_config_contexts, sender=ConfigContext)
+for field_name in ASSIGNMENT_FIELDS:
+    field = ConfigContext._meta.get_field(field_name)
+    m2m_changed.connect(invalidate_config_contexts, sender=field.remote_field.through)
+    post_delete.connect(invalidate_config_contexts, sender=field.related_model)
+post_save.connect(invalidate_config_contexts, sender='dcim.Region')
+post_save.connect(invalidate_config_contexts, sender='dcim.SiteGroup')
+
+
 #
 # Custom validation
 #
@@ -93,16 +132,24 @@ def validate_assigned_tags(sender, instance, action, model, pk_set, **kwargs):
 # Event rules
 #
 
+def invalidate_event_rules(**kwargs):
+    """
+    Invalidate the loaded EventRules when an EventRule or its assignment to object types changes.
+    """
+    event_rule_cache.invalidate()
+
+
+post_save.connect(invalidate_event_rules, sender=EventRule)
+post_delete.connect(invalidate_event_rules, sender=EventRule)
+m2m_changed.connect(invalidate_event_rules, sender=EventRule.object_types.through)
+
+
 @receiver(job_start)
 def process_job_start_event_rules(sender, **kwargs):
     """
     Process event rules for jobs starting.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_STARTED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = event_rule_cache.get_event_rules(JOB_STARTED, sender.object_type)
     username = sender.user.username if sender.user else None
     process_event_rules(
         event_rules=event_rules,
@@ -118,11 +165,7 @@ def process_job_end_event_rules(sender, **kwargs):
     """
     Process event rules for jobs terminating.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_COMPLETED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = event_rule_cache.get_event_rules(JOB_COMPLETED, sender.object_type)
     username = sender.user.username if sender.user else None
     process_event_rules(
         event_rules=event_rules,
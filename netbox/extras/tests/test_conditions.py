@@ -122,6 +122,10 @@ class ConditionTestCase(TestCase):
         self.assertFalse(c.eval({'x': 'abc'}))
         self.assertTrue(c.eval({'x': '123'}))
 
+    def test_invalid_regex(self):
+        with self.assertRaises(ValueError):
+            Condition('x', '[a-z', 'regex')
+
 
 class ConditionSetTest(TestCase):
 
@@ -545,6 +545,45 @@ class CustomFieldManagerTest(TestCase):
         self.assertEqual(CustomField.objects.get_for_model(Site).count(), 1)
         self.assertEqual(CustomField.objects.get_for_model(VirtualMachine).count(), 0)
 
+    def test_get_related_objects(self):
+        vlans = (
+            VLAN(name='VLAN 1', vid=1),
+            VLAN(name='VLAN 2', vid=2),
+            VLAN(name='VLAN 3', vid=3),
+        )
+        VLAN.objects.bulk_create(vlans)
+        vlan_type = ObjectType.objects.get_for_model(VLAN)
+        custom_fields = (
+            CustomField(type=CustomFieldTypeChoices.TYPE_OBJECT, name='object_field', related_object_type=vlan_type),
+            CustomField(
+                type=CustomFieldTypeChoices.TYPE_MULTIOBJECT,
+                name='multiobject_field',
+                related_object_type=vlan_type
+            ),
+        )
+        CustomField.objects.bulk_create(custom_fields)
+        data = (
+            {'object_field': vlans[0].pk, 'multiobject_field': [vlans[2].pk, vlans[1].pk]},
+            {'object_field': vlans[1].pk, 'multiobject_field': []},
+            {'object_field': None},
+        )
+
+        # All referenced objects of the same type are retrieved with a single query
+        with self.assertNumQueries(1):
+            related_objects = CustomField.objects.get_related_objects(custom_fields, data)
+        self.assertEqual(set(related_objects[vlan_type.pk]), {vlan.pk for vlan in vlans})
+
+        # Values are resolved without querying the database
+        expected_vlans = list(VLAN.objects.filter(pk__in=[vlans[1].pk, vlans[2].pk]))
+        with self.assertNumQueries(0):
+            self.assertEqual(custom_fields[0].deserialize(data[0]['object_field'], related_objects), vlans[0])
+            self.assertEqual(custom_fields[0].deserialize(data[1]['object_field'], related_objects), vlans[1])
+            self.assertEqual(
+                custom_fields[1].deserialize(data[0]['multiobject_field'], related_objects),
+                expected_vlans
+            )
+            self.assertEqual(custom_fields[1].deserialize(data[1]['multiobject_field'], related_objects), [])
+
 
 class CustomFieldAPITest(APITestCase):
 
@@ -1259,7 +1298,9 @@ class CustomFieldImportTest(TestCase):
         Attempt to import an object missing a required custom field.
         """
         # Set one of our CustomFields to required
-        CustomField.objects.filter(name='text').update(required=True)
+        cf = CustomField.objects.get(name='text')
+        cf.required = True
+        cf.save()
 
         form_data = {
             'name': 'Site 1',
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import django_rq
 from django.http import HttpResponse
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 from requests import Session
 from rest_framework import status
@@ -14,9 +14,10 @@ from core.models import ObjectType
 from dcim.choices import SiteStatusChoices
 from dcim.models import Site
 from extras.choices import EventRuleActionChoices
-from extras.events import enqueue_event, flush_events, serialize_for_event
+from extras.eventrules import event_rule_cache
+from extras.events import enqueue_event, flush_events, serialize_events, serialize_for_event
 from extras.models import EventRule, Tag, Webhook
-from extras.webhooks import generate_signature, send_webhook
+from extras.webhooks import generate_signature, send_webhook, send_webhooks
 from netbox.context_managers import event_tracking
 from utilities.testing import APITestCase
 
@@ -76,6 +77,30 @@ class EventRuleTest(APITestCase):
             Tag(name='Baz', slug='baz'),
         ))
 
+    def test_event_rule_cache(self):
+        site_type = ObjectType.objects.get_for_model(Site)
+        event_rule = EventRule.objects.get(name='Event Rule 1')
+        self.assertEqual(event_rule_cache.get_event_rules(OBJECT_CREATED, site_type), [event_rule])
+        self.assertEqual(event_rule_cache.get_event_rules(OBJECT_CREATED, ObjectType.objects.get_for_model(Tag)), [])
+
+        # Cached EventRules are copies with precompiled conditions
+        event_rule.conditions = {'attr': 'name', 'value': '^Site', 'op': 'regex'}
+        event_rule.save()
+        cached_rule = event_rule_cache.get_event_rules(OBJECT_CREATED, site_type)[0]
+        self.assertIsNot(cached_rule, event_rule_cache.get_event_rules(OBJECT_CREATED, site_type)[0])
+        self.assertIsNotNone(cached_rule._condition_set)
+        self.assertTrue(cached_rule.eval_conditions({'name': 'Site 1'}))
+        self.assertFalse(cached_rule.eval_conditions({'name': 'Device 1'}))
+
+        # Disabling or unassigning an EventRule removes it from the cache
+        event_rule.enabled = False
+        event_rule.save()
+        self.assertEqual(event_rule_cache.get_event_rules(OBJECT_CREATED, site_type), [])
+        event_rule.enabled = True
+        event_rule.save()
+        event_rule.object_types.clear()
+        self.assertEqual(event_rule_cache.get_event_rules(OBJECT_CREATED, site_type), [])
+
     def test_eventrule_conditions(self):
         """
         Test evaluation of EventRule conditions.
@@ -380,6 +405,125 @@ class EventRuleTest(APITestCase):
         with patch.object(Session, 'send', dummy_send):
             send_webhook(**job.kwargs)
 
+    @override_settings(WEBHOOK_BATCH_SIZE=10)
+    def test_send_webhooks_batched(self):
+        request_id = uuid.uuid4()
+        requests_sent = []
+
+        def dummy_send(_, request, **kwargs):
+            requests_sent.append(request)
+            return HttpResponse()
+
+        # Enqueue events for several objects
+        webhooks_queue = {}
+        for i in range(1, 4):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            enqueue_event(
+                webhooks_queue,
+                instance=site,
+                user=self.user,
+                request_id=request_id,
+                event_type=OBJECT_CREATED
+            )
+        flush_events(list(webhooks_queue.values()))
+
+        # All deliveries for the webhook should be queued as a single batch
+        self.assertEqual(self.queue.count, 1)
+        job = self.queue.jobs[0]
+        self.assertEqual(job.func_name, 'extras.webhooks.send_webhooks')
+        self.assertEqual(len(job.kwargs['deliveries']), 3)
+
+        # The deliveries should be coalesced into a single request
+        with patch.object(Session, 'send', dummy_send):
+            send_webhooks(**job.kwargs)
+        self.assertEqual(len(requests_sent), 1)
+        webhook = Webhook.objects.get(name='Webhook 1')
+        self.assertEqual(
+            requests_sent[0].headers['X-Hook-Signature'], generate_signature(requests_sent[0].body, webhook.secret)
+        )
+        body = json.loads(requests_sent[0].body)
+        self.assertEqual([event['data']['name'] for event in body], ['Site 1', 'Site 2', 'Site 3'])
+
+    @override_settings(WEBHOOK_BATCH_SIZE=10, WEBHOOK_CONCURRENCY=4)
+    def test_send_webhooks_batched_order(self):
+        requests_sent = []
+
+        def dummy_send(_, request, **kwargs):
+            requests_sent.append(request)
+            return HttpResponse()
+
+        # Render a distinct URL for each type of event
+        Webhook.objects.filter(name='Webhook 1').update(payload_url='http://localhost:9000/{{ event }}/')
+
+        # Create two sites, then update the first
+        webhooks_queue = {}
+        sites = [Site.objects.create(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 3)]
+        for site in sites:
+            enqueue_event(webhooks_queue, site, self.user, uuid.uuid4(), OBJECT_CREATED)
+        flush_events(list(webhooks_queue.values()))
+        webhooks_queue = {}
+        enqueue_event(webhooks_queue, sites[0], self.user, uuid.uuid4(), OBJECT_UPDATED)
+        flush_events(list(webhooks_queue.values()))
+        deliveries = [delivery for job in self.queue.jobs for delivery in job.kwargs['deliveries']]
+
+        # Requests for the same object should be sent in order, each with a list body
+        with patch.object(Session, 'send', dummy_send):
+            send_webhooks(deliveries=deliveries)
+        self.assertEqual(
+            [request.url for request in requests_sent],
+            ['http://localhost:9000/created/', 'http://localhost:9000/updated/']
+        )
+        self.assertEqual(
+            [[event['data']['name'] for event in json.loads(request.body)] for request in requests_sent],
+            [['Site 1', 'Site 2'], ['Site 1']]
+        )
+
+    def test_deferred_serialization(self):
+        request_id = uuid.uuid4()
+        site = Site.objects.create(name='Site 1', slug='site-1')
+
+        # Saving an object repeatedly should serialize it only once, when the queue is flushed
+        webhooks_queue = {}
+        with patch('extras.events.serialize_for_event', wraps=serialize_for_event) as mock_serialize:
+            for description in ('foo', 'bar'):
+                site.description = description
+                site.save()
+                enqueue_event(webhooks_queue, site, self.user, request_id, OBJECT_UPDATED)
+            self.assertEqual(mock_serialize.call_count, 0)
+            events = serialize_events(list(webhooks_queue.values()))
+            self.assertEqual(mock_serialize.call_count, 1)
+        self.assertEqual(events[0]['data']['description'], 'bar')
+        self.assertEqual(events[0]['snapshots']['postchange']['description'], 'bar')
+        self.assertNotIn('instance', events[0])
+
+        # Events to which no EventRules apply should be discarded without being serialized
+        event_rule = EventRule.objects.get(name='Event Rule 2')
+        event_rule.enabled = False
+        event_rule.save()
+        webhooks_queue = {}
+        with patch('extras.events.serialize_for_event', wraps=serialize_for_event) as mock_serialize:
+            enqueue_event(webhooks_queue, site, self.user, request_id, OBJECT_UPDATED)
+            self.assertEqual(serialize_events(list(webhooks_queue.values())), [])
+            self.assertEqual(mock_serialize.call_count, 0)
+
+    def test_serialization_error(self):
+        request_id = uuid.uuid4()
+        sites = [Site.objects.create(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 3)]
+
+        # An event which fails to serialize should be discarded without affecting other events
+        webhooks_queue = {}
+        for site in sites:
+            enqueue_event(webhooks_queue, site, self.user, request_id, OBJECT_CREATED)
+
+        def serialize(instance):
+            if instance.pk == sites[0].pk:
+                raise ValueError("Serialization failed")
+            return serialize_for_event(instance)
+
+        with patch('extras.events.serialize_for_event', serialize), self.assertLogs('netbox.events_processor'):
+            events = serialize_events(list(webhooks_queue.values()))
+        self.assertEqual([event['data']['name'] for event in events], ['Site 2'])
+
     def test_duplicate_triggers(self):
         """
         Test for erroneous duplicate event triggers resulting from saving an object multiple times
@@ -1,7 +1,10 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from core.models import ObjectType
 from dcim.models import Device, DeviceRole, DeviceType, Location, Manufacturer, Platform, Region, Site, SiteGroup
+from extras.configcontexts import config_context_resolver
 from extras.models import ConfigContext, Tag
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
@@ -478,3 +481,61 @@ class ConfigContextTest(TestCase):
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
+
+    def test_resolver_same_as_annotation(self):
+        """
+        Check that the config contexts resolved in memory for multiple objects match those provided by
+        annotate_config_context_data().
+        """
+        parent_region = Region.objects.first()
+        child_region = Region.objects.create(name='Child Region', slug='child-region', parent=parent_region)
+        site1 = Site.objects.first()
+        site2 = Site.objects.create(name='Site 2', slug='site-2', region=child_region)
+        site3 = Site.objects.create(name='Site 3', slug='site-3')
+        tenant = Tenant.objects.first()
+        tag = Tag.objects.first()
+        device_type = DeviceType.objects.first()
+        role = DeviceRole.objects.first()
+
+        region_context = ConfigContext.objects.create(name='region', weight=100, data={'region': 1, 'a': 1})
+        region_context.regions.add(parent_region)
+        site_context = ConfigContext.objects.create(name='site', weight=200, data={'site': 1, 'a': 2})
+        site_context.sites.add(site3)
+        tag_tenant_context = ConfigContext.objects.create(name='tag tenant', weight=300, data={'tag_tenant': 1})
+        tag_tenant_context.tags.add(tag)
+        tag_tenant_context.tenants.add(tenant)
+        inactive_context = ConfigContext.objects.create(name='inactive', is_active=False, data={'inactive': 1})
+        inactive_context.sites.add(site1, site2, site3)
+        ConfigContext.objects.create(name='global', weight=50, data={'global': 1, 'a': 0})
+
+        devices = [
+            Device.objects.create(name=f'Device {i + 2}', site=site, tenant=tenant if i % 2 else None,
+                                  device_type=device_type, role=role)
+            for i, site in enumerate((site1, site2, site3, site2))
+        ]
+        devices[1].tags.add(tag)
+        devices[2].tags.add(tag)
+
+        expected = {
+            device.pk: device.get_config_context()
+            for device in Device.objects.filter(pk__in=[d.pk for d in devices]).annotate_config_context_data()
+        }
+        self.assertEqual(expected[devices[1].pk], {'global': 1, 'region': 1, 'a': 1, 'tag_tenant': 1})
+        for device in devices:
+            self.assertEqual(device.get_config_context(), expected[device.pk])
+
+        # Resolving contexts for many objects requires no more queries than for a single object
+        queryset = Device.objects.filter(pk__in=[d.pk for d in devices])
+        with CaptureQueriesContext(connection) as ctx:
+            instances = list(queryset[:1])
+            config_context_resolver.annotate(instances)
+        with CaptureQueriesContext(connection) as ctx2:
+            instances = list(queryset)
+            config_context_resolver.annotate(instances)
+        self.assertEqual(len(ctx2.captured_queries), len(ctx.captured_queries))
+        for device in instances:
+            self.assertEqual(device.get_config_context(), expected[device.pk])
+
+        # Changes to assignments are reflected immediately
+        site_context.sites.add(site1)
+        self.assertEqual(devices[0].get_config_context()['site'], 1)
@@ -1,12 +1,20 @@
 import hashlib
 import hmac
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 import requests
 from django.conf import settings
-from django_rq import job
+from django_rq import get_queue, job
 from jinja2.exceptions import TemplateError
+from requests.adapters import HTTPAdapter
 
+from netbox.config import get_config
+from netbox.constants import RQ_QUEUE_DEFAULT
+from utilities.rqworker import get_rq_retry
 from .constants import WEBHOOK_EVENT_TYPES
 
 logger = logging.getLogger('netbox.webhooks')
@@ -24,14 +32,10 @@ def generate_signature(request_body, secret):
     return hmac_prep.hexdigest()
 
 
-@job('default')
-def send_webhook(event_rule, model_name, event_type, data, timestamp, username, request_id=None, snapshots=None):
+def get_context(model_name, event_type, data, timestamp, username, request_id=None, snapshots=None):
     """
-    Make a POST request to the defined Webhook
+    Return the context data for rendering a webhook's headers & body.
     """
-    webhook = event_rule.action_object
-
-    # Prepare context data for headers & body templates
     context = {
         'event': WEBHOOK_EVENT_TYPES.get(event_type, event_type),
         'timestamp': timestamp,
@@ -45,6 +49,13 @@ def send_webhook(event_rule, model_name, event_type, data, timestamp, username,
             'snapshots': snapshots
         })
 
+    return context
+
+
+def render_request(webhook, context):
+    """
+    Return the parameters of the HTTP request to be made by a webhook for the given context.
+    """
     # Build the headers for the HTTP request
     headers = {
         'Content-Type': webhook.http_content_type,
@@ -62,17 +73,18 @@ def send_webhook(event_rule, model_name, event_type, data, timestamp, username,
         logger.error(f"Error rendering request body for webhook {webhook}: {e}")
         raise e
 
-    # Prepare the HTTP request
-    params = {
+    return {
         'method': webhook.http_method,
         'url': webhook.render_payload_url(context),
         'headers': headers,
         'data': body.encode('utf8'),
     }
-    logger.info(
-        f"Sending {params['method']} request to {params['url']} ({context['model']} {context['event']})"
-    )
-    logger.debug(params)
+
+
+def prepare_request(webhook, params):
+    """
+    Return a PreparedRequest for the given request parameters, signed with the webhook's secret (if any).
+    """
     try:
         prepared_request = requests.Request(**params).prepare()
     except requests.exceptions.RequestException as e:
@@ -83,13 +95,13 @@ def send_webhook(event_rule, model_name, event_type, data, timestamp, username,
     if webhook.secret != '':
         prepared_request.headers['X-Hook-Signature'] = generate_signature(prepared_request.body, webhook.secret)
 
-    # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    return prepared_request
+
 
+def check_response(response):
+    """
+    Raise an exception if the given response does not indicate success.
+    """
     if 200 <= response.status_code <= 299:
         logger.info(f"Request succeeded; response status {response.status_code}")
         return f"Status {response.status_code} returned, webhook successfully processed."
@@ -98,3 +110,194 @@ def send_webhook(event_rule, model_name, event_type, data, timestamp, username,
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@job('default')
+def send_webhook(event_rule, model_name, event_type, data, timestamp, username, request_id=None, snapshots=None):
+    """
+    Make a POST request to the defined Webhook
+    """
+    webhook = event_rule.action_object
+
+    # Prepare context data for headers & body templates
+    context = get_context(model_name, event_type, data, timestamp, username, request_id, snapshots)
+
+    # Prepare the HTTP request
+    params = render_request(webhook, context)
+    logger.info(
+        f"Sending {params['method']} request to {params['url']} ({context['model']} {context['event']})"
+    )
+    logger.debug(params)
+    prepared_request = prepare_request(webhook, params)
+
+    # Send the request
+    with requests.Session() as session:
+        session.verify = webhook.ssl_verification
+        if webhook.ca_file_path:
+            session.verify = webhook.ca_file_path
+        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+
+    return check_response(response)
+
+
+class SessionPool:
+    """
+    Hold a persistent HTTP session for each webhook endpoint (and TLS verification setting), so that connections are
+    kept alive and reused among successive requests to the same endpoint.
+    """
+    def __init__(self, pool_size=10):
+        self.pool_size = pool_size
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def get_session(self, webhook, url):
+        verify = webhook.ca_file_path or webhook.ssl_verification
+        parsed_url = urlparse(url)
+        key = (parsed_url.scheme, parsed_url.netloc, verify)
+
+        with self.lock:
+            if key not in self.sessions:
+                session = requests.Session()
+                session.verify = verify
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.sessions[key] = session
+            return self.sessions[key]
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+# Sessions are retained for the life of the process. Note that the default RQ worker forks a new work horse process for
+# each job, in which case connections are reused only among the requests of a single batch.
+session_pool = SessionPool(pool_size=settings.WEBHOOK_CONCURRENCY)
+
+
+def deliver_webhooks(deliveries, session_pool, concurrency=1):
+    """
+    Send the HTTP requests for a list of webhook deliveries concurrently, reusing connections via the given SessionPool.
+    The body of each request for a webhook with a JSON content type is a JSON list of payloads: deliveries for the same
+    webhook which render an identical request URL and headers are coalesced into a single request. Requests pertaining
+    to the same object are sent sequentially, in the order of their deliveries. Returns a list of the deliveries which
+    could not be completed successfully.
+
+    Args:
+        deliveries: A list of dictionaries, each containing the parameters for send_webhook()
+        session_pool: The SessionPool from which to draw HTTP sessions
+        concurrency: The maximum number of requests to be made concurrently
+    """
+    failed = []
+
+    # Render each request, grouping those which can be coalesced into batches
+    batches = []
+    open_batches = {}
+    last_batches = {}
+    webhooks = {}
+    for delivery in deliveries:
+        event_rule = delivery['event_rule']
+        if event_rule.action_object_id not in webhooks:
+            webhooks[event_rule.action_object_id] = event_rule.action_object
+        webhook = webhooks[event_rule.action_object_id]
+        context = get_context(**{k: v for k, v in delivery.items() if k != 'event_rule'})
+        try:
+            params = render_request(webhook, context)
+        except (TemplateError, ValueError):
+            failed.append(delivery)
+            continue
+        object_key = (webhook.pk, delivery['model_name'], delivery['data'].get('id'))
+        is_json = webhook.http_content_type == 'application/json'
+        key = (webhook.pk, params['method'], params['url'], tuple(sorted(params['headers'].items())))
+        batch = open_batches.get(key) if is_json else None
+        # Don't add a delivery to a batch which precedes that of the object's previous delivery
+        if batch is None or batch['index'] < last_batches.get(object_key, -1):
+            batch = {
+                'index': len(batches),
+                'webhook': webhook,
+                'params': params,
+                'is_json': is_json,
+                'deliveries': [],
+                'bodies': [],
+            }
+            batches.append(batch)
+            if is_json:
+                open_batches[key] = batch
+        batch['deliveries'].append(delivery)
+        batch['bodies'].append(params['data'])
+        last_batches[object_key] = batch['index']
+
+    # Group batches which pertain to any of the same objects into sequences, each of which is sent in order
+    sequence_ids = list(range(len(batches)))
+
+    def get_sequence_id(index):
+        while sequence_ids[index] != index:
+            index = sequence_ids[index] = sequence_ids[sequence_ids[index]]
+        return index
+
+    first_batches = {}
+    for batch in batches:
+        for delivery in batch['deliveries']:
+            object_key = (batch['webhook'].pk, delivery['model_name'], delivery['data'].get('id'))
+            if object_key in first_batches:
+                sequence_ids[get_sequence_id(batch['index'])] = get_sequence_id(first_batches[object_key])
+            else:
+                first_batches[object_key] = batch['index']
+    sequences = defaultdict(list)
+    for batch in batches:
+        sequences[get_sequence_id(batch['index'])].append(batch)
+
+    def send(batch):
+        params = batch['params']
+        if batch['is_json']:
+            params = {**params, 'data': b'[' + b','.join(batch['bodies']) + b']'}
+        logger.info(f"Sending {params['method']} request to {params['url']} ({len(batch['bodies'])} events)")
+        prepared_request = prepare_request(batch['webhook'], params)
+        session = session_pool.get_session(batch['webhook'], params['url'])
+        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+        return check_response(response)
+
+    def send_sequence(sequence):
+        # Stop at the first failure, so that no later request for the same object is sent ahead of it
+        for i, batch in enumerate(sequence):
+            try:
+                send(batch)
+            except Exception as e:
+                logger.warning(f"Webhook delivery failed: {e}")
+                return [delivery for batch in sequence[i:] for delivery in batch['deliveries']]
+        return []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(send_sequence, sequence) for sequence in sequences.values()
+        ]
+        for future in as_completed(futures):
+            failed.extend(future.result())
+
+    return failed
+
+
+@job('default')
+def send_webhooks(deliveries, requeue=True):
+    """
+    Deliver a batch of webhooks (see deliver_webhooks()). Any deliveries which fail are re-queued together as a new
+    batch, to be retried per the configured retry policy; if requeue is False, an exception is instead raised to
+    trigger the retry of this task.
+    """
+    failed = deliver_webhooks(deliveries, session_pool, concurrency=settings.WEBHOOK_CONCURRENCY)
+
+    if failed:
+        message = f"{len(failed)} of {len(deliveries)} webhook deliveries FAILED"
+        if not requeue:
+            raise requests.exceptions.RequestException(message)
+
+        # The failed deliveries have been handed off to a new task, so this task has completed
+        rq_queue = get_queue(get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT))
+        rq_queue.enqueue("extras.webhooks.send_webhooks", deliveries=failed, requeue=False, retry=get_rq_retry())
+        message = f"{message}; these have been re-queued."
+        logger.warning(message)
+        return message
+
+    return f"{len(deliveries)} webhooks successfully processed."
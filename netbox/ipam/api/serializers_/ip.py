@@ -33,14 +33,17 @@ class AggregateSerializer(NetBoxModelSerializer):
     rir = RIRSerializer(nested=True)
     tenant = TenantSerializer(nested=True, required=False, allow_null=True)
     prefix = IPNetworkField()
+    # Included only if requested explicitly (see Meta.opt_in_fields)
+    utilization = serializers.FloatField(source='get_utilization', read_only=True)
 
     class Meta:
         model = Aggregate
         fields = [
             'id', 'url', 'display_url', 'display', 'family', 'prefix', 'rir', 'tenant', 'date_added', 'description',
-            'comments', 'tags', 'custom_fields', 'created', 'last_updated',
+            'comments', 'tags', 'custom_fields', 'created', 'last_updated', 'utilization',
         ]
         brief_fields = ('id', 'url', 'display', 'family', 'prefix', 'description')
+        opt_in_fields = ('utilization',)
 
 
 class PrefixSerializer(NetBoxModelSerializer):
@@ -54,15 +57,18 @@ class PrefixSerializer(NetBoxModelSerializer):
     children = serializers.IntegerField(read_only=True)
     _depth = serializers.IntegerField(read_only=True)
     prefix = IPNetworkField()
+    # Included only if requested explicitly (see Meta.opt_in_fields)
+    utilization = serializers.FloatField(source='get_utilization', read_only=True)
 
     class Meta:
         model = Prefix
         fields = [
             'id', 'url', 'display_url', 'display', 'family', 'prefix', 'site', 'vrf', 'tenant', 'vlan', 'status',
             'role', 'is_pool', 'mark_utilized', 'description', 'comments', 'tags', 'custom_fields',
-            'created', 'last_updated', 'children', '_depth',
+            'created', 'last_updated', 'children', '_depth', 'utilization',
         ]
         brief_fields = ('id', 'url', 'display', 'family', 'prefix', 'description', '_depth')
+        opt_in_fields = ('utilization',)
 
 
 class PrefixLengthSerializer(serializers.Serializer):
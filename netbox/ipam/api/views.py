@@ -71,6 +71,15 @@ class AggregateViewSet(NetBoxModelViewSet):
     serializer_class = serializers.AggregateSerializer
     filterset_class = filtersets.AggregateFilterSet
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Calculate utilization in the database when retrieving objects, if it has been requested
+        if self.request.method == 'GET' and self.requested_fields and 'utilization' in self.requested_fields:
+            queryset = queryset.annotate_utilization()
+
+        return queryset
+
 
 class RoleViewSet(NetBoxModelViewSet):
     queryset = Role.objects.all()
@@ -85,6 +94,15 @@ class PrefixViewSet(NetBoxModelViewSet):
 
     parent_model = Prefix  # AvailableIPsMixin
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Calculate utilization in the database when retrieving objects, if it has been requested
+        if self.request.method == 'GET' and self.requested_fields and 'utilization' in self.requested_fields:
+            queryset = queryset.annotate_utilization()
+
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "available_prefixes" and self.request.method == "POST":
             return serializers.PrefixLengthSerializer
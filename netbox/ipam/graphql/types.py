@@ -6,6 +6,7 @@ import strawberry_django
 from circuits.graphql.types import ProviderType
 from dcim.graphql.types import SiteType
 from ipam import models
+from ipam.querysets import AggregateQuerySet, PrefixQuerySet
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, OrganizationalObjectType
 from .filters import *
@@ -86,6 +87,10 @@ class AggregateType(NetBoxObjectType, BaseIPAddressFamilyType):
     rir: Annotated["RIRType", strawberry.lazy('ipam.graphql.types')] | None
     tenant: Annotated["TenantType", strawberry.lazy('tenancy.graphql.types')] | None
 
+    @strawberry_django.field(annotate={'utilization': AggregateQuerySet.get_utilization_expression()})
+    def utilization(self) -> float:
+        return self.get_utilization()
+
 
 @strawberry_django.type(
     models.FHRPGroup,
@@ -163,6 +168,10 @@ class PrefixType(NetBoxObjectType, BaseIPAddressFamilyType):
     vlan: Annotated["VLANType", strawberry.lazy('ipam.graphql.types')] | None
     role: Annotated["RoleType", strawberry.lazy('ipam.graphql.types')] | None
 
+    @strawberry_django.field(annotate={'utilization': PrefixQuerySet.get_utilization_expression()})
+    def utilization(self) -> float:
+        return self.get_utilization()
+
 
 @strawberry_django.type(
     models.RIR,
@@ -0,0 +1,18 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ipam', '0070_vlangroup_vlan_id_ranges'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='prefix',
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=['prefix'], name='ipam_prefix_prefix_gist', opclasses=['inet_ops']
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 import netaddr
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GistIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import F
@@ -14,7 +15,7 @@ from ipam.constants import *
 from ipam.fields import IPNetworkField, IPAddressField
 from ipam.lookups import Host
 from ipam.managers import IPAddressManager
-from ipam.querysets import PrefixQuerySet
+from ipam.querysets import AggregateQuerySet, PrefixQuerySet
 from ipam.validators import DNSValidator
 from netbox.config import get_config
 from netbox.models import OrganizationalModel, PrimaryModel
@@ -103,6 +104,8 @@ class Aggregate(ContactsMixin, GetAvailablePrefixesMixin, PrimaryModel):
         null=True
     )
 
+    objects = AggregateQuerySet.as_manager()
+
     clone_fields = (
         'rir', 'tenant', 'date_added', 'description',
     )
@@ -178,6 +181,10 @@ class Aggregate(ContactsMixin, GetAvailablePrefixesMixin, PrimaryModel):
         """
         Determine the prefix utilization of the aggregate and return it as a percentage.
         """
+        # Use the utilization calculated by AggregateQuerySet.annotate_utilization(), if available
+        if getattr(self, 'utilization', None) is not None:
+            return self.utilization
+
         queryset = Prefix.objects.filter(prefix__net_contained_or_equal=str(self.prefix))
         child_prefixes = netaddr.IPSet([p.prefix for p in queryset])
         utilization = float(child_prefixes.size) / self.prefix.size * 100
@@ -290,6 +297,10 @@ class Prefix(ContactsMixin, GetAvailablePrefixesMixin, PrimaryModel):
 
     class Meta:
         ordering = (F('vrf').asc(nulls_first=True), 'prefix', 'pk')  # (vrf, prefix) may be non-unique
+        indexes = (
+            # Supports containment lookups (e.g. when finding child prefixes to calculate utilization)
+            GistIndex(fields=['prefix'], opclasses=['inet_ops'], name='ipam_prefix_prefix_gist'),
+        )
         verbose_name = _('prefix')
         verbose_name_plural = _('prefixes')
 
@@ -463,6 +474,10 @@ class Prefix(ContactsMixin, GetAvailablePrefixesMixin, PrimaryModel):
         Determine the utilization of the prefix and return it as a percentage. For Prefixes with a status of
         "container", calculate utilization based on child prefixes. For all others, count child IP addresses.
         """
+        # Use the utilization calculated by PrefixQuerySet.annotate_utilization(), if available
+        if getattr(self, 'utilization', None) is not None:
+            return self.utilization
+
         if self.mark_utilized:
             return 100
 
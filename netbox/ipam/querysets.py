@@ -3,11 +3,13 @@ from django.db.models import Count, F, OuterRef, Q, Subquery, Value
 from django.db.models.expressions import RawSQL
 from django.db.models.functions import Round
 
+from ipam.choices import PrefixStatusChoices
 from utilities.query import count_related
 from utilities.querysets import RestrictedQuerySet
 
 __all__ = (
     'ASNRangeQuerySet',
+    'AggregateQuerySet',
     'PrefixQuerySet',
     'VLANGroupQuerySet',
     'VLANQuerySet',
@@ -32,6 +34,55 @@ class ASNRangeQuerySet(RestrictedQuerySet):
         return self.annotate(asn_count=Subquery(asns))
 
 
+# Total number of addresses in the prefix of the row being annotated
+PREFIX_SIZE_SQL = (
+    'POWER(2::numeric, CASE FAMILY({table}."prefix") WHEN 4 THEN 32 ELSE 128 END - MASKLEN({table}."prefix"))'
+)
+
+# Total number of addresses covered by the child prefixes matching {condition}, counting only those not nested within
+# another child prefix. (CIDR blocks are either nested or disjoint, so this gives the size of their union.)
+CHILD_PREFIXES_SIZE_SQL = (
+    'SELECT COALESCE(SUM(POWER(2::numeric, CASE FAMILY(U0."prefix") WHEN 4 THEN 32 ELSE 128 END - '
+    'MASKLEN(U0."prefix"))), 0) '
+    'FROM (SELECT DISTINCT U1."prefix" FROM "ipam_prefix" U1 WHERE {condition} AND NOT EXISTS ('
+    'SELECT 1 FROM "ipam_prefix" U2 WHERE {condition_u2} AND U2."prefix" >> U1."prefix")) U0'
+)
+
+# Condition matching the IP ranges {alias} within the Prefix being annotated (see Prefix.get_child_ranges())
+CHILD_RANGE_SQL = (
+    'COALESCE({alias}."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0) '
+    'AND CAST(HOST({alias}."start_address") AS INET) <<= "ipam_prefix"."prefix" '
+    'AND CAST(HOST({alias}."end_address") AS INET) <<= "ipam_prefix"."prefix"'
+)
+
+
+class AggregateQuerySet(RestrictedQuerySet):
+
+    @staticmethod
+    def get_utilization_expression():
+        """
+        Return an expression calculating the utilization of an Aggregate as a percentage, equivalent to
+        Aggregate.get_utilization().
+        """
+        aggregate_size = PREFIX_SIZE_SQL.format(table='"ipam_aggregate"')
+        child_prefixes_size = CHILD_PREFIXES_SIZE_SQL.format(
+            condition='U1."prefix" <<= "ipam_aggregate"."prefix"',
+            condition_u2='U2."prefix" <<= "ipam_aggregate"."prefix"'
+        )
+        return RawSQL(
+            f'LEAST(CAST(({child_prefixes_size}) AS DOUBLE PRECISION) / '
+            f'CAST({aggregate_size} AS DOUBLE PRECISION) * 100, 100)',
+            ()
+        )
+
+    def annotate_utilization(self):
+        """
+        Annotate the utilization of each Aggregate, calculated in the database. This avoids retrieving all child
+        prefixes of each Aggregate individually.
+        """
+        return self.annotate(utilization=self.get_utilization_expression())
+
+
 class PrefixQuerySet(RestrictedQuerySet):
 
     def annotate_hierarchy(self):
@@ -56,6 +107,70 @@ class PrefixQuerySet(RestrictedQuerySet):
             )
         )
 
+    @staticmethod
+    def get_utilization_expression():
+        """
+        Return an expression calculating the utilization of a Prefix as a percentage, equivalent to
+        Prefix.get_utilization(). Evaluates to null for non-container prefixes having overlapping child IP ranges,
+        whose utilization must be calculated by get_utilization() instead.
+        """
+        prefix_size = PREFIX_SIZE_SQL.format(table='"ipam_prefix"')
+        child_prefixes_size = CHILD_PREFIXES_SIZE_SQL.format(
+            condition='U1."prefix" << "ipam_prefix"."prefix" '
+                      'AND COALESCE(U1."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0)',
+            condition_u2='U2."prefix" << "ipam_prefix"."prefix" '
+                         'AND COALESCE(U2."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0)'
+        )
+
+        # Child IP ranges overlap one another
+        overlapping_ranges = (
+            f'SELECT 1 FROM "ipam_iprange" U3, "ipam_iprange" U4 '
+            f'WHERE {CHILD_RANGE_SQL.format(alias="U3")} AND {CHILD_RANGE_SQL.format(alias="U4")} '
+            f'AND U3."id" < U4."id" '
+            f'AND CAST(HOST(U3."start_address") AS INET) <= CAST(HOST(U4."end_address") AS INET) '
+            f'AND CAST(HOST(U4."start_address") AS INET) <= CAST(HOST(U3."end_address") AS INET)'
+        )
+
+        # Number of addresses within child IP ranges
+        child_ranges_size = (
+            f'SELECT COALESCE(SUM(U3."size"), 0) FROM "ipam_iprange" U3 WHERE {CHILD_RANGE_SQL.format(alias="U3")}'
+        )
+
+        # Number of distinct child IP addresses which do not fall within a child IP range
+        child_ips_count = (
+            f'SELECT COUNT(DISTINCT HOST(U5."address")) FROM "ipam_ipaddress" U5 '
+            f'WHERE COALESCE(U5."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0) '
+            f'AND CAST(HOST(U5."address") AS INET) <<= "ipam_prefix"."prefix" '
+            f'AND NOT EXISTS (SELECT 1 FROM "ipam_iprange" U3 WHERE {CHILD_RANGE_SQL.format(alias="U3")} '
+            f'AND CAST(HOST(U5."address") AS INET) BETWEEN CAST(HOST(U3."start_address") AS INET) '
+            f'AND CAST(HOST(U3."end_address") AS INET))'
+        )
+
+        # Exclude the network and broadcast addresses of IPv4 prefixes larger than /31 which are not pools
+        usable_size = (
+            f'{prefix_size} - CASE WHEN FAMILY("ipam_prefix"."prefix") = 4 AND MASKLEN("ipam_prefix"."prefix") < 31 '
+            f'AND NOT "ipam_prefix"."is_pool" THEN 2 ELSE 0 END'
+        )
+
+        return RawSQL(
+            f'CASE '
+            f'WHEN "ipam_prefix"."mark_utilized" THEN 100 '
+            f'WHEN "ipam_prefix"."status" = %s THEN LEAST(CAST(({child_prefixes_size}) AS DOUBLE PRECISION) / '
+            f'CAST({prefix_size} AS DOUBLE PRECISION) * 100, 100) '
+            f'WHEN EXISTS ({overlapping_ranges}) THEN NULL '
+            f'ELSE LEAST(CAST(({child_ranges_size}) + ({child_ips_count}) AS DOUBLE PRECISION) / '
+            f'CAST({usable_size} AS DOUBLE PRECISION) * 100, 100) '
+            f'END',
+            (PrefixStatusChoices.STATUS_CONTAINER,)
+        )
+
+    def annotate_utilization(self):
+        """
+        Annotate the utilization of each Prefix, calculated in the database. This avoids retrieving all child
+        prefixes or IP addresses and ranges of each Prefix individually.
+        """
+        return self.annotate(utilization=self.get_utilization_expression())
+
 
 class VLANGroupQuerySet(RestrictedQuerySet):
 
@@ -1,6 +1,7 @@
 from django.utils.translation import gettext_lazy as _
 import django_tables2 as tables
 from django.utils.safestring import mark_safe
+from django_tables2.data import TableQuerysetData
 from django_tables2.utils import Accessor
 
 from ipam.models import *
@@ -150,6 +151,14 @@ class AggregateTable(TenancyColumnsMixin, NetBoxTable):
         )
         default_columns = ('pk', 'prefix', 'rir', 'tenant', 'child_count', 'utilization', 'date_added', 'description')
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Calculate utilization in the database for all aggregates at once, rather than row by row
+        if 'utilization' in self.columns and self.columns['utilization'].visible:
+            if isinstance(self.data, TableQuerysetData):
+                self.data.data = self.data.data.annotate_utilization()
+
 
 #
 # Roles
@@ -295,6 +304,14 @@ class PrefixTable(TenancyColumnsMixin, NetBoxTable):
             'class': lambda record: 'success' if not record.pk else '',
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Calculate utilization in the database for all prefixes at once, rather than row by row
+        if 'utilization' in self.columns and self.columns['utilization'].visible:
+            if isinstance(self.data, TableQuerysetData):
+                self.data.data = self.data.data.annotate_utilization()
+
 
 #
 # IP ranges
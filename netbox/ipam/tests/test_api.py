@@ -382,6 +382,23 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         )
         Prefix.objects.bulk_create(prefixes)
 
+    def test_utilization(self):
+        """
+        Test that utilization is included only if requested explicitly.
+        """
+        prefix = Prefix.objects.create(prefix=IPNetwork('192.0.2.0/24'), status=PrefixStatusChoices.STATUS_CONTAINER)
+        Prefix.objects.create(prefix=IPNetwork('192.0.2.0/25'))
+        url = reverse('ipam-api:prefix-detail', kwargs={'pk': prefix.pk})
+        self.add_permissions('ipam.view_prefix')
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn('utilization', response.data)
+
+        response = self.client.get(f'{url}?fields=id,utilization', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['utilization'], 50)
+
     def test_list_available_prefixes(self):
         """
         Test retrieval of all available prefixes within a parent prefix.
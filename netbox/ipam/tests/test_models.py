@@ -35,6 +35,28 @@ class TestAggregate(TestCase):
         ))
         self.assertEqual(aggregate.get_utilization(), 100)
 
+    def test_annotate_utilization(self):
+        rir = RIR.objects.create(name='RIR 1', slug='rir-1')
+        vrf = VRF.objects.create(name='VRF 1')
+        aggregates = (
+            Aggregate(prefix=IPNetwork('10.0.0.0/8'), rir=rir),
+            Aggregate(prefix=IPNetwork('2001:db8::/32'), rir=rir),
+        )
+        Aggregate.objects.bulk_create(aggregates)
+        Prefix.objects.bulk_create((
+            Prefix(prefix=IPNetwork('10.0.0.0/12')),
+            Prefix(prefix=IPNetwork('10.0.0.0/16')),  # Nested
+            Prefix(prefix=IPNetwork('10.16.0.0/12'), vrf=vrf),
+            Prefix(prefix=IPNetwork('10.16.0.0/12')),  # Duplicate
+            Prefix(prefix=IPNetwork('2001:db8::/33')),
+        ))
+
+        annotated = Aggregate.objects.annotate_utilization().in_bulk([aggregate.pk for aggregate in aggregates])
+        self.assertEqual(annotated[aggregates[0].pk].utilization, 12.5)
+        self.assertEqual(annotated[aggregates[1].pk].utilization, 50)
+        for aggregate in aggregates:
+            self.assertEqual(annotated[aggregate.pk].get_utilization(), aggregate.get_utilization())
+
 
 class TestPrefix(TestCase):
 
@@ -223,6 +245,45 @@ class TestPrefix(TestCase):
         IPRange.objects.create(start_address=IPNetwork('10.0.0.33/24'), end_address=IPNetwork('10.0.0.64/24'))
         self.assertEqual(prefix.get_utilization(), 64 / 254 * 100)  # ~25% utilization
 
+    def test_annotate_utilization(self):
+        vrf = VRF.objects.create(name='VRF 1')
+        prefixes = (
+            Prefix(prefix=IPNetwork('10.0.0.0/16'), status=PrefixStatusChoices.STATUS_CONTAINER),
+            Prefix(prefix=IPNetwork('10.0.0.0/24')),
+            Prefix(prefix=IPNetwork('10.0.0.0/25')),
+            Prefix(prefix=IPNetwork('10.0.1.0/24'), vrf=vrf),
+            Prefix(prefix=IPNetwork('10.1.0.0/24')),
+            Prefix(prefix=IPNetwork('10.2.0.0/24')),
+            Prefix(prefix=IPNetwork('10.3.0.0/30'), is_pool=True),
+            Prefix(prefix=IPNetwork('10.4.0.0/24'), mark_utilized=True),
+            Prefix(prefix=IPNetwork('2001:db8::/120')),
+        )
+        Prefix.objects.bulk_create(prefixes)
+
+        # Child IPs (including a duplicate) partially overlapping a child range
+        IPAddress.objects.bulk_create([
+            *[IPAddress(address=IPNetwork(f'10.1.0.{i}/24')) for i in range(1, 11)],
+            IPAddress(address=IPNetwork('10.1.0.1/32')),
+            IPAddress(address=IPNetwork('10.1.0.1/24'), vrf=vrf),
+            IPAddress(address=IPNetwork('10.3.0.1/30')),
+            IPAddress(address=IPNetwork('2001:db8::1/64')),
+        ])
+        IPRange.objects.create(start_address=IPNetwork('10.1.0.5/24'), end_address=IPNetwork('10.1.0.20/24'))
+
+        # Overlapping child ranges
+        IPRange.objects.create(start_address=IPNetwork('10.2.0.1/24'), end_address=IPNetwork('10.2.0.10/24'))
+        IPRange.objects.create(start_address=IPNetwork('10.2.0.5/24'), end_address=IPNetwork('10.2.0.15/24'))
+
+        annotated = Prefix.objects.annotate_utilization().in_bulk([prefix.pk for prefix in prefixes])
+        self.assertEqual(annotated[prefixes[0].pk].utilization, 256 / 65536 * 100)
+        self.assertEqual(annotated[prefixes[4].pk].utilization, 20 / 254 * 100)
+        self.assertIsNone(annotated[prefixes[5].pk].utilization)  # Calculated by get_utilization() instead
+        self.assertEqual(annotated[prefixes[6].pk].utilization, 25)
+        self.assertEqual(annotated[prefixes[7].pk].utilization, 100)
+        self.assertEqual(annotated[prefixes[8].pk].utilization, 1 / 256 * 100)
+        for prefix in prefixes:
+            self.assertEqual(annotated[prefix.pk].get_utilization(), prefix.get_utilization())
+
     #
     # Uniqueness enforcement tests
     #
@@ -1,5 +1,11 @@
+import base64
+import binascii
+
 from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from netbox.config import get_config
 
@@ -9,12 +15,28 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Passing the `cursor` query parameter (with an empty value for the first page) enables keyset pagination: Objects
+    are ordered by primary key, and each page is retrieved by seeking past the last object of the previous page rather
+    than by offset. The total count is omitted unless `count=true` is also passed.
     """
+    cursor_query_param = 'cursor'
+    cursor_query_description = _('The cursor returned by the previous page (leave empty to retrieve the first page).')
+    count_query_param = 'count'
+    invalid_cursor_message = _('Invalid cursor')
+
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
+        self.keyset = False
+        self.cursor = None
+        self.next_cursor = None
 
     def paginate_queryset(self, queryset, request, view=None):
 
+        # Employ keyset pagination if a cursor has been specified
+        if isinstance(queryset, QuerySet) and self.cursor_query_param in request.query_params:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
         if isinstance(queryset, QuerySet):
             self.count = self.get_queryset_count(queryset)
         else:
@@ -36,6 +58,51 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset:])
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """
+        Return a page of objects ordered by primary key, beginning after the object identified by the cursor.
+        """
+        self.keyset = True
+        self.cursor = self.decode_cursor(request)
+        self.limit = self.get_limit(request)
+        self.request = request
+
+        # Count the matching objects only if requested
+        if request.query_params.get(self.count_query_param, '').lower() in ('true', '1'):
+            self.count = self.get_queryset_count(queryset)
+        else:
+            self.count = None
+
+        queryset = queryset.order_by('pk')
+        if self.cursor is not None:
+            queryset = queryset.filter(pk__gt=self.cursor)
+
+        if not self.limit:
+            return list(queryset)
+
+        # Retrieve one additional object to determine whether a subsequent page exists
+        results = list(queryset[:self.limit + 1])
+        if len(results) > self.limit:
+            results = results[:self.limit]
+            self.next_cursor = self.encode_cursor(results[-1].pk)
+
+        return results
+
+    def decode_cursor(self, request):
+        """
+        Return the primary key encoded by the cursor, or None if the cursor is empty.
+        """
+        if not (cursor := request.query_params[self.cursor_query_param]):
+            return None
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def encode_cursor(pk):
+        return base64.urlsafe_b64encode(str(pk).encode()).decode()
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -61,6 +128,13 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination
+        if self.keyset:
+            if self.next_cursor is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -69,8 +143,32 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination supports only forward iteration
+        if self.keyset:
+            return None
+
         return super().get_previous_link()
 
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # The count is omitted under keyset pagination unless requested
+        response_schema['properties']['count']['nullable'] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(self.cursor_query_description),
+                'schema': {
+                    'type': 'string',
+                },
+            },
+        ]
+
 
 class StripCountAnnotationsPaginator(OptionalLimitOffsetPagination):
     """
@@ -55,10 +55,14 @@ class BaseModelSerializer(serializers.ModelSerializer):
     def fields(self):
         """
         Override the fields property to check for requested fields. If defined,
-        return only the applicable fields.
+        return only the applicable fields. Otherwise, omit any fields listed in
+        Meta.opt_in_fields, which are included only when requested explicitly.
         """
         if not self._requested_fields:
-            return super().fields
+            fields = super().fields
+            for name in getattr(self.Meta, 'opt_in_fields', ()):
+                fields.pop(name, None)
+            return fields
 
         fields = BindingDict(self)
         for key, value in self.get_fields().items():
@@ -10,6 +10,7 @@ from rest_framework import mixins as drf_mixins
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from core.changelog import batch_changelog
 from utilities.api import get_annotations_for_serializer, get_prefetches_for_serializer
 from utilities.exceptions import AbortRequest
 from . import mixins
@@ -88,6 +89,7 @@ class BaseViewSet(GenericViewSet):
 class NetBoxReadOnlyModelViewSet(
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingExportMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.ListModelMixin,
     BaseViewSet
@@ -101,6 +103,7 @@ class NetBoxModelViewSet(
     mixins.ObjectValidationMixin,
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingExportMixin,
     drf_mixins.CreateModelMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.UpdateModelMixin,
@@ -165,7 +168,7 @@ class NetBoxModelViewSet(
 
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic():
+            with transaction.atomic(), batch_changelog():
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
@@ -185,7 +188,7 @@ class NetBoxModelViewSet(
 
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic():
+            with transaction.atomic(), batch_changelog():
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
@@ -203,7 +206,8 @@ class NetBoxModelViewSet(
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
         logger.info(f"Deleting {model._meta.verbose_name} {instance} (PK: {instance.pk})")
 
-        return super().perform_destroy(instance)
+        with transaction.atomic(), batch_changelog():
+            super().perform_destroy(instance)
 
 
 class MPTTLockedMixin:
@@ -1,12 +1,17 @@
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
+from django.utils.translation import gettext as _
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 from core.models import ObjectType
 from extras.models import ExportTemplate
 from netbox.api.serializers import BulkOperationSerializer
+from netbox.config import get_config
+from utilities.export import iter_buffered, iter_chunks, iter_csv
 
 __all__ = (
     'BulkDestroyModelMixin',
@@ -15,6 +20,7 @@ __all__ = (
     'ExportTemplatesMixin',
     'ObjectValidationMixin',
     'SequentialBulkCreatesMixin',
+    'StreamingExportMixin',
 )
 
 
@@ -50,6 +56,75 @@ class ExportTemplatesMixin:
         return super().list(request, *args, **kwargs)
 
 
+class StreamingExportMixin:
+    """
+    Enable list views to stream all matching objects as newline-delimited JSON (`?stream=ndjson`) or CSV
+    (`?stream=csv`), bypassing pagination. Objects are retrieved and serialized in chunks, with any prefetches applied
+    per chunk, so that memory use remains constant regardless of the number of objects. As with requests for all
+    objects (`?limit=0`), streaming is permitted only if MAX_PAGE_SIZE has been set to 0 or None.
+    """
+    stream_formats = {
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+    }
+
+    def list(self, request, *args, **kwargs):
+        if 'stream' in request.GET:
+            stream_format = request.GET['stream']
+            if stream_format not in self.stream_formats:
+                raise ValidationError({
+                    'stream': _("Invalid stream format: {format}. Must be one of: {formats}").format(
+                        format=stream_format, formats=', '.join(self.stream_formats)
+                    )
+                })
+            if get_config().MAX_PAGE_SIZE:
+                raise ValidationError({
+                    'stream': _("Streaming is not permitted while a maximum page size (MAX_PAGE_SIZE) is enforced.")
+                })
+            return self.stream_list(stream_format)
+
+        return super().list(request, *args, **kwargs)
+
+    def iter_serialized(self, queryset):
+        """
+        Yield the serialized representation of each object in the queryset, retrieving and serializing objects in
+        chunks.
+        """
+        context = self.get_serializer_context()
+        for chunk in iter_chunks(queryset):
+            yield from self.get_serializer(chunk, many=True, context=context).data
+
+    def stream_ndjson(self, queryset):
+        encoder = JSONEncoder()
+        for data in self.iter_serialized(queryset):
+            yield encoder.encode(data) + '\n'
+
+    def stream_csv(self, queryset):
+        # Nested objects and lists are represented as JSON
+        encoder = JSONEncoder()
+        headers = [
+            name for name, field in self.get_serializer().fields.items() if not field.write_only
+        ]
+        rows = (
+            [
+                encoder.encode(value) if isinstance(value, (dict, list)) else value
+                for value in (data.get(name) for name in headers)
+            ] for data in self.iter_serialized(queryset)
+        )
+        yield from iter_csv([headers])
+        yield from iter_csv(rows)
+
+    def stream_list(self, stream_format):
+        queryset = self.filter_queryset(self.get_queryset())
+        stream = getattr(self, f'stream_{stream_format}')(queryset)
+        response = StreamingHttpResponse(iter_buffered(stream), content_type=self.stream_formats[stream_format])
+        if stream_format == 'csv':
+            filename = f'netbox_{queryset.model._meta.verbose_name_plural}.csv'
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+
 class SequentialBulkCreatesMixin:
     """
     Perform bulk creation of new objects sequentially, rather than all at once. This ensures that any validation
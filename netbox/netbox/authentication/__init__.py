@@ -1,20 +1,29 @@
 import logging
+import uuid
 from collections import defaultdict
 
 from django.conf import settings
 from django.contrib.auth.backends import ModelBackend, RemoteUserBackend as _RemoteUserBackend
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from users.constants import CONSTRAINT_TOKEN_USER
 from users.models import Group, ObjectPermission, User
 from utilities.permissions import (
-    permission_is_exempt, qs_filter_from_constraints, resolve_permission, resolve_permission_type,
+    evaluate_constraints, get_constraints_filter, permission_is_exempt, resolve_permission, resolve_permission_type,
 )
 from .misc import _mirror_groups
 
+# Cache key holding a token which changes whenever an ObjectPermission or its assignment to users/groups changes
+CACHE_KEY_PERMISSIONS_VERSION = 'object_permissions_version'
+
+# Number of seconds for which the ObjectPermissions assigned to a user are cached
+PERMISSIONS_CACHE_TIMEOUT = 3600
+
 AUTH_BACKEND_ATTRS = {
     # backend name: title, MDI icon name
     'amazon': ('Amazon AWS', 'aws'),
@@ -63,7 +72,23 @@ def get_saml_idps():
     return getattr(settings, "SOCIAL_AUTH_SAML_ENABLED_IDPS", {}).keys()
 
 
+def invalidate_object_permissions():
+    """
+    Invalidate the cached ObjectPermissions of all users. The cache version is changed both immediately and upon
+    commit of the current transaction (if any), so that permissions read by another process prior to the commit are
+    not retained.
+    """
+    def update_version():
+        cache.set(CACHE_KEY_PERMISSIONS_VERSION, uuid.uuid4().hex, None)
+
+    update_version()
+    transaction.on_commit(update_version)
+
+
 class ObjectPermissionMixin:
+    # Cache the ObjectPermissions assigned to each user across requests. This must be disabled if permission
+    # assignment depends on anything other than the user's assigned ObjectPermissions and groups.
+    cache_object_permissions = True
 
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
@@ -91,6 +116,27 @@ class ObjectPermissionMixin:
                 )
             perms[perm_name].extend(constraints)
 
+        # Add all permissions granted by assigned ObjectPermissions
+        for perm_name, constraints in self.get_assigned_permissions(user_obj).items():
+            perms[perm_name].extend(constraints)
+
+        return perms
+
+    def get_assigned_permissions(self, user_obj):
+        """
+        Return a dictionary mapping permission names to lists of constraints for all enabled ObjectPermissions assigned
+        to the user, either directly or via a group. The result is cached until any ObjectPermission or assignment
+        changes.
+        """
+        if self.cache_object_permissions:
+            cache.add(CACHE_KEY_PERMISSIONS_VERSION, uuid.uuid4().hex, None)
+            version = cache.get(CACHE_KEY_PERMISSIONS_VERSION)
+            cache_key = f'object_permissions_{user_obj.pk}_{version}'
+            if (perms := cache.get(cache_key)) is not None:
+                return perms
+
+        perms = defaultdict(list)
+
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
             self.get_permission_filter(user_obj),
@@ -104,6 +150,10 @@ class ObjectPermissionMixin:
                     perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
                     perms[perm_name].extend(obj_perm.list_constraints())
 
+        perms = dict(perms)
+        if self.cache_object_permissions:
+            cache.set(cache_key, perms, PERMISSIONS_CACHE_TIMEOUT)
+
         return perms
 
     def has_perm(self, user_obj, perm, obj=None):
@@ -139,15 +189,20 @@ class ObjectPermissionMixin:
                 permission=perm, model=model
             ))
 
-        # Compile a QuerySet filter that matches all instances of the specified model
+        # If possible, evaluate the constraints against the object's attributes without querying the database. This
+        # is limited to simple matches on the object's own fields which have not been modified since the object was
+        # retrieved (see evaluate_constraints()); otherwise, the database record is checked.
         tokens = {
             CONSTRAINT_TOKEN_USER: user_obj,
         }
-        qs_filter = qs_filter_from_constraints(object_permissions[perm], tokens)
+        if (permitted := evaluate_constraints(obj, object_permissions[perm], tokens)) is not None:
+            return permitted
 
-        # Permission to perform the requested action on the object depends on whether the specified object matches
-        # the specified constraints. Note that this check is made against the *database* record representing the object,
-        # not the instance itself.
+        # Compile a QuerySet filter that matches all instances of the specified model
+        qs_filter = get_constraints_filter(user_obj, perm, model)[0]
+
+        # Otherwise, permission to perform the requested action on the object depends on whether the *database*
+        # record representing the object matches the specified constraints.
         return model.objects.filter(qs_filter, pk=obj.pk).exists()
 
 
@@ -317,6 +372,9 @@ try:
     from django_auth_ldap.backend import _LDAPUser, LDAPBackend as LDAPBackend_
 
     class NBLDAPBackend(ObjectPermissionMixin, LDAPBackend_):
+        # Permissions may be assigned via LDAP group membership, which is not tracked by NetBox
+        cache_object_permissions = False
+
         def get_permission_filter(self, user_obj):
             permission_filter = super().get_permission_filter(user_obj)
             if (self.settings.FIND_GROUP_PERMS and
@@ -1,21 +1,34 @@
 from contextlib import contextmanager
 
-from netbox.context import current_request, events_queue
+from netbox.context import current_request, events_queue, search_queue
+from netbox.search.backends import search_backend
 from extras.events import flush_events
+from utilities.counters import batch_counter_updates
 
 
 @contextmanager
 def event_tracking(request):
     """
     Queue interesting events in memory while processing a request, then flush that queue for processing by the
-    events pipline before returning the response.
+    events pipline before returning the response. Objects to be (re)indexed for search are likewise queued and
+    cached in bulk once the request has been processed, and counter fields are recalculated once for all affected
+    objects.
 
     :param request: WSGIRequest object with a unique `id` set
     """
     current_request.set(request)
     events_queue.set({})
+    search_queue.set({})
 
-    yield
+    try:
+        with batch_counter_updates():
+            yield
+    finally:
+        # Update the search cache for all created, modified, or deleted objects
+        queue = search_queue.get()
+        search_queue.set(None)
+        if queue:
+            search_backend.flush(queue)
 
     # Flush queued webhooks to RQ
     if events := list(events_queue.get().values()):
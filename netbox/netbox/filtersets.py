@@ -11,7 +11,8 @@ from core.choices import ObjectChangeActionChoices
 from core.models import ObjectChange
 from extras.choices import CustomFieldFilterLogicChoices
 from extras.filters import TagFilter
-from extras.models import CustomField, SavedFilter
+from extras.customfields import custom_field_cache
+from extras.models import SavedFilter
 from utilities.constants import (
     FILTER_CHAR_BASED_LOOKUP_MAP, FILTER_NEGATION_LOOKUP_MAP, FILTER_TREENODE_NEGATION_LOOKUP_MAP,
     FILTER_NUMERIC_BASED_LOOKUP_MAP
@@ -282,11 +283,10 @@ class NetBoxModelFilterSet(ChangeLoggedModelFilterSet):
         super().__init__(*args, **kwargs)
 
         # Dynamically add a Filter for each CustomField applicable to the parent model
-        custom_fields = CustomField.objects.filter(
-            object_types=ContentType.objects.get_for_model(self._meta.model)
-        ).exclude(
-            filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED
-        )
+        custom_fields = [
+            cf for cf in custom_field_cache.get_for_model(self._meta.model)
+            if cf.filter_logic != CustomFieldFilterLogicChoices.FILTER_DISABLED
+        ]
 
         custom_field_filters = {}
         for custom_field in custom_fields:
@@ -9,6 +9,7 @@ from rq.timeouts import JobTimeoutException
 from core.choices import JobStatusChoices
 from core.models import Job, ObjectType
 from netbox.constants import ADVISORY_LOCK_KEYS
+from utilities.counters import batch_counter_updates
 
 __all__ = (
     'JobRunner',
@@ -56,7 +57,8 @@ class JobRunner(ABC):
         """
         try:
             job.start()
-            cls(job).run(*args, **kwargs)
+            with batch_counter_updates():
+                cls(job).run(*args, **kwargs)
             job.terminate()
 
         except Exception as e:
@@ -65,6 +65,14 @@ class ChangeLoggingMixin(models.Model):
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Retain the values loaded from the database, so that unsaved modifications can be detected (see
+        # evaluate_constraints())
+        instance._state.loaded_values = (field_names, values)
+        return instance
+
     def serialize_object(self, exclude=None):
         """
         Return a JSON representation of the instance. Models can override this method to replace or extend the default
@@ -151,7 +159,8 @@ class CloningMixin(models.Model):
 
         # Include any cloneable custom fields
         if hasattr(self, 'custom_fields'):
-            for field in self.custom_fields:
+            from extras.customfields import custom_field_cache
+            for field in custom_field_cache.get_for_model(self):
                 if field.is_cloneable:
                     attrs[f'cf_{field.name}'] = self.custom_field_data.get(field.name)
 
@@ -182,9 +191,21 @@ class CustomFieldsMixin(models.Model):
         {'primary_site': <Site: DM-NYC>, 'cust_id': 'DMI01', 'is_active': True}
         ```
         """
+        from extras.customfields import custom_field_cache
+        from extras.models import CustomField
+
+        # Resolve all object values using a single query per related object type. Multi-object values are returned as
+        # (lazily evaluated) QuerySets.
+        custom_fields = custom_field_cache.get_for_model(self)
+        object_fields = [cf for cf in custom_fields if cf.type == CustomFieldTypeChoices.TYPE_OBJECT]
+        related_objects = CustomField.objects.get_related_objects(object_fields, [self.custom_field_data])
+
         return {
-            cf.name: cf.deserialize(self.custom_field_data.get(cf.name))
-            for cf in self.custom_fields
+            cf.name: cf.deserialize(
+                self.custom_field_data.get(cf.name),
+                related_objects if cf.type == CustomFieldTypeChoices.TYPE_OBJECT else None
+            )
+            for cf in custom_fields
         }
 
     @cached_property
@@ -214,10 +235,13 @@ class CustomFieldsMixin(models.Model):
         Args:
             omit_hidden: If True, custom fields with no UI visibility will be omitted.
         """
+        from extras.customfields import custom_field_cache
         from extras.models import CustomField
         data = {}
+        custom_fields = custom_field_cache.get_for_model(self)
+        related_objects = CustomField.objects.get_related_objects(custom_fields, [self.custom_field_data])
 
-        for field in CustomField.objects.get_for_model(self):
+        for field in custom_fields:
             value = self.custom_field_data.get(field.name)
 
             # Skip hidden fields if 'omit_hidden' is True
@@ -226,7 +250,7 @@ class CustomFieldsMixin(models.Model):
             elif omit_hidden and field.ui_visible == CustomFieldUIVisibleChoices.IF_SET and not value:
                 continue
 
-            data[field] = field.deserialize(value)
+            data[field] = field.deserialize(value, related_objects)
 
         return data
 
@@ -243,17 +267,19 @@ class CustomFieldsMixin(models.Model):
         }
         ```
         """
+        from extras.customfields import custom_field_cache
         from extras.models import CustomField
         groups = defaultdict(dict)
-        visible_custom_fields = CustomField.objects.get_for_model(self).exclude(
-            ui_visible=CustomFieldUIVisibleChoices.HIDDEN
-        )
+        visible_custom_fields = [
+            cf for cf in custom_field_cache.get_for_model(self) if cf.ui_visible != CustomFieldUIVisibleChoices.HIDDEN
+        ]
+        related_objects = CustomField.objects.get_related_objects(visible_custom_fields, [self.custom_field_data])
 
         for cf in visible_custom_fields:
             value = self.custom_field_data.get(cf.name)
             if value in CUSTOMFIELD_EMPTY_VALUES and cf.ui_visible == CustomFieldUIVisibleChoices.IF_SET:
                 continue
-            value = cf.deserialize(value)
+            value = cf.deserialize(value, related_objects)
             groups[cf.group_name][cf] = value
 
         return dict(groups)
@@ -262,16 +288,17 @@ class CustomFieldsMixin(models.Model):
         """
         Apply the default value for each custom field
         """
-        for cf in self.custom_fields:
+        from extras.customfields import custom_field_cache
+        for cf in custom_field_cache.get_for_model(self):
             self.custom_field_data[cf.name] = cf.default
     populate_custom_field_defaults.alters_data = True
 
     def clean(self):
         super().clean()
-        from extras.models import CustomField
+        from extras.customfields import custom_field_cache
 
         custom_fields = {
-            cf.name: cf for cf in CustomField.objects.get_for_model(self)
+            cf.name: cf for cf in custom_field_cache.get_for_model(self)
         }
 
         # Validate all field values
@@ -85,6 +85,27 @@ class SearchIndex:
         if value := getattr(instance, field_name):
             return str(value)
 
+    @classmethod
+    def get_required_fields(cls):
+        """
+        Return the names of the concrete model fields needed to cache an instance, suitable for passing to a
+        QuerySet's only() method. Returns None if any indexed field is not a simple concrete field (e.g. an object
+        attribute or related object), in which case all fields should be loaded.
+        """
+        field_names = []
+        for name, _ in cls.fields:
+            try:
+                field = cls.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.is_relation:
+                return None
+            field_names.append(name)
+        if hasattr(cls.model, 'custom_field_data'):
+            field_names.append('custom_field_data')
+
+        return field_names
+
     @classmethod
     def get_category(cls):
         return cls.category or cls.model._meta.app_config.verbose_name
@@ -118,7 +139,8 @@ class SearchIndex:
         # Capture custom fields
         if getattr(instance, 'custom_field_data', None):
             if custom_fields is None:
-                custom_fields = instance.custom_fields
+                from extras.customfields import custom_field_cache
+                custom_fields = custom_field_cache.get_for_model(instance)
             for cf in custom_fields:
                 type_ = cf.search_type
                 value = instance.custom_field_data.get(cf.name)
@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import TrigramSimilarity
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import F, Window, Q, prefetch_related_objects
 from django.db.models.fields.related import ForeignKey
@@ -13,7 +14,9 @@ import netaddr
 from netaddr.core import AddrFormatError
 
 from core.models import ObjectType
-from extras.models import CachedValue, CustomField
+from extras.customfields import custom_field_cache
+from extras.models import CachedValue
+from netbox.context import search_queue
 from netbox.registry import registry
 from utilities.object_types import object_type_identifier
 from utilities.querysets import RestrictedPrefetch
@@ -23,6 +26,9 @@ from . import FieldTypes, LookupTypes, get_indexer
 DEFAULT_LOOKUP_TYPE = LookupTypes.PARTIAL
 MAX_RESULTS = 1000
 
+# Maximum number of objects to remove from or add to the cache in a single query
+BATCH_SIZE = 2000
+
 
 class SearchBackend:
     """
@@ -62,13 +68,48 @@ class SearchBackend:
         """
         Receiver for the post_save signal, responsible for caching object creation/changes.
         """
-        self.cache(instance, remove_existing=not created)
+        if not self.enqueue(instance):
+            self.cache(instance, remove_existing=not created)
 
     def removal_handler(self, sender, instance, **kwargs):
         """
         Receiver for the post_delete signal, responsible for caching object deletion.
         """
-        self.remove(instance)
+        if not self.enqueue(instance):
+            self.remove(instance)
+
+    def enqueue(self, instance):
+        """
+        Defer the caching of an instance until the active search queue (if any) is flushed. Returns False if no queue
+        is active, in which case the instance should be cached immediately.
+        """
+        queue = search_queue.get()
+        if queue is None:
+            return False
+
+        # Ignore non-cacheable objects
+        try:
+            get_indexer(instance)
+        except KeyError:
+            return True
+
+        queue.setdefault(instance._meta.model, set()).add(instance.pk)
+        return True
+
+    def flush(self, queue):
+        """
+        Update the cached representations of all queued objects, given as a mapping of models to sets of primary keys.
+        Objects which no longer exist are removed from the cache.
+        """
+        for model, pks in queue.items():
+            pks = list(pks)
+            for i in range(0, len(pks), BATCH_SIZE):
+                instances = model.objects.in_bulk(pks[i:i + BATCH_SIZE])
+                for pk in pks[i:i + BATCH_SIZE]:
+                    if pk in instances:
+                        self.cache(instances[pk])
+                    else:
+                        self.remove(model(pk=pk))
 
     def cache(self, instances, indexer=None, remove_existing=True):
         """
@@ -105,9 +146,10 @@ class SearchBackend:
 
 class CachedValueSearchBackend(SearchBackend):
 
-    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
-
-        # Build the filter used to find relevant CachedValue records
+    def get_query_filter(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        """
+        Return a Q object for matching CachedValue records against the given value.
+        """
         query_filter = Q(**{f'value__{lookup}': value})
         if object_types:
             # Limit results by object type
@@ -123,8 +165,13 @@ class CachedValueSearchBackend(SearchBackend):
             except (AddrFormatError, ValueError):
                 pass
 
-        # Construct the base queryset to retrieve matching results
-        queryset = CachedValue.objects.filter(query_filter).annotate(
+        return query_filter
+
+    def get_queryset(self, value, query_filter):
+        """
+        Return the base queryset of matching CachedValues (limited to MAX_RESULTS).
+        """
+        return CachedValue.objects.filter(query_filter).annotate(
             # Annotate the rank of each result for its object according to its weight
             row_number=Window(
                 expression=window.RowNumber(),
@@ -133,6 +180,19 @@ class CachedValueSearchBackend(SearchBackend):
             )
         )[:MAX_RESULTS]
 
+    def get_results_sql(self, sql):
+        """
+        Wrap the base query SQL to return only the lowest-weight result for each object.
+        """
+        # Hat-tip to https://blog.oyam.dev/django-filter-by-window-function/ for the solution
+        return f"SELECT * FROM ({sql}) t WHERE row_number = 1"
+
+    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+
+        # Construct the base queryset to retrieve matching results
+        query_filter = self.get_query_filter(value, object_types=object_types, lookup=lookup)
+        queryset = self.get_queryset(value, query_filter)
+
         # Gather all ObjectTypes present in the search results (used for prefetching related
         # objects). This must be done before generating the final results list, which returns
         # a RawQuerySet.
@@ -147,12 +207,8 @@ class CachedValueSearchBackend(SearchBackend):
             prefetch = ('object', 'object_type')
 
         # Wrap the base query to return only the lowest-weight result for each object
-        # Hat-tip to https://blog.oyam.dev/django-filter-by-window-function/ for the solution
         sql, params = queryset.query.sql_with_params()
-        results = CachedValue.objects.prefetch_related(*prefetch).raw(
-            f"SELECT * FROM ({sql}) t WHERE row_number = 1",
-            params
-        )
+        results = CachedValue.objects.prefetch_related(*prefetch).raw(self.get_results_sql(sql), params)
 
         # Iterate through each ObjectType represented in the search results and prefetch any
         # related objects necessary to render the prescribed display attributes (display_attrs).
@@ -206,9 +262,8 @@ class CachedValueSearchBackend(SearchBackend):
                     except KeyError:
                         break
 
-                # Prefetch any associated custom fields
-                object_type = ObjectType.objects.get_for_model(indexer.model)
-                custom_fields = CustomField.objects.filter(object_types=object_type).exclude(search_weight=0)
+                # Retrieve any associated custom fields
+                custom_fields = [cf for cf in custom_field_cache.get_for_model(indexer.model) if cf.search_weight]
 
             # Wipe out any previously cached values for the object
             if remove_existing:
@@ -251,6 +306,24 @@ class CachedValueSearchBackend(SearchBackend):
         # Call _raw_delete() on the queryset to avoid first loading instances into memory
         return qs._raw_delete(using=qs.db)
 
+    def flush(self, queue):
+        for model, pks in queue.items():
+            indexer = get_indexer(model)
+            ct = ContentType.objects.get_for_model(model)
+            pks = list(pks)
+            for i in range(0, len(pks), BATCH_SIZE):
+                batch = pks[i:i + BATCH_SIZE]
+
+                # Wipe out any previously cached values for the batch in a single query
+                qs = CachedValue.objects.filter(object_type=ct, object_id__in=batch)
+                qs._raw_delete(using=qs.db)
+
+                # Cache the current state of all objects which still exist
+                queryset = model.objects.filter(pk__in=batch)
+                if (fields := indexer.get_required_fields()) is not None:
+                    queryset = queryset.only(*fields)
+                self.cache(queryset, indexer=indexer, remove_existing=False)
+
     def clear(self, object_types=None):
         qs = CachedValue.objects.all()
         if object_types:
@@ -270,6 +343,26 @@ class CachedValueSearchBackend(SearchBackend):
         return CachedValue.objects.count()
 
 
+class TrigramSearchBackend(CachedValueSearchBackend):
+    """
+    A variant of CachedValueSearchBackend optimized for large numbers of cached values. Matches are found using the
+    pg_trgm GIN index on CachedValue, limited to the MAX_RESULTS best matches by weight and trigram similarity, and
+    de-duplicated per object with DISTINCT ON rather than a window function.
+    """
+    def get_queryset(self, value, query_filter):
+        return CachedValue.objects.filter(query_filter).annotate(
+            similarity=TrigramSimilarity('value', value)
+        ).order_by('weight', '-similarity')[:MAX_RESULTS]
+
+    def get_results_sql(self, sql):
+        return (
+            f"SELECT * FROM ("
+            f"SELECT DISTINCT ON (object_type_id, object_id) * FROM ({sql}) t "
+            f"ORDER BY object_type_id, object_id, weight, similarity DESC"
+            f") r ORDER BY weight, similarity DESC"
+        )
+
+
 def get_backend():
     """
     Initializes and returns the configured search backend.
@@ -4,6 +4,7 @@ import importlib.util
 import os
 import platform
 import sys
+import tempfile
 import warnings
 from urllib.parse import urlencode, urlsplit
 
@@ -116,9 +117,11 @@ EMAIL = getattr(configuration, 'EMAIL', {})
 EVENTS_PIPELINE = getattr(configuration, 'EVENTS_PIPELINE', (
     'extras.events.process_event_queue',
 ))
+EXPORT_BACKGROUND_THRESHOLD = getattr(configuration, 'EXPORT_BACKGROUND_THRESHOLD', None)
 EXEMPT_VIEW_PERMISSIONS = getattr(configuration, 'EXEMPT_VIEW_PERMISSIONS', [])
 FIELD_CHOICES = getattr(configuration, 'FIELD_CHOICES', {})
 FILE_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'FILE_UPLOAD_MAX_MEMORY_SIZE', 2621440)
+GIT_CLONE_ROOT = getattr(configuration, 'GIT_CLONE_ROOT', os.path.join(tempfile.gettempdir(), 'netbox-git')).rstrip('/')
 GRAPHQL_MAX_ALIASES = getattr(configuration, 'GRAPHQL_MAX_ALIASES', 10)
 HTTP_PROXIES = getattr(configuration, 'HTTP_PROXIES', None)
 INTERNAL_IPS = getattr(configuration, 'INTERNAL_IPS', ('127.0.0.1', '::1'))
@@ -181,6 +184,8 @@ STORAGE_BACKEND = getattr(configuration, 'STORAGE_BACKEND', None)
 STORAGE_CONFIG = getattr(configuration, 'STORAGE_CONFIG', {})
 TIME_ZONE = getattr(configuration, 'TIME_ZONE', 'UTC')
 TRANSLATION_ENABLED = getattr(configuration, 'TRANSLATION_ENABLED', True)
+WEBHOOK_BATCH_SIZE = getattr(configuration, 'WEBHOOK_BATCH_SIZE', 1)
+WEBHOOK_CONCURRENCY = getattr(configuration, 'WEBHOOK_CONCURRENCY', 4)
 
 # Load any dynamic configuration parameters which have been hard-coded in the configuration file
 for param in CONFIG_PARAMS:
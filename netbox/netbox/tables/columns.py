@@ -506,7 +506,31 @@ class CustomFieldColumn(tables.Column):
             return f'<a href="{item.get_absolute_url()}">{escape(item)}</a>'
         return escape(item)
 
-    def render(self, value):
+    def _get_related_objects(self, table):
+        """
+        Retrieve the objects referenced by all object and multi-object custom fields for the rows being rendered (the
+        current page, if the table is paginated), so that each value need not be queried individually.
+        """
+        if self.customfield.type not in (
+            CustomFieldTypeChoices.TYPE_OBJECT,
+            CustomFieldTypeChoices.TYPE_MULTIOBJECT
+        ):
+            return None
+        if not hasattr(table, '_custom_field_objects'):
+            from extras.models import CustomField
+            page = getattr(table, 'page', None)
+            records = [row.record for row in page.object_list] if page else table.data
+            table._custom_field_objects = CustomField.objects.get_related_objects(
+                [
+                    column.column.customfield for column in table.columns
+                    if column.visible and isinstance(column.column, CustomFieldColumn)
+                ],
+                [getattr(record, 'custom_field_data', None) or {} for record in records]
+            )
+        return table._custom_field_objects
+
+    def render(self, value, table):
+        related_objects = self._get_related_objects(table)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is True:
             return mark_safe('<i class="mdi mdi-check-bold text-success"></i>')
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is False:
@@ -519,22 +543,23 @@ class CustomFieldColumn(tables.Column):
             return ', '.join(self.customfield.get_choice_label(v) for v in value)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
             return mark_safe(', '.join(
-                self._linkify_item(obj) for obj in self.customfield.deserialize(value)
+                self._linkify_item(obj) for obj in self.customfield.deserialize(value, related_objects)
             ))
         if self.customfield.type == CustomFieldTypeChoices.TYPE_LONGTEXT and value:
             return render_markdown(value)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_DATE and value:
             return parse_date(value).isoformat()
         if value is not None:
-            obj = self.customfield.deserialize(value)
+            obj = self.customfield.deserialize(value, related_objects)
             return mark_safe(self._linkify_item(obj))
         return self.default
 
-    def value(self, value):
+    def value(self, value, table):
+        related_objects = self._get_related_objects(table)
         if isinstance(value, list):
-            return ','.join(str(v) for v in self.customfield.deserialize(value))
+            return ','.join(str(v) for v in self.customfield.deserialize(value, related_objects))
         if value is not None:
-            return self.customfield.deserialize(value)
+            return self.customfield.deserialize(value, related_objects)
         return self.default
 
 
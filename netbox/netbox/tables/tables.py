@@ -15,7 +15,8 @@ from django_tables2.data import TableQuerysetData
 
 from core.models import ObjectType
 from extras.choices import *
-from extras.models import CustomField, CustomLink
+from extras.customfields import custom_field_cache
+from extras.models import CustomLink
 from netbox.constants import EMPTY_TABLE_TEXT
 from netbox.registry import registry
 from netbox.tables import columns
@@ -208,9 +209,10 @@ class NetBoxTable(BaseTable):
 
         # Add custom field & custom link columns
         object_type = ObjectType.objects.get_for_model(self._meta.model)
-        custom_fields = CustomField.objects.filter(
-            object_types=object_type
-        ).exclude(ui_visible=CustomFieldUIVisibleChoices.HIDDEN)
+        custom_fields = [
+            cf for cf in custom_field_cache.get_for_model(self._meta.model)
+            if cf.ui_visible != CustomFieldUIVisibleChoices.HIDDEN
+        ]
         extra_columns.extend([
             (f'cf_{cf.name}', columns.CustomFieldColumn(cf)) for cf in custom_fields
         ])
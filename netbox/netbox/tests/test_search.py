@@ -1,10 +1,18 @@
+import uuid
+
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 
+from core.models import ObjectType
 from dcim.models import Site
 from dcim.search import SiteIndex
 from extras.models import CachedValue
-from netbox.search.backends import search_backend
+from netbox.context_managers import event_tracking
+from netbox.search import LookupTypes
+from netbox.search.backends import TrigramSearchBackend, search_backend
 
 
 class SearchBackendTestCase(TestCase):
@@ -90,6 +98,22 @@ class SearchBackendTestCase(TestCase):
                     ),
                 )
 
+    def test_cache_required_fields(self):
+        """
+        Test that objects retrieved with only the fields required by their indexer are cached identically.
+        """
+        fields = SiteIndex.get_required_fields()
+        self.assertIn('custom_field_data', fields)
+
+        search_backend.cache(Site.objects.all())
+        expected = set(CachedValue.objects.values_list('object_id', 'field', 'value'))
+        search_backend.clear()
+
+        with self.assertNumQueries(3):
+            # CustomFields, Sites, and bulk creation of CachedValues
+            search_backend.cache(Site.objects.only(*fields).iterator(), remove_existing=False)
+        self.assertEqual(set(CachedValue.objects.values_list('object_id', 'field', 'value')), expected)
+
     def test_cache_on_save(self):
         """
         Test that an object is automatically cached on calling save().
@@ -123,6 +147,64 @@ class SearchBackendTestCase(TestCase):
             CachedValue.objects.filter(object_type=content_type, object_id=site.pk).exists()
         )
 
+    def test_deferred_caching(self):
+        """
+        Test that objects saved or deleted within event_tracking() are cached only once the context is exited.
+        """
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = get_user_model().objects.create_user(username='testuser')
+        content_type = ContentType.objects.get_for_model(Site)
+        search_backend.cache(Site.objects.all())
+        deleted_site = Site.objects.get(slug='site-1')
+        updated_site = Site.objects.get(slug='site-2')
+
+        with event_tracking(request):
+            new_sites = [
+                Site.objects.create(name=f'Site {i}', slug=f'site-{i}', description='New test site')
+                for i in range(4, 14)
+            ]
+            deleted_site.delete()
+            updated_site.description = 'Updated test site'
+            updated_site.save()
+
+            # Nothing should have been written to the cache yet
+            self.assertFalse(
+                CachedValue.objects.filter(object_type=content_type, object_id__in=[s.pk for s in new_sites]).exists()
+            )
+            self.assertTrue(
+                CachedValue.objects.filter(object_type=content_type, object_id=deleted_site.pk).exists()
+            )
+
+        self.assertEqual(
+            CachedValue.objects.filter(object_type=content_type, object_id__in=[s.pk for s in new_sites]).count(),
+            len(new_sites) * 3  # name, slug, description
+        )
+        self.assertFalse(
+            CachedValue.objects.filter(object_type=content_type, object_id=deleted_site.pk).exists()
+        )
+        self.assertEqual(
+            CachedValue.objects.get(object_type=content_type, object_id=updated_site.pk, field='description').value,
+            'Updated test site'
+        )
+        self.assertEqual(len(search_backend.search('first')), 0)
+
+    def test_flush_query_count(self):
+        """
+        Test that flushing queued objects requires a fixed number of queries regardless of the number of objects.
+        """
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(4, 54)])
+        queue = {Site: set(Site.objects.values_list('pk', flat=True))}
+        ObjectType.objects.get_for_model(Site)
+
+        with CaptureQueriesContext(connection) as ctx:
+            search_backend.flush(queue)
+        self.assertLessEqual(len(ctx.captured_queries), 4)
+        cached_ids = CachedValue.objects.filter(
+            object_type=ContentType.objects.get_for_model(Site)
+        ).values_list('object_id', flat=True)
+        self.assertEqual(set(cached_ids), queue[Site])
+
     def test_clear_all(self):
         """
         Test that calling clear() on the backend removes all cached entries.
@@ -151,3 +233,32 @@ class SearchBackendTestCase(TestCase):
         self.assertEqual(len(results), 1)
         results = search_backend.search('xxxxx')
         self.assertEqual(len(results), 0)
+
+    def test_trigram_search(self):
+        """
+        Test that TrigramSearchBackend returns the same results as the default backend.
+        """
+        sites = Site.objects.all()
+        search_backend.cache(sites)
+        backend = TrigramSearchBackend()
+
+        # The pg_trgm extension is not installed by migrations (see the trigram_index management command)
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        for value, lookup in (
+            ('site', LookupTypes.PARTIAL),
+            ('first', LookupTypes.PARTIAL),
+            ('site 2', LookupTypes.EXACT),
+            ('site', LookupTypes.STARTSWITH),
+            ('NE 57761', LookupTypes.ENDSWITH),
+            ('^site-[12]$', LookupTypes.REGEX),
+            ('xxxxx', LookupTypes.PARTIAL),
+        ):
+            expected = search_backend.search(value, lookup=lookup)
+            results = backend.search(value, lookup=lookup)
+            self.assertEqual(
+                {(r.object_type_id, r.object_id) for r in results},
+                {(r.object_type_id, r.object_id) for r in expected},
+                msg=f"Mismatched results for {lookup} lookup of {value}"
+            )
@@ -1,28 +1,33 @@
 import logging
 import re
 from copy import deepcopy
+from urllib.parse import urlencode
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.contenttypes.fields import GenericRel
-from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, ValidationError
 from django.db import transaction, IntegrityError
-from django.db.models import ManyToManyField, ProtectedError, RestrictedError
+from django.db.models import ManyToManyField, ProtectedError, QuerySet, RestrictedError
 from django.db.models.fields.reverse_related import ManyToManyRel
 from django.forms import ModelMultipleChoiceField, MultipleHiddenInput
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
-from django_tables2.export import TableExport
 from mptt.models import MPTTModel
 
+from core.changelog import batch_changelog
+from core.jobs import ExportObjectsJob
 from core.models import ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
-from extras.models import CustomField, ExportTemplate
+from extras.customfields import custom_field_cache
+from extras.models import ExportTemplate
 from utilities.error_handlers import handle_protectederror
+from utilities.export import get_excluded_columns, iter_buffered, iter_chunks, iter_csv, iter_table_rows, iter_yaml
 from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
 from utilities.forms import BulkRenameForm, ConfirmationForm, restrict_form_fields
 from utilities.forms.bulk_import import BulkImportForm
@@ -73,9 +78,16 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
         return '---\n'.join(yaml_data)
 
+    def stream_yaml(self):
+        """
+        Export the queryset of objects as concatenated YAML documents, returning an iterator of strings. Objects are
+        retrieved in chunks rather than all at once.
+        """
+        return iter_yaml(obj for chunk in iter_chunks(self.queryset) for obj in chunk)
+
     def export_table(self, table, columns=None, filename=None):
         """
-        Export all table data in CSV format.
+        Export all table data in CSV format, streamed to the client as objects are retrieved in chunks.
 
         Args:
             table: The Table instance to export
@@ -83,19 +95,71 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
             filename: The name of the file attachment sent to the client. If None, will be determined automatically
                 from the queryset model name.
         """
-        exclude_columns = {'pk', 'actions'}
-        if columns:
-            all_columns = [col_name for col_name, _ in table.selected_columns + table.available_columns]
-            exclude_columns.update({
-                col for col in all_columns if col not in columns
-            })
-        exporter = TableExport(
-            export_format=TableExport.CSV,
-            table=table,
-            exclude_columns=exclude_columns
+        exclude_columns = get_excluded_columns(table, columns)
+        response = StreamingHttpResponse(
+            iter_buffered(iter_csv(iter_table_rows(table, exclude_columns))),
+            content_type='text/csv; charset=utf-8'
         )
-        return exporter.response(
-            filename=filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        filename = filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+    def export_in_background(self, request, queryset, export_format, filename, **kwargs):
+        """
+        If the number of objects to be exported exceeds EXPORT_BACKGROUND_THRESHOLD, enqueue a background job to
+        perform the export and redirect the user back to the list. Otherwise, return None.
+
+        Args:
+            request: The current request
+            queryset: The ordered QuerySet of objects to export
+            export_format: The export format ("csv" or "yaml")
+            filename: The name of the exported file
+        """
+        threshold = settings.EXPORT_BACKGROUND_THRESHOLD
+        if not threshold or not request.user.is_authenticated or (count := queryset.count()) <= threshold:
+            return None
+
+        job = ExportObjectsJob.enqueue(
+            user=request.user,
+            view=f'{self.__class__.__module__}.{self.__class__.__qualname__}',
+            pks=list(queryset.values_list('pk', flat=True)),
+            export_format=export_format,
+            filename=filename,
+            **kwargs
+        )
+
+        # Strip the `export` param and redirect the user to the filtered objects list
+        query_params = request.GET.copy()
+        query_params.pop('export')
+        return_url = f'{request.path}?{query_params.urlencode()}'
+        download_url = reverse('core:job_download', kwargs={'pk': job.pk}) + '?' + urlencode({'return_url': return_url})
+        messages.info(request, mark_safe(_(
+            'The export of {count} {model} has been queued. It can be <a href="{url}">downloaded</a> once the job '
+            'has completed.'
+        ).format(count=count, model=escape(queryset.model._meta.verbose_name_plural), url=escape(download_url))))
+
+        return redirect(return_url)
+
+    def export_table_in_background(self, request, table, columns=None):
+        """
+        Export all table data in CSV format using a background job, if warranted (see export_in_background()).
+
+        Args:
+            request: The current request
+            table: The Table instance to export
+            columns: A list of specific columns to include. If None, all columns will be exported.
+        """
+        if not isinstance(table.data.data, QuerySet):
+            return None
+
+        return self.export_in_background(
+            request,
+            table.data.data,
+            export_format='csv',
+            filename=f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv',
+            table=f'{table.__class__.__module__}.{table.__class__.__name__}',
+            columns=columns
         )
 
     def export_template(self, template, request):
@@ -148,6 +212,8 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
             if request.GET['export'] == 'table':
                 table = self.get_table(self.queryset, request, has_bulk_actions)
                 columns = [name for name, _ in table.selected_columns]
+                if response := self.export_table_in_background(request, table, columns):
+                    return response
                 return self.export_table(table, columns)
 
             # Render an ExportTemplate
@@ -157,14 +223,18 @@ class ObjectListView(BaseMultiObjectView, ActionsMixin, TableMixin):
 
             # Check for YAML export support on the model
             elif hasattr(model, 'to_yaml'):
-                response = HttpResponse(self.export_yaml(), content_type='text/yaml')
                 filename = 'netbox_{}.yaml'.format(self.queryset.model._meta.verbose_name_plural)
+                if response := self.export_in_background(request, self.queryset, 'yaml', filename):
+                    return response
+                response = StreamingHttpResponse(iter_buffered(self.stream_yaml()), content_type='text/yaml')
                 response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
                 return response
 
             # Fall back to default table/YAML export
             else:
                 table = self.get_table(self.queryset, request, has_bulk_actions)
+                if response := self.export_table_in_background(request, table):
+                    return response
                 return self.export_table(table)
 
         # Render the objects table
@@ -267,7 +337,7 @@ class BulkCreateView(GetReturnURLMixin, BaseMultiObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                with transaction.atomic():
+                with transaction.atomic(), batch_changelog():
                     new_objs = self._create_objects(form, request)
 
                     # Enforce object-level permissions
@@ -422,10 +492,10 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
             else:
                 # For newly created objects, apply any default custom field values
-                custom_fields = CustomField.objects.filter(
-                    object_types=ContentType.objects.get_for_model(self.queryset.model),
-                    ui_editable=CustomFieldUIEditableChoices.YES
-                )
+                custom_fields = [
+                    cf for cf in custom_field_cache.get_for_model(self.queryset.model)
+                    if cf.ui_editable == CustomFieldUIEditableChoices.YES
+                ]
                 for cf in custom_fields:
                     field_name = f'cf_{cf.name}'
                     if field_name not in record:
@@ -490,7 +560,7 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
             try:
                 # Iterate through data and bind each record to a new model form instance.
-                with transaction.atomic():
+                with transaction.atomic(), batch_changelog():
                     new_objs = self.create_and_update_objects(form, request)
 
                     # Enforce object-level permissions
@@ -660,7 +730,7 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
 
                 try:
 
-                    with transaction.atomic():
+                    with transaction.atomic(), batch_changelog():
                         updated_objects = self._update_objects(form, request)
 
                         # Enforce object-level permissions
@@ -762,7 +832,7 @@ class BulkRenameView(GetReturnURLMixin, BaseMultiObjectView):
 
             if form.is_valid():
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), batch_changelog():
                         renamed_pks = self._rename_objects(form, selected_objects)
 
                         if '_apply' in request.POST:
@@ -855,7 +925,7 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), batch_changelog():
                         for obj in queryset:
                             # Take a snapshot of change-logged models
                             if hasattr(obj, 'snapshot'):
@@ -960,7 +1030,7 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
                 }
 
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), batch_changelog():
 
                         for obj in data['pk']:
 
@@ -13,6 +13,7 @@ from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 
+from core.changelog import batch_changelog
 from core.signals import clear_events
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, PermissionsViolation
@@ -271,7 +272,7 @@ class ObjectEditView(GetReturnURLMixin, BaseObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                with transaction.atomic():
+                with transaction.atomic(), batch_changelog():
                     object_created = form.instance.pk is None
                     obj = form.save()
 
@@ -438,7 +439,8 @@ class ObjectDeleteView(GetReturnURLMixin, BaseObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                obj.delete()
+                with transaction.atomic(), batch_changelog():
+                    obj.delete()
 
             except (ProtectedError, RestrictedError) as e:
                 logger.info(f"Caught {type(e)} while attempting to delete objects")
@@ -544,7 +546,7 @@ class ComponentCreateView(GetReturnURLMixin, BaseObjectView):
 
             if not form.errors and not component_form.errors:
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), batch_changelog():
                         # Create the new components
                         new_objs = []
                         for component_form in new_components:
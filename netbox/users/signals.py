@@ -1,11 +1,12 @@
 import logging
 
 from django.contrib.auth.signals import user_login_failed
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from netbox.authentication import invalidate_object_permissions
 from netbox.config import get_config
-from users.models import User, UserConfig
+from users.models import Group, ObjectPermission, User, UserConfig
 from utilities.request import get_client_ip
 
 
@@ -31,3 +32,17 @@ def create_userconfig(instance, created, raw=False, **kwargs):
     if created and not raw:
         config = get_config()
         UserConfig(user=instance, data=config.DEFAULT_USER_PREFERENCES).save()
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def clear_object_permissions_cache(sender, **kwargs):
+    """
+    Invalidate the cached ObjectPermissions of all users whenever a permission or its assignment changes.
+    """
+    invalidate_object_permissions()
@@ -0,0 +1,113 @@
+import time
+import uuid
+import weakref
+
+from django.core.cache import cache
+from django.db import transaction
+
+__all__ = (
+    'VersionedCache',
+)
+
+
+class VersionedCache:
+    """
+    Hold data loaded from the database in memory until it is invalidated, either locally or by another process via a
+    version token stored in the cache. Subclasses must define `cache_key` and implement load().
+
+    The loaded data is held as a snapshot which is shared by all threads of the process, and is never modified once
+    loaded. A database connection on which the data has been invalidated within a transaction which has not yet been
+    committed is served its own snapshot (reflecting its uncommitted changes) instead, which is discarded when that
+    transaction is committed or rolled back.
+
+    To avoid querying the cache each time the data is retrieved, the version token is re-checked at most once every
+    `version_check_interval` seconds; changes made by other processes may thus take up to that long to be seen. (Changes
+    committed by this process are seen immediately.)
+    """
+    cache_key = None
+    version_check_interval = 1
+
+    def __init__(self):
+        # The shared snapshot, as a tuple of (version, data)
+        self._snapshot = (None, None)
+        # The most recently retrieved version token, as a tuple of (time checked, version)
+        self._version = (None, None)
+        # Uncommitted invalidations, per database connection
+        self._pending = weakref.WeakKeyDictionary()
+
+    def load(self):
+        """
+        Load and return the data to be held.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} must implement load()")
+
+    def invalidate(self):
+        """
+        Discard the data loaded within the current transaction, and signal all processes to reload it once the
+        transaction has been committed.
+        """
+        def update_version():
+            version = uuid.uuid4().hex
+            cache.set(self.cache_key, version, None)
+            self._version = (time.monotonic(), version)
+
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            state = self._pending.setdefault(connection, {'callbacks': [], 'data': None})
+            state['callbacks'].append(update_version)
+            state['data'] = None
+        transaction.on_commit(update_version)
+
+    def _get_pending(self, connection):
+        """
+        Return the state of any invalidations made on the given connection which have been neither committed nor rolled
+        back. (The on-commit callback of an invalidation is discarded once it has been called or rolled back.)
+        """
+        if (state := self._pending.get(connection)) is None:
+            return None
+
+        registered = [func for _, func, _ in connection.run_on_commit]
+        callbacks = [func for func in state['callbacks'] if func in registered]
+        if not callbacks:
+            del self._pending[connection]
+            return None
+
+        # Discard the data loaded within a savepoint which has since been rolled back
+        if len(callbacks) != len(state['callbacks']):
+            state['callbacks'] = callbacks
+            state['data'] = None
+
+        return state
+
+    def _get_version(self):
+        """
+        Return the current version token, retrieving it from the cache if it has not been checked recently.
+        """
+        now = time.monotonic()
+        checked, version = self._version
+        if checked is not None and now - checked < self.version_check_interval:
+            return version
+
+        if (version := cache.get(self.cache_key)) is None:
+            cache.add(self.cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.cache_key)
+        self._version = (now, version)
+
+        return version
+
+    def get(self):
+        """
+        Return the loaded data, (re)loading it first if it has not yet been loaded or has since changed.
+        """
+        if state := self._get_pending(transaction.get_connection()):
+            if state['data'] is None:
+                state['data'] = self.load()
+            return state['data']
+
+        version = self._get_version()
+        loaded_version, data = self._snapshot
+        if data is None or version != loaded_version:
+            data = self.load()
+            self._snapshot = (version, data)
+
+        return data
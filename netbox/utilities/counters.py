@@ -1,10 +1,16 @@
+from contextlib import contextmanager
+
 from django.apps import apps
 from django.db.models import F, Count, OuterRef, Subquery
 from django.db.models.signals import post_delete, post_save, pre_delete
 
+from netbox.context import counters_queue
 from netbox.registry import registry
 from .fields import CounterCacheField
 
+# Maximum number of parent objects to recount in a single query
+BATCH_SIZE = 1000
+
 
 def get_counters_for_model(model):
     """
@@ -23,7 +29,7 @@ def update_counter(model, pk, counter_name, value):
     )
 
 
-def update_counts(model, field_name, related_query):
+def update_counts(model, field_name, related_query, pks=None):
     """
     Perform a bulk update for the given model and counter field. For example,
 
@@ -32,15 +38,78 @@ def update_counts(model, field_name, related_query):
     will effectively set
 
         Device.objects.update(_interface_count=Count('interfaces'))
+
+    If a list of primary keys is specified, only the corresponding objects are updated.
     """
     subquery = Subquery(
         model.objects.filter(pk=OuterRef('pk')).annotate(_count=Count(related_query)).values('_count')
     )
-    return model.objects.update(**{
+    queryset = model.objects.all() if pks is None else model.objects.filter(pk__in=pks)
+    return queryset.update(**{
         field_name: subquery
     })
 
 
+def queue_counter_update(model, pk, counter_name, related_query):
+    """
+    Record that a counter field on the specified object needs to be updated. Returns False if no counter batching
+    context is active, in which case the counter should be updated immediately.
+    """
+    queue = counters_queue.get()
+    if queue is None:
+        return False
+    queue.setdefault((model, counter_name, related_query), set()).add(pk)
+    return True
+
+
+def flush_counters(queue):
+    """
+    Recalculate all queued counter fields. Each counter field is updated for all affected objects in a single query
+    (per BATCH_SIZE objects).
+    """
+    for (model, counter_name, related_query), pks in queue.items():
+        pks = list(pks)
+        for i in range(0, len(pks), BATCH_SIZE):
+            update_counts(model, counter_name, related_query, pks=pks[i:i + BATCH_SIZE])
+
+
+def flush_counter_updates():
+    """
+    Immediately recalculate all counter fields queued by the active batch_counter_updates() context (if any), so that
+    their current values may be read from the database. Counters affected by subsequent changes are queued anew.
+    """
+    queue = counters_queue.get()
+    if queue:
+        flush_counters(queue)
+        queue.clear()
+
+
+@contextmanager
+def batch_counter_updates():
+    """
+    Defer the maintenance of counter fields until the context is exited. Rather than incrementing or decrementing a
+    parent object's counter each time a child object is saved or deleted, the affected counters are recalculated once
+    for all affected parents. Nested contexts are merged into the outermost one.
+
+    Note that counter fields (e.g. Device.interface_count) are therefore stale while the context is active: an object
+    read from the database within the context reflects none of the changes queued so far. This context wraps every
+    background job (see JobRunner.handle()) as well as event_tracking(), and thus the execution of custom scripts. Code
+    which needs to read current counter values from within the context must first call flush_counter_updates().
+    """
+    if counters_queue.get() is not None:
+        yield
+        return
+
+    token = counters_queue.set({})
+    try:
+        yield
+    finally:
+        queue = counters_queue.get()
+        counters_queue.reset(token)
+        if queue:
+            flush_counters(queue)
+
+
 #
 # Signal handlers
 #
@@ -50,19 +119,25 @@ def post_save_receiver(sender, instance, created, **kwargs):
     Update counter fields on related objects when a TrackingModelMixin subclass is created or modified.
     """
     for field_name, counter_name in get_counters_for_model(sender):
-        parent_model = sender._meta.get_field(field_name).related_model
+        fk_field = sender._meta.get_field(field_name)
+        parent_model = fk_field.related_model
         new_pk = getattr(instance, field_name, None)
         has_old_field = field_name in instance.tracker
         old_pk = instance.tracker.get(field_name) if has_old_field else None
 
         # Update the counters on the old and/or new parents as needed
         if old_pk is not None:
-            update_counter(parent_model, old_pk, counter_name, -1)
+            if not queue_counter_update(parent_model, old_pk, counter_name, fk_field.related_query_name()):
+                update_counter(parent_model, old_pk, counter_name, -1)
         if new_pk is not None and (has_old_field or created):
-            update_counter(parent_model, new_pk, counter_name, 1)
+            if not queue_counter_update(parent_model, new_pk, counter_name, fk_field.related_query_name()):
+                update_counter(parent_model, new_pk, counter_name, 1)
 
 
 def pre_delete_receiver(sender, instance, origin, **kwargs):
+    # Queued counters are recalculated from scratch, so there is no need to check for objects already removed
+    if counters_queue.get() is not None:
+        return
     model = instance._meta.model
     if not model.objects.filter(pk=instance.pk).exists():
         instance._previously_removed = True
@@ -73,11 +148,17 @@ def post_delete_receiver(sender, instance, origin, **kwargs):
     Update counter fields on related objects when a TrackingModelMixin subclass is deleted.
     """
     for field_name, counter_name in get_counters_for_model(sender):
-        parent_model = sender._meta.get_field(field_name).related_model
+        fk_field = sender._meta.get_field(field_name)
+        parent_model = fk_field.related_model
         parent_pk = getattr(instance, field_name, None)
 
+        if parent_pk is None or queue_counter_update(
+            parent_model, parent_pk, counter_name, fk_field.related_query_name()
+        ):
+            continue
+
         # Decrement the parent's counter by one
-        if parent_pk is not None and not hasattr(instance, "_previously_removed"):
+        if not hasattr(instance, "_previously_removed"):
             update_counter(parent_model, parent_pk, counter_name, -1)
 
 
@@ -0,0 +1,123 @@
+import csv
+from itertools import islice
+
+from django.db.models import QuerySet
+from django.utils.encoding import force_str
+from django_tables2.rows import BoundRow
+
+__all__ = (
+    'CHUNK_SIZE',
+    'Echo',
+    'get_excluded_columns',
+    'iter_buffered',
+    'iter_chunks',
+    'iter_csv',
+    'iter_table_rows',
+    'iter_yaml',
+)
+
+# Number of objects to retrieve from the database at once when streaming an export
+CHUNK_SIZE = 1000
+
+# Minimum length (in characters) of each piece of streamed output
+BUFFER_SIZE = 65536
+
+
+class Echo:
+    """
+    A file-like object which returns (rather than stores) any value written to it, for use with csv.writer.
+    """
+    def write(self, value):
+        return value
+
+
+def get_excluded_columns(table, columns=None):
+    """
+    Return the names of the table columns to be excluded from an export.
+
+    Args:
+        table: The Table instance being exported
+        columns: A list of specific columns to include. If None, all columns will be exported.
+    """
+    exclude_columns = {'pk', 'actions'}
+    if columns:
+        all_columns = [col_name for col_name, _ in table.selected_columns + table.available_columns]
+        exclude_columns.update({
+            col for col in all_columns if col not in columns
+        })
+
+    return exclude_columns
+
+
+def iter_buffered(strings, size=BUFFER_SIZE):
+    """
+    Combine an iterable of (typically short) strings into fewer, longer strings of at least `size` characters, to avoid
+    writing each individually to the client.
+    """
+    buffer = []
+    length = 0
+    for string in strings:
+        buffer.append(string)
+        length += len(string)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_chunks(queryset, chunk_size=CHUNK_SIZE):
+    """
+    Yield lists of up to `chunk_size` objects from a QuerySet. Any prefetches defined on the QuerySet are applied to
+    each chunk in turn.
+    """
+    objects = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(objects, chunk_size)):
+        yield chunk
+
+
+def iter_csv(rows):
+    """
+    Yield each of the given rows (lists of values) as a line of CSV data.
+    """
+    writer = csv.writer(Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_table_rows(table, exclude_columns=None, objects=None):
+    """
+    Yield the column headers of a table, followed by the exported values of each of its rows. This replicates the
+    output of django-tables2's Table.as_values(), but retrieves QuerySet data in chunks rather than all at once.
+
+    Args:
+        table: The Table instance to export
+        exclude_columns: An iterable of column names to omit
+        objects: An iterable of objects to export in place of the table's data (optional)
+    """
+    exclude_columns = exclude_columns or ()
+    columns = [
+        column for column in table.columns.iterall()
+        if not (column.column.exclude_from_export or column.name in exclude_columns)
+    ]
+    yield [force_str(column.header, strings_only=True) for column in columns]
+
+    if objects is None:
+        if isinstance(table.data.data, QuerySet):
+            objects = (obj for chunk in iter_chunks(table.data.data) for obj in chunk)
+        else:
+            objects = table.data
+    for obj in objects:
+        row = BoundRow(obj, table=table)
+        yield [force_str(row.get_cell_value(column.name), strings_only=True) for column in columns]
+
+
+def iter_yaml(objects):
+    """
+    Yield the YAML representation of each object as a separate YAML document.
+    """
+    for i, obj in enumerate(objects):
+        if i:
+            yield '---\n'
+        yield obj.to_yaml()
@@ -1,14 +1,29 @@
+import json
+
 from django.apps import apps
 from jinja2 import BaseLoader, TemplateNotFound
 from jinja2.meta import find_referenced_templates
 from jinja2.sandbox import SandboxedEnvironment
+from jinja2.utils import LRUCache
 
 from netbox.config import get_config
 
 __all__ = (
     'DataFileLoader',
+    'get_environment',
+    'get_template',
+    'render_jinja2',
 )
 
+# Maximum number of Jinja2 environments to retain for reuse
+ENVIRONMENT_CACHE_SIZE = 32
+
+# Maximum number of compiled templates to retain for reuse
+TEMPLATE_CACHE_SIZE = 512
+
+_environments = LRUCache(ENVIRONMENT_CACHE_SIZE)
+_templates = LRUCache(TEMPLATE_CACHE_SIZE)
+
 
 class DataFileLoader(BaseLoader):
     """
@@ -27,14 +42,16 @@ class DataFileLoader(BaseLoader):
         except KeyError:
             raise TemplateNotFound(template)
 
-        # Find and pre-fetch referenced templates
-        if referenced_templates := find_referenced_templates(environment.parse(template_source)):
+        # Find and pre-fetch referenced templates which have not already been cached
+        referenced_templates = find_referenced_templates(environment.parse(template_source))
+        if referenced_templates := [path for path in referenced_templates if path not in self._template_cache]:
             self.cache_templates({
                 df.path: df.data_as_string for df in
                 DataFile.objects.filter(source=self.data_source, path__in=referenced_templates)
             })
 
-        return template_source, template, lambda: True
+        # The compiled template remains valid for as long as its content is unchanged
+        return template_source, template, lambda: self._template_cache.get(template) == template_source
 
     def cache_templates(self, templates):
         self._template_cache.update(templates)
@@ -44,10 +61,63 @@ class DataFileLoader(BaseLoader):
 # Utility functions
 #
 
-def render_jinja2(template_code, context):
+def _get_environment_key(environment_params=None, data_source=None, templates=None):
+    """
+    Return a hashable key identifying a Jinja2 environment constructed with the given parameters. Environments which
+    load templates from a DataSource are replaced each time the DataSource is synchronized.
+    """
+    return (
+        json.dumps(environment_params or {}, sort_keys=True, default=str),
+        id(get_config().JINJA2_FILTERS),
+        (data_source.pk, data_source.last_synced) if data_source else None,
+        tuple(sorted(templates.items())) if templates else None,
+    )
+
+
+def get_environment(environment_params=None, data_source=None, templates=None):
+    """
+    Return a SandboxedEnvironment with the configured Jinja2 filters installed. Environments are shared among all
+    callers with the same parameters, and must not be modified.
+
+    Args:
+        environment_params: A dictionary of additional parameters to pass when constructing the environment
+        data_source: A DataSource from which templates are to be loaded (optional)
+        templates: A dictionary mapping template paths to content, to be loaded in place of the DataSource's files
+            (optional)
+    """
+    key = _get_environment_key(environment_params, data_source, templates)
+    if (environment := _environments.get(key)) is None:
+        if data_source:
+            loader = DataFileLoader(data_source=data_source)
+            loader.cache_templates(templates or {})
+        else:
+            loader = BaseLoader()
+        environment = SandboxedEnvironment(loader=loader, **(environment_params or {}))
+        environment.filters.update(get_config().JINJA2_FILTERS)
+        _environments[key] = environment
+
+    return environment
+
+
+def get_template(template_code, environment_params=None):
+    """
+    Return a compiled Jinja2 template for the given template code. Compiled templates are cached (up to
+    TEMPLATE_CACHE_SIZE) so that each is parsed only once.
+
+    Args:
+        template_code: The template source
+        environment_params: A dictionary of additional parameters to pass when constructing the environment
+    """
+    key = (template_code, *_get_environment_key(environment_params))
+    if (template := _templates.get(key)) is None:
+        template = get_environment(environment_params).from_string(source=template_code)
+        _templates[key] = template
+
+    return template
+
+
+def render_jinja2(template_code, context, environment_params=None):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
     """
-    environment = SandboxedEnvironment()
-    environment.filters.update(get_config().JINJA2_FILTERS)
-    return environment.from_string(source=template_code).render(**context)
+    return get_template(template_code, environment_params).render(**context)
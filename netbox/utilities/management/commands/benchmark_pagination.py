@@ -0,0 +1,81 @@
+import statistics
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from netbox.api.pagination import OptionalLimitOffsetPagination
+
+
+class Command(BaseCommand):
+    help = "Measure the latency of retrieving a page of objects at increasing depths, by offset and by cursor"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", type=str, dest='model', default='ipam.ipaddress',
+            help="The model to paginate, as <app_label>.<model_name> (default: ipam.ipaddress)"
+        )
+        parser.add_argument(
+            "--limit", type=int, dest='limit', default=1000,
+            help="Number of objects per page (default: 1000)"
+        )
+        parser.add_argument(
+            "--depths", type=int, dest='depths', default=5,
+            help="Number of evenly-spaced depths at which to retrieve a page (default: 5)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, dest='repeat', default=5,
+            help="Number of times to retrieve each page (default: 5)"
+        )
+
+    @staticmethod
+    def get_page(queryset, params, repeat):
+        """
+        Retrieve a page of objects the specified number of times, and return the median latency in milliseconds.
+        """
+        request = Request(RequestFactory().get('/', params))
+        timings = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            paginator = OptionalLimitOffsetPagination()
+            paginator.paginate_queryset(queryset, request)
+            paginator.get_next_link()
+            timings.append((time.perf_counter() - start_time) * 1000)
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        if min(options['limit'], options['depths'], options['repeat']) < 1:
+            raise CommandError("Limit, depths, and repeat must be positive integers.")
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError):
+            raise CommandError(f"Unknown model: {options['model']}")
+
+        queryset = model.objects.all()
+        if (count := queryset.count()) <= options['limit']:
+            raise CommandError(f"At least {options['limit'] + 1} {model._meta.verbose_name_plural} are required.")
+        self.stdout.write(
+            f"Retrieving pages of {options['limit']} {model._meta.verbose_name_plural} (of {count})..."
+        )
+
+        results = []
+        for i in range(options['depths']):
+            offset = (count - options['limit']) * i // max(options['depths'] - 1, 1)
+
+            # Determine the cursor identifying the object immediately preceding the page
+            cursor = ''
+            if offset:
+                pk = queryset.order_by('pk').values_list('pk', flat=True)[offset - 1]
+                cursor = OptionalLimitOffsetPagination.encode_cursor(pk)
+
+            offset_ms = self.get_page(queryset, {'limit': options['limit'], 'offset': offset}, options['repeat'])
+            cursor_ms = self.get_page(queryset, {'limit': options['limit'], 'cursor': cursor}, options['repeat'])
+            results.append((offset_ms, cursor_ms))
+            self.stdout.write(f'  depth {offset}: offset {offset_ms:.1f}ms, cursor {cursor_ms:.1f}ms')
+
+        offset_ms, cursor_ms = results[-1]
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup at greatest depth: {offset_ms / (cursor_ms or 1):.1f}x"
+        ))
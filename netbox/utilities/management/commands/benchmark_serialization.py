@@ -0,0 +1,77 @@
+import json
+import time
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+
+from extras.utils import is_taggable
+from utilities.serialization import serialize_object, serialize_objects
+
+
+def serialize_object_legacy(obj):
+    """
+    Serialize an object by way of Django's built-in JSON serializer (the original implementation of
+    serialize_object()).
+    """
+    data = json.loads(serializers.serialize('json', [obj]))[0]['fields']
+    if hasattr(obj, 'custom_field_data'):
+        data['custom_fields'] = data.pop('custom_field_data')
+    if is_taggable(obj):
+        data['tags'] = sorted([tag.name for tag in obj.tags.all()])
+    return data
+
+
+class Command(BaseCommand):
+    help = "Measure the time taken to serialize existing objects for change logging"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", type=str, dest='model', default='dcim.site',
+            help="The model to serialize, as <app_label>.<model_name> (default: dcim.site)"
+        )
+        parser.add_argument(
+            "--count", type=int, dest='count', default=1000,
+            help="Maximum number of objects to serialize (default: 1000)"
+        )
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("The number of objects must be a positive integer.")
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError):
+            raise CommandError(f"Unknown model: {options['model']}")
+
+        pks = list(model.objects.order_by('pk').values_list('pk', flat=True)[:options['count']])
+        if not pks:
+            raise CommandError(f"No {model._meta.verbose_name_plural} exist to be serialized.")
+        self.stdout.write(f"Serializing {len(pks)} {model._meta.verbose_name_plural}...")
+
+        def run_legacy():
+            return [serialize_object_legacy(obj) for obj in model.objects.filter(pk__in=pks).order_by('pk')]
+
+        def run_individual():
+            return [serialize_object(obj) for obj in model.objects.filter(pk__in=pks).order_by('pk')]
+
+        def run_bulk():
+            return serialize_objects(model.objects.filter(pk__in=pks).order_by('pk'))
+
+        results = {}
+        outputs = {}
+        for label, func in (('legacy', run_legacy), ('individual', run_individual), ('bulk', run_bulk)):
+            start_time = time.perf_counter()
+            outputs[label] = func()
+            elapsed = time.perf_counter() - start_time
+            results[label] = elapsed
+            self.stdout.write(
+                f'  {label}: {elapsed:.2f}s ({len(pks) / (elapsed or 1):.0f} objects/sec)'
+            )
+
+        if not outputs['legacy'] == outputs['individual'] == outputs['bulk']:
+            raise CommandError("Serialized representations do not match")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished. Speedup: {results['legacy'] / (results['individual'] or 1):.1f}x (individual), "
+            f"{results['legacy'] / (results['bulk'] or 1):.1f}x (bulk)"
+        ))
@@ -1,11 +1,16 @@
 from django.conf import settings
 from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from users.constants import CONSTRAINT_TOKEN_USER
 
 __all__ = (
+    'constraints_are_single_valued',
+    'evaluate_constraints',
+    'get_constraints_filter',
     'get_permission_for_model',
     'permission_is_exempt',
     'qs_filter_from_constraints',
@@ -112,3 +117,152 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def constraints_are_single_valued(model, constraints):
+    """
+    Return True if none of the given ObjectPermission constraints traverse a many-to-many or one-to-many relationship.
+    Such constraints can be applied directly as a QuerySet filter without producing duplicate results.
+
+    :param model: The model to which the constraints apply
+    :param constraints: An iterable of constraint dictionaries
+    """
+    for constraint in constraints:
+        for key in (constraint or {}):
+            opts = model._meta
+            for part in key.split('__'):
+                try:
+                    field = opts.get_field(part)
+                except FieldDoesNotExist:
+                    # Not a field; must be a lookup or transform
+                    break
+                if field.many_to_many or field.one_to_many:
+                    return False
+                if not field.is_relation:
+                    break
+                if field.related_model is None:
+                    # Generic foreign keys cannot be followed in a filter
+                    return False
+                opts = field.related_model._meta
+
+    return True
+
+
+def get_constraints_filter(user, permission, model):
+    """
+    Return the Q filter compiled from the user's constraints for the given permission, along with a boolean indicating
+    whether it may be applied directly to a QuerySet (see constraints_are_single_valued()). Compiled filters are cached
+    on the user instance.
+
+    :param user: User instance (permissions must already have been populated by get_all_permissions())
+    :param permission: Permission name in the format <app_label>.<action>_<model>
+    :param model: The model to which the permission applies
+    """
+    if not hasattr(user, '_object_perm_filters'):
+        user._object_perm_filters = {}
+    if permission not in user._object_perm_filters:
+        constraints = user._object_perm_cache[permission]
+        tokens = {
+            CONSTRAINT_TOKEN_USER: user,
+        }
+        user._object_perm_filters[permission] = (
+            qs_filter_from_constraints(constraints, tokens),
+            constraints_are_single_valued(model, constraints)
+        )
+
+    return user._object_perm_filters[permission]
+
+
+# Model fields whose values can be compared in Python with those specified by an ObjectPermission constraint
+EVALUABLE_FIELDS = (
+    models.AutoField,
+    models.BigAutoField,
+    models.BooleanField,
+    models.CharField,
+    models.ForeignKey,
+    models.IntegerField,
+)
+
+
+def _evaluate_constraint(instance, loaded_values, key, value):
+    """
+    Evaluate a single constraint against a model instance. Returns True or False, or None if the constraint cannot be
+    evaluated in Python (including where the field's value has been modified since it was loaded from the database).
+    """
+    field_name, _, lookup = key.partition('__')
+    if lookup not in ('', 'exact', 'in'):
+        return None
+    try:
+        field = instance._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+    if not isinstance(field, EVALUABLE_FIELDS) or field.attname in instance.get_deferred_fields():
+        return None
+    if isinstance(field, models.ForeignKey):
+        # Compare against the primary key of the related object
+        field = field.target_field
+        if not isinstance(field, EVALUABLE_FIELDS) or isinstance(field, models.ForeignKey):
+            return None
+    attname = instance._meta.get_field(field_name).attname
+    attr = getattr(instance, attname)
+    if attname not in loaded_values or loaded_values[attname] != attr:
+        return None
+
+    try:
+        if lookup == 'in':
+            if type(value) not in (list, tuple):
+                return None
+            return attr in [field.to_python(v) for v in value]
+        return attr == field.to_python(value)
+    except (TypeError, ValueError, ValidationError):
+        return None
+
+
+def evaluate_constraints(instance, constraints, tokens=None):
+    """
+    Determine whether a model instance satisfies any of the given ObjectPermission constraints without querying the
+    database. Only simple exact or "in" matches against local fields (or the primary keys of related objects) are
+    supported. Returns None if the constraints cannot be evaluated in Python.
+
+    Constraints are evaluated only against field values which are unchanged since the instance was loaded from the
+    database (as recorded by ChangeLoggingMixin.from_db()), so that the result reflects the object as stored. Constraints
+    on fields which have since been modified, and any constraints on instances not loaded in this manner, cannot be
+    evaluated.
+
+    Args:
+        instance: The model instance to evaluate
+        constraints: An iterable of constraint dictionaries
+        tokens: A dictionary mapping string tokens to be replaced with a value.
+    """
+    loaded = getattr(instance._state, 'loaded_values', None)
+    if instance.pk is None or loaded is None:
+        return None
+    loaded_values = dict(zip(*loaded))
+    tokens = tokens or {}
+    User = apps.get_model('users.User')
+    tokens = {
+        token: value.id if token == CONSTRAINT_TOKEN_USER and isinstance(value, User) else value
+        for token, value in tokens.items()
+    }
+
+    def _replace_tokens(value):
+        if type(value) is list:
+            return [tokens.get(v, v) for v in value]
+        return tokens.get(value, value)
+
+    result = False
+    for constraint in constraints:
+        if not constraint:
+            # Found null constraint; permit model-level access
+            return True
+        matched = True
+        for key, value in constraint.items():
+            if (matched := _evaluate_constraint(instance, loaded_values, key, _replace_tokens(value))) is not True:
+                break
+        if matched is True:
+            return True
+        if matched is None:
+            # Any remaining constraint set may still match
+            result = None
+
+    return result
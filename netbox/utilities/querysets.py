@@ -1,7 +1,6 @@
 from django.db.models import Prefetch, QuerySet
 
-from users.constants import CONSTRAINT_TOKEN_USER
-from utilities.permissions import get_permission_for_model, permission_is_exempt, qs_filter_from_constraints
+from utilities.permissions import get_constraints_filter, get_permission_for_model, permission_is_exempt
 
 __all__ = (
     'RestrictedPrefetch',
@@ -58,13 +57,17 @@ class RestrictedQuerySet(QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            tokens = {
-                CONSTRAINT_TOKEN_USER: user,
-            }
-            attrs = qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
-            # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
-            # DISTINCT acts globally on the entire request, which may not be desirable.
-            allowed_objects = self.model.objects.filter(attrs)
-            qs = self.filter(pk__in=allowed_objects)
+            attrs, single_valued = get_constraints_filter(user, permission_required, self.model)
+            if not attrs:
+                # Null constraint; permit access to all objects
+                qs = self
+            elif single_valued:
+                # The constraints do not span any multi-valued relationships, so they can be applied directly
+                qs = self.filter(attrs)
+            else:
+                # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
+                # DISTINCT acts globally on the entire request, which may not be desirable.
+                allowed_objects = self.model.objects.filter(attrs)
+                qs = self.filter(pk__in=allowed_objects)
 
         return qs
@@ -1,21 +1,93 @@
+import datetime
+import decimal
 import json
+import uuid
 
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import ArrayField
 from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from django.utils.encoding import is_protected_type
+from django.utils.functional import Promise
 
 from extras.utils import is_taggable
 
 __all__ = (
     'deserialize_object',
+    'get_serialized_fields',
     'serialize_object',
+    'serialize_objects',
 )
 
+# Types which DjangoJSONEncoder represents as strings
+ENCODED_TYPES = (datetime.date, datetime.time, datetime.timedelta, decimal.Decimal, uuid.UUID, Promise)
+
+_json_encoder = DjangoJSONEncoder()
+
+# Serialized fields for each model, determined upon first use
+_serialized_fields = {}
+
+
+def get_serialized_fields(model):
+    """
+    Return the fields of a model included in its serialized representation, as a two-tuple of its concrete fields and
+    its many-to-many fields. These are the same fields (in the same order) serialized by Django's built-in serializer.
+    """
+    try:
+        return _serialized_fields[model]
+    except KeyError:
+        pass
+
+    opts = model._meta.concrete_model._meta
+    fields = tuple(field for field in opts.local_fields if field.serialize)
+    m2m_fields = tuple(
+        field for field in opts.local_many_to_many
+        if field.serialize and field.remote_field.through._meta.auto_created
+    )
+    _serialized_fields[model] = fields, m2m_fields
+
+    return fields, m2m_fields
+
+
+def _to_json(value):
+    """
+    Return the given value as it would be represented after encoding it to JSON and decoding it back.
+    """
+    value_type = type(value)
+    if value is None or value_type in (str, int, float, bool):
+        return value
+    if value_type in (list, tuple):
+        return [_to_json(v) for v in value]
+    if value_type is dict and all(type(k) is str for k in value):
+        return {k: _to_json(v) for k, v in value.items()}
+    if isinstance(value, ENCODED_TYPES):
+        return _json_encoder.default(value)
+    return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+
+
+def _value_from_field(obj, field):
+    """
+    Return the value of a field as represented by Django's JSON serializer (see utilities.serializers.json).
+    """
+    value = field.value_from_object(obj)
+
+    # Handle ArrayFields of protected types
+    if type(field) is ArrayField and (not value or is_protected_type(value[0])):
+        return _to_json(value)
+
+    if not is_protected_type(value):
+        value = field.value_to_string(obj)
+
+    return _to_json(value)
+
 
 def serialize_object(obj, resolve_tags=True, extra=None, exclude=None):
     """
-    Return a generic JSON representation of an object using Django's built-in serializer. (This is used for things like
-    change logging, not the REST API.) Optionally include a dictionary to supplement the object data. A list of keys
-    can be provided to exclude them from the returned dictionary.
+    Return a generic JSON representation of an object. (This is used for things like change logging, not the REST
+    API.) The representation is identical to the fields of the object as serialized by Django's built-in JSON
+    serializer. Optionally include a dictionary to supplement the object data. A list of keys can be provided to
+    exclude them from the returned dictionary.
 
     Args:
         obj: The object to serialize
@@ -24,8 +96,21 @@ def serialize_object(obj, resolve_tags=True, extra=None, exclude=None):
             override object attributes.
         exclude: An iterable of attributes to exclude from the serialized output
     """
-    json_str = serializers.serialize('json', [obj])
-    data = json.loads(json_str)[0]['fields']
+    fields, m2m_fields = get_serialized_fields(obj.__class__)
+    data = {
+        field.name: _value_from_field(obj, field) for field in fields
+    }
+
+    # Represent many-to-many assignments by their primary keys, using prefetched objects where available
+    if m2m_fields:
+        prefetched_objects = getattr(obj, '_prefetched_objects_cache', {})
+        for field in m2m_fields:
+            if field.name in prefetched_objects:
+                related_objects = prefetched_objects[field.name]
+            else:
+                related_objects = getattr(obj, field.name).select_related(None).only('pk').iterator()
+            data[field.name] = [_value_from_field(related, related._meta.pk) for related in related_objects]
+
     exclude = exclude or []
 
     # Include custom_field_data as "custom_fields"
@@ -50,6 +135,38 @@ def serialize_object(obj, resolve_tags=True, extra=None, exclude=None):
     return data
 
 
+def serialize_objects(queryset, resolve_tags=True, extra=None, exclude=None):
+    """
+    Return a list of generic JSON representations of the objects in a QuerySet (see serialize_object()). The
+    many-to-many assignments and tags of all objects are retrieved using a single query per relationship.
+
+    Args:
+        queryset: The QuerySet of objects to serialize
+        resolve_tags: If true, any assigned tags will be represented by their names
+        extra: Any additional data to include in the serialized output of each object
+        exclude: An iterable of attributes to exclude from the serialized output
+    """
+    model = queryset.model
+    lookups = [
+        Prefetch(field.name, field.related_model._default_manager.select_related(None).only('pk'))
+        for field in get_serialized_fields(model)[1]
+    ]
+    if resolve_tags and is_taggable(model):
+        lookups.append(Prefetch('tags'))
+
+    # Skip any relationships which have already been prefetched
+    prefetched = {
+        getattr(lookup, 'prefetch_to', lookup) for lookup in queryset._prefetch_related_lookups
+    }
+    lookups = [lookup for lookup in lookups if lookup.prefetch_to not in prefetched]
+    if lookups:
+        queryset = queryset.prefetch_related(*lookups)
+
+    return [
+        serialize_object(obj, resolve_tags=resolve_tags, extra=extra, exclude=exclude) for obj in queryset
+    ]
+
+
 def deserialize_object(model, fields, pk=None):
     """
     Instantiate an object from the given model and field data. Functions as
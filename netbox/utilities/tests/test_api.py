@@ -1,3 +1,6 @@
+import csv
+import json
+
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -173,6 +176,96 @@ class APIPaginationTestCase(APITestCase):
         self.assertIsNone(response.data['previous'])
         self.assertEqual(len(response.data['results']), 100)
 
+    def test_cursor_pagination(self):
+        site_ids = list(Site.objects.order_by('pk').values_list('pk', flat=True))
+        url = f'{self.url}?limit=30&cursor='
+        results = []
+
+        while url:
+            response = self.client.get(url, format='json', **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertIsNone(response.data['count'])
+            self.assertIsNone(response.data['previous'])
+            self.assertLessEqual(len(response.data['results']), 30)
+            results.extend(response.data['results'])
+            url = response.data['next']
+
+        # Four pages should have been retrieved, with no objects repeated or omitted
+        self.assertEqual(len(results), 100)
+        self.assertEqual([s['id'] for s in results], site_ids)
+
+    def test_cursor_pagination_count(self):
+        response = self.client.get(f'{self.url}?limit=10&cursor=&count=true', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 100)
+        self.assertIn('cursor=', response.data['next'])
+        self.assertEqual(len(response.data['results']), 10)
+
+    @override_settings(MAX_PAGE_SIZE=20)
+    def test_cursor_pagination_max_page_size(self):
+        response = self.client.get(f'{self.url}?limit=0&cursor=', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(len(response.data['results']), 20)
+
+    def test_cursor_pagination_invalid_cursor(self):
+        response = self.client.get(f'{self.url}?cursor=invalid', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(MAX_PAGE_SIZE=0)
+class APIStreamingTestCase(APITestCase):
+    user_permissions = ('dcim.view_site',)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse('dcim-api:site-list')
+
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 101)
+        ])
+
+    def test_stream_ndjson(self):
+        response = self.client.get(f'{self.url}?stream=ndjson', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        results = [json.loads(line) for line in lines]
+        self.assertEqual(len(results), 100)
+        self.assertEqual(
+            sorted(s['id'] for s in results),
+            sorted(Site.objects.values_list('pk', flat=True))
+        )
+        self.assertIn('slug', results[0])
+
+    def test_stream_csv(self):
+        response = self.client.get(f'{self.url}?stream=csv&fields=id,name,tags', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0], ['id', 'name', 'tags'])
+        self.assertEqual(len(rows), 101)
+        self.assertEqual(rows[1][2], '[]')
+
+    def test_stream_invalid_format(self):
+        response = self.client.get(f'{self.url}?stream=xml', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(MAX_PAGE_SIZE=20)
+    def test_stream_max_page_size(self):
+        response = self.client.get(f'{self.url}?stream=ndjson', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('stream', response.data)
+
 
 class APIOrderingTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
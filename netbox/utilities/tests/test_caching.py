@@ -0,0 +1,68 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from utilities.caching import VersionedCache
+
+
+class CountingCache(VersionedCache):
+    cache_key = 'test_versioned_cache'
+
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.loads
+
+
+class VersionedCacheTestCase(TestCase):
+
+    def setUp(self):
+        cache.delete(CountingCache.cache_key)
+        self.cache = CountingCache()
+
+    def test_get(self):
+        self.assertEqual(self.cache.get(), 1)
+        self.assertEqual(self.cache.get(), 1)
+
+        # A change of version (by another process) forces a reload once the version is next checked
+        cache.set(CountingCache.cache_key, 'changed')
+        self.assertEqual(self.cache.get(), 1)
+        later = time.monotonic() + CountingCache.version_check_interval
+        with patch('utilities.caching.time.monotonic', return_value=later):
+            self.assertEqual(self.cache.get(), 2)
+
+    def test_invalidate(self):
+        self.assertEqual(self.cache.get(), 1)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get(), 2)
+        self.assertEqual(self.cache.get(), 2)
+
+        # Other connections continue to use the shared snapshot until the invalidation has been committed
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.cache.get()))
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [1])
+
+    def test_invalidate_rolled_back(self):
+        self.assertEqual(self.cache.get(), 1)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get(), 2)
+
+        try:
+            with transaction.atomic():
+                self.cache.invalidate()
+                self.assertEqual(self.cache.get(), 3)
+                raise IntegrityError
+        except IntegrityError:
+            pass
+
+        # Data loaded within the rolled back savepoint is discarded
+        self.assertEqual(self.cache.get(), 4)
@@ -1,7 +1,10 @@
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from dcim.models import *
+from utilities.counters import batch_counter_updates, flush_counter_updates
 from utilities.testing.base import TestCase
 from utilities.testing.utils import create_test_device
 
@@ -102,3 +105,70 @@ class CountersTest(TestCase):
         self.client.post(reverse("dcim:inventoryitem_bulk_delete"), data)
         device1.refresh_from_db()
         self.assertEqual(device1.inventory_item_count, 0)
+
+    def test_batch_counter_updates(self):
+        """
+        Counter updates made within batch_counter_updates() should be applied once for each parent upon exit.
+        """
+        device1, device2 = Device.objects.all()
+
+        def count_device_updates(queries):
+            return len([q for q in queries if q['sql'].startswith('UPDATE "dcim_device"')])
+
+        # Without batching, each new interface updates its parent's counter individually
+        with CaptureQueriesContext(connection) as ctx:
+            for i in range(10):
+                Interface.objects.create(device=device1, name=f'Interface {i + 5}')
+        self.assertEqual(count_device_updates(ctx.captured_queries), 10)
+
+        # With batching, all counters are updated together upon exit
+        with CaptureQueriesContext(connection) as ctx:
+            with batch_counter_updates():
+                for i in range(10):
+                    Interface.objects.create(device=device2, name=f'Interface {i + 15}')
+                interface = Interface.objects.get(name='Interface 1')
+                interface.device = device2
+                interface.save()
+                Interface.objects.get(name='Interface 2').delete()
+                device2.refresh_from_db()
+                self.assertEqual(device2.interface_count, 2)
+        self.assertEqual(count_device_updates(ctx.captured_queries), 1)
+
+        device1.refresh_from_db()
+        device2.refresh_from_db()
+        self.assertEqual(device1.interface_count, 10)
+        self.assertEqual(device2.interface_count, 13)
+
+    def test_flush_counter_updates(self):
+        """
+        Counters queued within batch_counter_updates() should be recalculated by flush_counter_updates().
+        """
+        device1 = Device.objects.first()
+
+        with batch_counter_updates():
+            Interface.objects.create(device=device1, name='Interface 5')
+            device1.refresh_from_db()
+            self.assertEqual(device1.interface_count, 2)
+            flush_counter_updates()
+            device1.refresh_from_db()
+            self.assertEqual(device1.interface_count, 3)
+            Interface.objects.create(device=device1, name='Interface 6')
+
+        device1.refresh_from_db()
+        self.assertEqual(device1.interface_count, 4)
+
+    def test_batch_counter_updates_repeated_delete(self):
+        """
+        Deleting an object which has already been removed within batch_counter_updates() should not affect counters.
+        """
+        device1 = Device.objects.first()
+        inventory_item1 = InventoryItem.objects.create(device=device1, name='Inventory Item 1')
+        inventory_item2 = InventoryItem.objects.create(device=device1, name='Inventory Item 2', parent=inventory_item1)
+
+        with batch_counter_updates():
+            inventory_item1.delete()
+            inventory_item2.delete()
+
+        device1.refresh_from_db()
+        self.assertEqual(device1.inventory_item_count, 0)
+        self.assertEqual(device1.interface_count, 2)
@@ -0,0 +1,55 @@
+from django.test import TestCase
+
+from dcim.models import DeviceType, Manufacturer, Site
+from dcim.tables import SiteTable
+from utilities.export import get_excluded_columns, iter_buffered, iter_chunks, iter_csv, iter_table_rows, iter_yaml
+
+
+class ExportTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)
+        ])
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        DeviceType.objects.bulk_create([
+            DeviceType(manufacturer=manufacturer, model=f'Device Type {i}', slug=f'device-type-{i}')
+            for i in range(1, 4)
+        ])
+
+    def test_iter_buffered(self):
+        self.assertEqual(list(iter_buffered(['ab', 'cd', 'ef', 'g'], size=4)), ['abcd', 'efg'])
+        self.assertEqual(list(iter_buffered([], size=4)), [])
+
+    def test_iter_chunks(self):
+        chunks = list(iter_chunks(Site.objects.order_by('pk'), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            [site.name for chunk in chunks for site in chunk],
+            list(Site.objects.order_by('pk').values_list('name', flat=True))
+        )
+
+    def test_iter_csv(self):
+        self.assertEqual(
+            ''.join(iter_csv([['Name', 'Description'], ['Site 1', 'A, B']])),
+            'Name,Description\r\nSite 1,"A, B"\r\n'
+        )
+
+    def test_iter_table_rows(self):
+        table = SiteTable(Site.objects.order_by('name'))
+        columns = ['name', 'slug']
+        exclude_columns = get_excluded_columns(table, columns)
+
+        # Output must match that of django-tables2's as_values()
+        self.assertEqual(
+            list(iter_table_rows(table, exclude_columns)),
+            list(table.as_values(exclude_columns=exclude_columns))
+        )
+
+    def test_iter_yaml(self):
+        device_types = DeviceType.objects.order_by('pk')
+        self.assertEqual(
+            ''.join(iter_yaml(device_types)),
+            '---\n'.join(device_type.to_yaml() for device_type in device_types)
+        )
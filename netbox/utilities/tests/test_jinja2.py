@@ -0,0 +1,55 @@
+from django.test import TestCase, override_settings
+
+from core.models import DataSource
+
+from utilities.jinja2 import DataFileLoader, get_environment, get_template, render_jinja2
+
+
+class Jinja2TestCase(TestCase):
+
+    def test_render_jinja2(self):
+        self.assertEqual(render_jinja2('Hello {{ name }}', {'name': 'World'}), 'Hello World')
+        self.assertEqual(
+            render_jinja2('Hello <<< name >>>', {'name': 'World'}, {
+                'variable_start_string': '<<<',
+                'variable_end_string': '>>>',
+            }),
+            'Hello World'
+        )
+
+    def test_template_cache(self):
+        template = get_template('{{ foo }}')
+        self.assertIs(get_template('{{ foo }}'), template)
+        self.assertIsNot(get_template('{{ bar }}'), template)
+        self.assertIsNot(get_template('{{ foo }}', {'trim_blocks': True}), template)
+
+        # Changing the configured filters invalidates the compiled template
+        with override_settings(JINJA2_FILTERS={'double': lambda x: x * 2}):
+            self.assertIsNot(get_template('{{ foo }}'), template)
+            self.assertEqual(render_jinja2('{{ foo|double }}', {'foo': 2}), '4')
+
+    def test_environment_cache(self):
+        environment = get_environment({'trim_blocks': True})
+        self.assertIs(get_environment({'trim_blocks': True}), environment)
+        self.assertIsNot(get_environment(), environment)
+
+    def test_environment_templates(self):
+        data_source = DataSource.objects.create(name='Data Source 1', type='local', source_url='file:///tmp')
+        environment = get_environment(data_source=data_source, templates={'template.j2': 'foo'})
+        self.assertIs(get_environment(data_source=data_source, templates={'template.j2': 'foo'}), environment)
+
+        # Environments serving different template content are not shared
+        other_environment = get_environment(data_source=data_source, templates={'template.j2': 'bar'})
+        self.assertIsNot(other_environment, environment)
+        self.assertEqual(environment.get_template('template.j2').render(), 'foo')
+        self.assertEqual(other_environment.get_template('template.j2').render(), 'bar')
+
+    def test_data_file_loader_reload(self):
+        loader = DataFileLoader(data_source=None)
+        environment = get_environment().overlay(loader=loader)
+        loader.cache_templates({'template.j2': 'foo'})
+        self.assertEqual(environment.get_template('template.j2').render(), 'foo')
+
+        # Updating the template content replaces the compiled template
+        loader.cache_templates({'template.j2': 'bar'})
+        self.assertEqual(environment.get_template('template.j2').render(), 'bar')
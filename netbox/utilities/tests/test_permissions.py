@@ -0,0 +1,64 @@
+from django.test import SimpleTestCase
+
+from dcim.models import Site
+from users.constants import CONSTRAINT_TOKEN_USER
+from users.models import User
+from utilities.permissions import constraints_are_single_valued, evaluate_constraints
+
+
+def load_instance(model, **values):
+    """
+    Return an instance of the given model as if it had been loaded from the database with the given field values.
+    """
+    return model.from_db('default', list(values.keys()), list(values.values()))
+
+
+class ConstraintsTestCase(SimpleTestCase):
+
+    def test_constraints_are_single_valued(self):
+        self.assertTrue(constraints_are_single_valued(Site, [None]))
+        self.assertTrue(constraints_are_single_valued(Site, [{'status': 'active'}]))
+        self.assertTrue(constraints_are_single_valued(Site, [{'name__istartswith': 'Site'}]))
+        self.assertTrue(constraints_are_single_valued(Site, [{'region__parent__name': 'Region 1'}]))
+        self.assertFalse(constraints_are_single_valued(Site, [{'status': 'active'}, {'tags__slug': 'alpha'}]))
+        self.assertFalse(constraints_are_single_valued(Site, [{'devices__name': 'Device 1'}]))
+
+    def test_evaluate_constraints(self):
+        site = load_instance(Site, id=1, name='Site 1', slug='site-1', status='active', region_id=10)
+
+        # Null constraint
+        self.assertTrue(evaluate_constraints(site, [None]))
+
+        # Exact and "in" matches
+        self.assertTrue(evaluate_constraints(site, [{'status': 'active'}]))
+        self.assertTrue(evaluate_constraints(site, [{'name__exact': 'Site 1', 'region': 10}]))
+        self.assertTrue(evaluate_constraints(site, [{'region_id__in': [10, 20]}]))
+        self.assertTrue(evaluate_constraints(site, [{'status': 'planned'}, {'slug': 'site-1'}]))
+        self.assertFalse(evaluate_constraints(site, [{'status': 'planned'}]))
+        self.assertFalse(evaluate_constraints(site, [{'name': 'Site 1', 'region__in': [20, 30]}]))
+
+        # Constraints which cannot be evaluated in Python
+        self.assertIsNone(evaluate_constraints(site, [{'name__istartswith': 'site'}]))
+        self.assertIsNone(evaluate_constraints(site, [{'region__name': 'Region 1'}]))
+        self.assertIsNone(evaluate_constraints(site, [{'tags__slug': 'alpha'}]))
+        self.assertIsNone(evaluate_constraints(site, [{'status': 'planned'}, {'region__name': 'Region 1'}]))
+        self.assertTrue(evaluate_constraints(site, [{'region__name': 'Region 1'}, {'status': 'active'}]))
+
+        # Unsaved instance
+        self.assertIsNone(evaluate_constraints(Site(name='Site 2', status='active'), [{'status': 'active'}]))
+
+        # Instance not loaded from the database
+        self.assertIsNone(evaluate_constraints(Site(pk=1, status='active'), [{'status': 'active'}]))
+
+        # Constraints on fields with unsaved modifications are not evaluated
+        site.status = 'planned'
+        self.assertIsNone(evaluate_constraints(site, [{'status': 'planned'}]))
+        self.assertTrue(evaluate_constraints(site, [{'slug': 'site-1'}]))
+        site.status = 'active'
+        self.assertTrue(evaluate_constraints(site, [{'status': 'active'}]))
+
+    def test_evaluate_constraints_user_token(self):
+        user = User(pk=5, username='user1')
+        site = load_instance(Site, id=1, name='Site 1', tenant_id=5)
+        self.assertTrue(evaluate_constraints(site, [{'tenant': CONSTRAINT_TOKEN_USER}], {CONSTRAINT_TOKEN_USER: user}))
+        self.assertFalse(evaluate_constraints(site, [{'tenant': CONSTRAINT_TOKEN_USER}], {CONSTRAINT_TOKEN_USER: 6}))
@@ -0,0 +1,82 @@
+import json
+from decimal import Decimal
+
+from django.core import serializers
+from django.test import TestCase
+
+from core.models import ObjectType
+from dcim.models import Site
+from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField
+from ipam.models import ASN, RIR
+from tenancy.models import Tenant
+from utilities.serialization import serialize_object, serialize_objects
+from utilities.testing.utils import create_tags
+
+
+def serialize_object_legacy(obj):
+    """
+    Serialize an object using Django's built-in JSON serializer (the original implementation of serialize_object()).
+    """
+    data = json.loads(serializers.serialize('json', [obj]))[0]['fields']
+    data['custom_fields'] = data.pop('custom_field_data')
+    data['tags'] = sorted([tag.name for tag in obj.tags.all()])
+    return data
+
+
+class SerializationTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        custom_field = CustomField.objects.create(name='cf1', type=CustomFieldTypeChoices.TYPE_TEXT)
+        custom_field.object_types.set([ObjectType.objects.get_for_model(Site)])
+
+        tenant = Tenant.objects.create(name='Tenant 1', slug='tenant-1')
+        rir = RIR.objects.create(name='RIR 1', slug='rir-1')
+        asns = (
+            ASN.objects.create(asn=65001, rir=rir),
+            ASN.objects.create(asn=65002, rir=rir),
+        )
+        tags = create_tags('Alpha', 'Bravo', 'Charlie')
+
+        sites = (
+            Site(
+                name='Site 1',
+                slug='site-1',
+                tenant=tenant,
+                time_zone='America/New_York',
+                latitude=Decimal('40.712800'),
+                longitude=Decimal('-74.006000'),
+                custom_field_data={'cf1': 'foo'}
+            ),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3', description='Third site'),
+        )
+        for site in sites:
+            site.save()
+        sites[0].asns.set(asns)
+        sites[0].tags.set(tags[1:])
+        sites[2].tags.set(tags[:1])
+
+    def test_serialize_object(self):
+        for site in Site.objects.all():
+            self.assertEqual(serialize_object(site), serialize_object_legacy(site))
+
+    def test_serialize_object_exclude_extra(self):
+        site = Site.objects.get(slug='site-1')
+        data = serialize_object(site, resolve_tags=False, extra={'foo': 'bar'}, exclude=['last_updated'])
+
+        self.assertNotIn('tags', data)
+        self.assertNotIn('last_updated', data)
+        self.assertEqual(data['foo'], 'bar')
+        self.assertEqual(data['custom_fields'], {'cf1': 'foo'})
+        self.assertEqual(data['asns'], [asn.pk for asn in ASN.objects.all()])
+
+    def test_serialize_objects(self):
+        queryset = Site.objects.order_by('pk')
+        expected = [serialize_object_legacy(site) for site in queryset]
+
+        # Sites, ASNs, and tags should each be retrieved with a single query
+        with self.assertNumQueries(3):
+            data = serialize_objects(queryset)
+        self.assertEqual(data, expected)